@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from experiments.utils import save_run
+from plkg.protocol.reconciliation import create_bch_codec, load_bch_codec
+from plkg.simulation import CsiScenario
+from plkg.simulation.runner import run_csi_trial
+
+
+def _median_seconds(action: Callable[[], object], repeats: int) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations))
+
+
+def run(
+    block_lengths: list[int],
+    *,
+    repeats: int,
+    seed: int,
+) -> list[dict[str, float]]:
+    """Per-trial codec overhead before and after the process-wide registry.
+
+    Before the registry every trial built a fresh ``galois.BCH``; now it is a
+    dictionary lookup. ``trial_before_s`` adds the measured construction time
+    back to a trial that uses the registry. The first, JIT-compiling
+    construction of each code is reported separately as ``first_build_s``.
+    """
+    rng = np.random.default_rng(seed)
+    scenario = CsiScenario(noise_variance=0.05)
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for block_length in block_lengths:
+            start = time.perf_counter()
+            load_bch_codec(block_length, cache_dir=cache_dir).code.decode(
+                np.zeros(block_length, dtype=np.uint8)
+            )
+            first_build = time.perf_counter() - start
+
+            galois_build = _median_seconds(
+                lambda length=block_length: load_bch_codec(length),
+                repeats,
+            )
+            disk_tables = _median_seconds(
+                lambda length=block_length: load_bch_codec(
+                    length,
+                    cache_dir=cache_dir,
+                ),
+                repeats,
+            )
+            registry = _median_seconds(
+                lambda length=block_length: create_bch_codec(length),
+                repeats,
+            )
+            trial_after = _median_seconds(
+                lambda length=block_length: run_csi_trial(scenario, length, rng),
+                repeats,
+            )
+            trial_before = trial_after - registry + galois_build
+            rows.append(
+                {
+                    "block_length": block_length,
+                    "first_build_s": first_build,
+                    "galois_build_s": galois_build,
+                    "disk_tables_load_s": disk_tables,
+                    "registry_lookup_s": registry,
+                    "trial_before_s": trial_before,
+                    "trial_after_s": trial_after,
+                    "speedup": trial_before / trial_after,
+                }
+            )
+
+    save_run(
+        "bch_codec_benchmark",
+        {"block_lengths": block_lengths, "repeats": repeats},
+        rows,
+        seed,
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    for row in run([7, 15, 127, 255], repeats=args.repeats, seed=args.seed):
+        print(
+            f"BCH({row['block_length']}): "
+            f"{row['trial_before_s'] * 1e3:.2f} ms -> "
+            f"{row['trial_after_s'] * 1e3:.2f} ms per trial"
+        )
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import argparse
 
-from experiments.utils import save_run
+from experiments.utils import (
+    add_precision_arguments,
+    checkpoint_arguments,
+    precision_arguments,
+    precision_from_arguments,
+    save_run,
+    start_run,
+)
 from plkg.radio.profiles import get_profile
+from plkg.security import PrecisionTarget
 from plkg.simulation import CsiScenario, run_csi_monte_carlo
 
 
@@ -13,10 +21,27 @@ def run(
     total_observations: int,
     seed: int,
     profile_name: str = "nr_fr1_n78",
+    workers: int = 1,
+    precision: PrecisionTarget | None = None,
+    run_id: str | None = None,
+    extend_trials: int = 0,
 ) -> list[dict[str, float]]:
     profile = get_profile(profile_name)
     if profile.measurement != "csi":
         raise ValueError(f"profile {profile_name!r} is not a CSI profile")
+    parameters = {
+        "block_lengths": block_lengths,
+        "total_observations": total_observations,
+        "profile_name": profile_name,
+        "workers": workers,
+        "precision": precision,
+    }
+    run_id = start_run(
+        "bch_comparison",
+        parameters,
+        run_id,
+        extend_trials=extend_trials,
+    )
     rows = []
     scenario = CsiScenario(
         noise_variance=0.05,
@@ -30,27 +55,25 @@ def run(
         result = run_csi_monte_carlo(
             scenario,
             block_length=block_length,
-            trials=trials,
+            **checkpoint_arguments(
+                "bch_comparison",
+                run_id,
+                index,
+                trials,
+            ),
+            **precision_arguments(precision),
             seed=seed + index,
+            workers=workers,
         )
         rows.append(
             {
                 "block_length": block_length,
-                "processed_bits": block_length * trials,
+                "processed_bits": block_length * result.trials,
                 **result.as_dict(),
             }
         )
 
-    save_run(
-        "bch_comparison",
-        {
-            "block_lengths": block_lengths,
-            "total_observations": total_observations,
-            "profile_name": profile_name,
-        },
-        rows,
-        seed,
-    )
+    save_run("bch_comparison", parameters, rows, seed, run_id)
     return rows
 
 
@@ -59,10 +82,18 @@ if __name__ == "__main__":
     parser.add_argument("--total-observations", type=int, default=127_000)
     parser.add_argument("--seed", type=int, default=20260612)
     parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
+    add_precision_arguments(parser)
     args = parser.parse_args()
     run(
         [7, 15, 127, 255],
         total_observations=args.total_observations,
         seed=args.seed,
         profile_name=args.profile,
+        workers=args.workers,
+        precision=precision_from_arguments(args),
+        run_id=args.resume,
+        extend_trials=args.extend_trials,
     )
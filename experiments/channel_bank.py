@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+
+from plkg.radio.profiles import get_profile
+from plkg.simulation import CsiScenario, create_channel_bank
+
+
+def run(
+    output: str,
+    *,
+    trials: int,
+    samples: int,
+    seed: int,
+    profile_name: str = "nr_fr1_n78",
+    jakes_fading: bool = False,
+    dtype: str = "complex128",
+) -> None:
+    """Store ``trials`` rows of a profile's channels for later sweeps.
+
+    Only the channel law of the profile is used, so CSI and RSSI sweeps can
+    read the bank with ``--channel-bank``.
+    """
+    profile = get_profile(profile_name)
+    scenario = CsiScenario(
+        alice_bob_correlation=profile.alice_bob_correlation,
+        alice_eve_correlation=profile.alice_eve_correlation,
+        sample_interval_s=profile.sample_interval_s,
+        doppler_hz=profile.doppler_hz if jakes_fading else None,
+    )
+    bank = create_channel_bank(
+        output,
+        scenario,
+        trials,
+        samples,
+        seed=seed,
+        dtype=dtype,
+    )
+    print(f"channel bank {bank.path}: {trials} trials x {samples} samples")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", metavar="DIRECTORY")
+    parser.add_argument("--trials", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=4_096)
+    parser.add_argument("--seed", type=int, default=20260612)
+    parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--jakes-fading", action="store_true")
+    parser.add_argument(
+        "--dtype",
+        choices=["complex64", "complex128"],
+        default="complex128",
+    )
+    args = parser.parse_args()
+    run(
+        args.output,
+        trials=args.trials,
+        samples=args.samples,
+        seed=args.seed,
+        profile_name=args.profile,
+        jakes_fading=args.jakes_fading,
+        dtype=args.dtype,
+    )
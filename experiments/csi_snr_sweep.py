@@ -1,13 +1,29 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import replace
 
 import numpy as np
 
-from experiments.utils import save_run
+from experiments.utils import (
+    add_precision_arguments,
+    channel_bank_parameters,
+    check_common_random_numbers,
+    checkpoint_arguments,
+    precision_arguments,
+    precision_from_arguments,
+    save_run,
+    start_run,
+)
 from plkg.radio.channels.rayleigh import complex_noise_variance_from_snr
 from plkg.radio.profiles import get_profile
-from plkg.simulation import CsiScenario, run_csi_monte_carlo
+from plkg.security import PrecisionTarget
+from plkg.simulation import (
+    CsiScenario,
+    estimate_csi_frame_error_rate,
+    run_csi_monte_carlo,
+    run_csi_sweep,
+)
 
 
 def run(
@@ -19,6 +35,17 @@ def run(
     profile_name: str = "nr_fr1_n78",
     alice_bob_correlation: float | None = None,
     alice_eve_correlation: float | None = None,
+    workers: int = 1,
+    final_key_bits: int | None = None,
+    precision: PrecisionTarget | None = None,
+    rare_event_trials: int | None = None,
+    common_random_numbers: bool = False,
+    jakes_fading: bool = False,
+    channel_bank: str | None = None,
+    single_precision: bool = False,
+    quantization_bits: int = 1,
+    run_id: str | None = None,
+    extend_trials: int = 0,
 ) -> list[dict[str, float]]:
     profile = get_profile(profile_name)
     if profile.measurement != "csi":
@@ -33,36 +60,95 @@ def run(
         if alice_eve_correlation is None
         else alice_eve_correlation
     )
-    rows = []
-    for index, snr_db in enumerate(snr_values_db):
-        scenario = CsiScenario(
-            noise_variance=complex_noise_variance_from_snr(snr_db),
-            alice_bob_correlation=bob_correlation,
-            alice_eve_correlation=eve_correlation,
-            relative_estimation_error=profile.estimation_error,
-            sample_interval_s=profile.sample_interval_s,
+    parameters = {
+        "snr_values_db": snr_values_db,
+        "trials": trials,
+        "block_length": block_length,
+        "profile_name": profile_name,
+        "alice_bob_correlation": bob_correlation,
+        "alice_eve_correlation": eve_correlation,
+        "workers": workers,
+        "precision": precision,
+        "final_key_bits": final_key_bits,
+        "rare_event_trials": rare_event_trials,
+        "common_random_numbers": common_random_numbers,
+        "jakes_fading": jakes_fading,
+        "channel_bank": channel_bank,
+        "single_precision": single_precision,
+        "quantization_bits": quantization_bits,
+    }
+    if common_random_numbers:
+        check_common_random_numbers(precision, extend_trials)
+        if channel_bank is not None:
+            raise ValueError("a channel bank already shares the channels")
+    channel_parameters = channel_bank_parameters(channel_bank)
+    run_id = start_run(
+        "csi_snr_sweep",
+        parameters,
+        run_id,
+        extend_trials=extend_trials,
+    )
+    scenarios = [
+        replace(
+            CsiScenario(
+                noise_variance=complex_noise_variance_from_snr(snr_db),
+                alice_bob_correlation=bob_correlation,
+                alice_eve_correlation=eve_correlation,
+                relative_estimation_error=profile.estimation_error,
+                sample_interval_s=profile.sample_interval_s,
+                doppler_hz=profile.doppler_hz if jakes_fading else None,
+                numeric_precision="single" if single_precision else "double",
+                quantization_bits=quantization_bits,
+            ),
+            **channel_parameters,
         )
-        result = run_csi_monte_carlo(
-            scenario,
+        for snr_db in snr_values_db
+    ]
+    if common_random_numbers:
+        results = run_csi_sweep(
+            scenarios,
             block_length=block_length,
             trials=trials,
-            seed=seed + index,
+            seed=seed,
+            final_key_bits=final_key_bits,
         )
-        rows.append({"snr_db": snr_db, **result.as_dict()})
+    else:
+        results = [
+            run_csi_monte_carlo(
+                scenario,
+                block_length=block_length,
+                **checkpoint_arguments(
+                    "csi_snr_sweep",
+                    run_id,
+                    index,
+                    trials,
+                ),
+                **precision_arguments(precision),
+                seed=seed + index,
+                workers=workers,
+                final_key_bits=final_key_bits,
+                channel_bank=channel_bank,
+            )
+            for index, scenario in enumerate(scenarios)
+        ]
+    rows = []
+    for index, (snr_db, scenario, result) in enumerate(
+        zip(snr_values_db, scenarios, results, strict=True)
+    ):
+        row = {"snr_db": snr_db, **result.as_dict()}
+        if rare_event_trials is not None:
+            estimate = estimate_csi_frame_error_rate(
+                scenario,
+                block_length=block_length,
+                trials=rare_event_trials,
+                seed=seed + index,
+            )
+            row["conditional_frame_error_rate"] = estimate.frame_error_rate
+            row["conditional_standard_error"] = estimate.standard_error
+            row["conditional_variance_reduction"] = estimate.variance_reduction
+        rows.append(row)
 
-    save_run(
-        "csi_snr_sweep",
-        {
-            "snr_values_db": snr_values_db,
-            "trials": trials,
-            "block_length": block_length,
-            "profile_name": profile_name,
-            "alice_bob_correlation": bob_correlation,
-            "alice_eve_correlation": eve_correlation,
-        },
-        rows,
-        seed,
-    )
+    save_run("csi_snr_sweep", parameters, rows, seed, run_id)
     return rows
 
 
@@ -72,6 +158,17 @@ if __name__ == "__main__":
     parser.add_argument("--block-length", type=int, default=127)
     parser.add_argument("--seed", type=int, default=20260612)
     parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
+    add_precision_arguments(parser)
+    parser.add_argument("--final-key-bits", type=int)
+    parser.add_argument("--rare-event-trials", type=int)
+    parser.add_argument("--common-random-numbers", action="store_true")
+    parser.add_argument("--jakes-fading", action="store_true")
+    parser.add_argument("--channel-bank", metavar="DIRECTORY")
+    parser.add_argument("--single-precision", action="store_true")
+    parser.add_argument("--quantization-bits", type=int, default=1)
     args = parser.parse_args()
     run(
         np.linspace(-10, 30, 17).tolist(),
@@ -79,4 +176,15 @@ if __name__ == "__main__":
         block_length=args.block_length,
         seed=args.seed,
         profile_name=args.profile,
+        workers=args.workers,
+        precision=precision_from_arguments(args),
+        run_id=args.resume,
+        extend_trials=args.extend_trials,
+        final_key_bits=args.final_key_bits,
+        rare_event_trials=args.rare_event_trials,
+        common_random_numbers=args.common_random_numbers,
+        jakes_fading=args.jakes_fading,
+        channel_bank=args.channel_bank,
+        single_precision=args.single_precision,
+        quantization_bits=args.quantization_bits,
     )
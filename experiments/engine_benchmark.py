@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from experiments.utils import save_run
+from plkg.radio.channels.rayleigh import complex_noise_variance_from_snr
+from plkg.radio.profiles import get_profile
+from plkg.simulation import profile_scenario, run_csi_monte_carlo
+
+
+def _median_seconds(action: Callable[[], object], repeats: int) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations))
+
+
+def run(
+    snr_values_db: list[float],
+    *,
+    trials: int,
+    block_length: int,
+    repeats: int,
+    seed: int,
+    profile_name: str = "nr_fr1_n78",
+) -> list[dict[str, float]]:
+    """Wall-clock of one ``csi_snr_sweep`` point with each Monte Carlo engine.
+
+    Every point runs ``trials`` trials of the profile's i.i.d. scenario with
+    ``engine="per_trial"`` and with the default batched engine on one
+    process. A short warm-up run first builds the BCH codec, so neither
+    engine pays for its construction.
+    """
+    profile = get_profile(profile_name)
+    rows = []
+    for index, snr_db in enumerate(snr_values_db):
+        scenario = profile_scenario(
+            profile,
+            noise_variance=complex_noise_variance_from_snr(snr_db),
+            jakes_fading=False,
+        )
+        run_csi_monte_carlo(scenario, block_length=block_length, trials=2)
+        seconds = {
+            engine: _median_seconds(
+                partial(
+                    run_csi_monte_carlo,
+                    scenario,
+                    block_length=block_length,
+                    trials=trials,
+                    seed=seed + index,
+                    engine=engine,
+                ),
+                repeats,
+            )
+            for engine in ("per_trial", "batched")
+        }
+        rows.append(
+            {
+                "snr_db": snr_db,
+                "trials": trials,
+                "per_trial_s": seconds["per_trial"],
+                "batched_s": seconds["batched"],
+                "speedup": seconds["per_trial"] / seconds["batched"],
+            }
+        )
+
+    save_run(
+        "engine_benchmark",
+        {
+            "snr_values_db": snr_values_db,
+            "trials": trials,
+            "block_length": block_length,
+            "repeats": repeats,
+            "profile_name": profile_name,
+        },
+        rows,
+        seed,
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--snr-db", type=float, nargs="+", default=[-5, 10, 25])
+    parser.add_argument("--trials", type=int, default=1_000)
+    parser.add_argument("--block-length", type=int, default=127)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    for row in run(
+        args.snr_db,
+        trials=args.trials,
+        block_length=args.block_length,
+        repeats=args.repeats,
+        seed=args.seed,
+        profile_name=args.profile,
+    ):
+        print(
+            f"{row['snr_db']:g} dB: {row['per_trial_s']:.2f} s -> "
+            f"{row['batched_s']:.2f} s ({row['speedup']:.1f}x)"
+        )
@@ -2,9 +2,18 @@ from __future__ import annotations
 
 import argparse
 
-from experiments.utils import save_run
+from experiments.utils import (
+    add_precision_arguments,
+    check_common_random_numbers,
+    checkpoint_arguments,
+    precision_arguments,
+    precision_from_arguments,
+    save_run,
+    start_run,
+)
 from plkg.radio.profiles import get_profile
-from plkg.simulation import CsiScenario, run_csi_monte_carlo
+from plkg.security import PrecisionTarget
+from plkg.simulation import CsiScenario, run_csi_monte_carlo, run_csi_sweep
 
 
 def run(
@@ -14,38 +23,76 @@ def run(
     block_length: int,
     seed: int,
     profile_name: str = "nr_fr1_n78",
+    workers: int = 1,
+    final_key_bits: int | None = None,
+    precision: PrecisionTarget | None = None,
+    common_random_numbers: bool = False,
+    run_id: str | None = None,
+    extend_trials: int = 0,
 ) -> list[dict[str, float]]:
     profile = get_profile(profile_name)
     if profile.measurement != "csi":
         raise ValueError(f"profile {profile_name!r} is not a CSI profile")
-    rows = []
-    for index, correlation in enumerate(correlations):
-        scenario = CsiScenario(
+    parameters = {
+        "correlations": correlations,
+        "trials": trials,
+        "block_length": block_length,
+        "profile_name": profile_name,
+        "workers": workers,
+        "precision": precision,
+        "final_key_bits": final_key_bits,
+        "common_random_numbers": common_random_numbers,
+    }
+    if common_random_numbers:
+        check_common_random_numbers(precision, extend_trials)
+    run_id = start_run(
+        "eve_correlation_sweep",
+        parameters,
+        run_id,
+        extend_trials=extend_trials,
+    )
+    scenarios = [
+        CsiScenario(
             noise_variance=0.02,
             alice_bob_correlation=profile.alice_bob_correlation,
             alice_eve_correlation=correlation,
             relative_estimation_error=profile.estimation_error,
             sample_interval_s=profile.sample_interval_s,
         )
-        result = run_csi_monte_carlo(
-            scenario,
+        for correlation in correlations
+    ]
+    if common_random_numbers:
+        results = run_csi_sweep(
+            scenarios,
             block_length=block_length,
             trials=trials,
-            seed=seed + index,
+            seed=seed,
+            final_key_bits=final_key_bits,
         )
-        rows.append({"alice_eve_channel_correlation": correlation, **result.as_dict()})
+    else:
+        results = [
+            run_csi_monte_carlo(
+                scenario,
+                block_length=block_length,
+                **checkpoint_arguments(
+                    "eve_correlation_sweep",
+                    run_id,
+                    index,
+                    trials,
+                ),
+                **precision_arguments(precision),
+                seed=seed + index,
+                workers=workers,
+                final_key_bits=final_key_bits,
+            )
+            for index, scenario in enumerate(scenarios)
+        ]
+    rows = [
+        {"alice_eve_channel_correlation": correlation, **result.as_dict()}
+        for correlation, result in zip(correlations, results, strict=True)
+    ]
 
-    save_run(
-        "eve_correlation_sweep",
-        {
-            "correlations": correlations,
-            "trials": trials,
-            "block_length": block_length,
-            "profile_name": profile_name,
-        },
-        rows,
-        seed,
-    )
+    save_run("eve_correlation_sweep", parameters, rows, seed, run_id)
     return rows
 
 
@@ -55,6 +102,12 @@ if __name__ == "__main__":
     parser.add_argument("--block-length", type=int, default=127)
     parser.add_argument("--seed", type=int, default=20260612)
     parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
+    add_precision_arguments(parser)
+    parser.add_argument("--final-key-bits", type=int)
+    parser.add_argument("--common-random-numbers", action="store_true")
     args = parser.parse_args()
     run(
         [-1.0, -0.9, -0.5, 0.0, 0.5, 0.9, 1.0],
@@ -62,4 +115,10 @@ if __name__ == "__main__":
         block_length=args.block_length,
         seed=args.seed,
         profile_name=args.profile,
+        workers=args.workers,
+        precision=precision_from_arguments(args),
+        run_id=args.resume,
+        extend_trials=args.extend_trials,
+        final_key_bits=args.final_key_bits,
+        common_random_numbers=args.common_random_numbers,
     )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from experiments.utils import save_run
+from plkg.radio.channels import (
+    jakes_correlation,
+    sample_jakes_channel,
+    sample_rayleigh_channel,
+)
+from plkg.radio.profiles import get_profile
+
+SIGMA = 1 / np.sqrt(2)
+CORRELATION_LAGS = 256
+
+
+def _median_seconds(action: Callable[[], object], repeats: int) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations))
+
+
+def _correlation_error(
+    taps: np.ndarray,
+    doppler_hz: float,
+    sample_interval_s: float,
+) -> float:
+    """Largest gap between the empirical and Jakes autocorrelations."""
+    lags = np.arange(1, min(CORRELATION_LAGS, taps.shape[-1]))
+    empirical = np.array(
+        [np.mean(taps[..., lag:] * np.conj(taps[..., :-lag])).real for lag in lags]
+    ) / (2 * SIGMA**2)
+    expected = np.array(
+        [jakes_correlation(lag * sample_interval_s, doppler_hz) for lag in lags]
+    )
+    return float(np.max(np.abs(empirical - expected)))
+
+
+def run(
+    shapes: list[tuple[int, int]],
+    *,
+    profile_name: str,
+    repeats: int,
+    seed: int,
+) -> list[dict[str, float]]:
+    """Jakes generation time versus i.i.d. Rayleigh taps.
+
+    Each shape is ``(sequences, samples)``; the Doppler frequency and sample
+    interval come from ``profile_name``. The autocorrelation error is the
+    largest deviation from ``jakes_correlation`` over the first lags of the
+    last generated batch.
+    """
+    profile = get_profile(profile_name)
+    doppler_hz = profile.doppler_hz
+    interval = profile.sample_interval_s
+    rng = np.random.default_rng(seed)
+    rows = []
+    for sequences, samples in shapes:
+        shape = (sequences, samples)
+        jakes_seconds = _median_seconds(
+            partial(sample_jakes_channel, SIGMA, doppler_hz, interval, shape, rng),
+            repeats,
+        )
+        iid_seconds = _median_seconds(
+            partial(sample_rayleigh_channel, SIGMA, shape, rng),
+            repeats,
+        )
+        taps = sample_jakes_channel(SIGMA, doppler_hz, interval, shape, rng)
+        rows.append(
+            {
+                "sequences": sequences,
+                "samples": samples,
+                "jakes_s": jakes_seconds,
+                "iid_s": iid_seconds,
+                "jakes_samples_per_s": sequences * samples / jakes_seconds,
+                "autocorrelation_error": _correlation_error(
+                    taps,
+                    doppler_hz,
+                    interval,
+                ),
+            }
+        )
+
+    save_run(
+        "fading_benchmark",
+        {
+            "shapes": shapes,
+            "profile_name": profile_name,
+            "doppler_hz": doppler_hz,
+            "repeats": repeats,
+        },
+        rows,
+        seed,
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    shapes = [
+        (1, 1_000),
+        (1, 100_000),
+        (1, 1_000_000),
+        (1, 4_000_000),
+        (1_000, 1_000),
+        (100, 100_000),
+    ]
+    for row in run(
+        shapes,
+        profile_name=args.profile,
+        repeats=args.repeats,
+        seed=args.seed,
+    ):
+        print(
+            f"{row['sequences']:>5} x {row['samples']:>9}: "
+            f"Jakes {row['jakes_s'] * 1e3:.1f} ms, "
+            f"i.i.d. {row['iid_s'] * 1e3:.1f} ms, "
+            f"autocorrelation error {row['autocorrelation_error']:.3f}"
+        )
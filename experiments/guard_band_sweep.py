@@ -2,9 +2,18 @@ from __future__ import annotations
 
 import argparse
 
-from experiments.utils import save_run
+from experiments.utils import (
+    add_precision_arguments,
+    check_common_random_numbers,
+    checkpoint_arguments,
+    precision_arguments,
+    precision_from_arguments,
+    save_run,
+    start_run,
+)
 from plkg.radio.profiles import get_profile
-from plkg.simulation import CsiScenario, run_csi_monte_carlo
+from plkg.security import PrecisionTarget
+from plkg.simulation import CsiScenario, run_csi_monte_carlo, run_csi_sweep
 
 
 def run(
@@ -14,13 +23,38 @@ def run(
     block_length: int,
     seed: int,
     profile_name: str = "nr_fr1_n78",
+    workers: int = 1,
+    multi_block: bool = False,
+    retention_confidence: float | None = None,
+    precision: PrecisionTarget | None = None,
+    common_random_numbers: bool = False,
+    run_id: str | None = None,
+    extend_trials: int = 0,
 ) -> list[dict[str, float]]:
     profile = get_profile(profile_name)
     if profile.measurement != "csi":
         raise ValueError(f"profile {profile_name!r} is not a CSI profile")
-    rows = []
-    for index, guard_band in enumerate(guard_bands):
-        scenario = CsiScenario(
+    parameters = {
+        "guard_bands": guard_bands,
+        "trials": trials,
+        "block_length": block_length,
+        "profile_name": profile_name,
+        "workers": workers,
+        "precision": precision,
+        "multi_block": multi_block,
+        "retention_confidence": retention_confidence,
+        "common_random_numbers": common_random_numbers,
+    }
+    if common_random_numbers:
+        check_common_random_numbers(precision, extend_trials)
+    run_id = start_run(
+        "guard_band_sweep",
+        parameters,
+        run_id,
+        extend_trials=extend_trials,
+    )
+    scenarios = [
+        CsiScenario(
             noise_variance=0.03,
             alice_bob_correlation=profile.alice_bob_correlation,
             alice_eve_correlation=profile.alice_eve_correlation,
@@ -28,25 +62,42 @@ def run(
             guard_band_sigma=guard_band,
             sample_interval_s=profile.sample_interval_s,
         )
-        result = run_csi_monte_carlo(
-            scenario,
+        for guard_band in guard_bands
+    ]
+    if common_random_numbers:
+        results = run_csi_sweep(
+            scenarios,
             block_length=block_length,
             trials=trials,
-            seed=seed + index,
+            seed=seed,
+            multi_block=multi_block,
+            retention_confidence=retention_confidence,
         )
-        rows.append({"guard_band_sigma": guard_band, **result.as_dict()})
+    else:
+        results = [
+            run_csi_monte_carlo(
+                scenario,
+                block_length=block_length,
+                **checkpoint_arguments(
+                    "guard_band_sweep",
+                    run_id,
+                    index,
+                    trials,
+                ),
+                **precision_arguments(precision),
+                seed=seed + index,
+                workers=workers,
+                multi_block=multi_block,
+                retention_confidence=retention_confidence,
+            )
+            for index, scenario in enumerate(scenarios)
+        ]
+    rows = [
+        {"guard_band_sigma": guard_band, **result.as_dict()}
+        for guard_band, result in zip(guard_bands, results, strict=True)
+    ]
 
-    save_run(
-        "guard_band_sweep",
-        {
-            "guard_bands": guard_bands,
-            "trials": trials,
-            "block_length": block_length,
-            "profile_name": profile_name,
-        },
-        rows,
-        seed,
-    )
+    save_run("guard_band_sweep", parameters, rows, seed, run_id)
     return rows
 
 
@@ -56,6 +107,13 @@ if __name__ == "__main__":
     parser.add_argument("--block-length", type=int, default=127)
     parser.add_argument("--seed", type=int, default=20260612)
     parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
+    add_precision_arguments(parser)
+    parser.add_argument("--multi-block", action="store_true")
+    parser.add_argument("--retention-confidence", type=float)
+    parser.add_argument("--common-random-numbers", action="store_true")
     args = parser.parse_args()
     run(
         [0.0, 0.1, 0.3, 0.5, 0.7, 1.0],
@@ -63,4 +121,11 @@ if __name__ == "__main__":
         block_length=args.block_length,
         seed=args.seed,
         profile_name=args.profile,
+        workers=args.workers,
+        precision=precision_from_arguments(args),
+        run_id=args.resume,
+        extend_trials=args.extend_trials,
+        multi_block=args.multi_block,
+        retention_confidence=args.retention_confidence,
+        common_random_numbers=args.common_random_numbers,
     )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import math
+from dataclasses import replace
+
+from experiments.utils import save_run
+from plkg.radio.measurements.decimation import CoherenceDecimator
+from plkg.radio.profiles import get_profile, list_profiles
+from plkg.simulation import profile_scenario, simulate_key_latency
+
+
+def run(
+    profile_names: list[str],
+    *,
+    sessions: int,
+    block_length: int,
+    seed: int,
+    key_bits: int = 128,
+    keys_per_session: int = 4,
+    coherence_fraction: float = 0.25,
+    noise_variance: float = 0.01,
+    guard_band_sigma: float = 1.0,
+    round_trip_s: float = 0.0,
+    max_windows_per_key: int = 64,
+) -> list[dict[str, float | str]]:
+    """Time to the first key and sustained key rate of every profile.
+
+    Moving profiles are decimated to ``coherence_fraction`` of their
+    coherence time, near where ``key_rate_profiles`` finds the secure rate
+    peaks; profiles at rest keep every sample.
+    """
+    if coherence_fraction <= 0:
+        raise ValueError("coherence_fraction must be positive")
+    parameters = {
+        "profile_names": profile_names,
+        "sessions": sessions,
+        "block_length": block_length,
+        "key_bits": key_bits,
+        "keys_per_session": keys_per_session,
+        "coherence_fraction": coherence_fraction,
+        "noise_variance": noise_variance,
+        "guard_band_sigma": guard_band_sigma,
+        "round_trip_s": round_trip_s,
+        "max_windows_per_key": max_windows_per_key,
+    }
+    rows: list[dict[str, float | str]] = []
+    for index, name in enumerate(profile_names):
+        profile = get_profile(name)
+        stride = 1
+        if math.isfinite(profile.coherence_time_s):
+            stride = CoherenceDecimator.from_coherence_time(
+                profile.sample_interval_s,
+                coherence_fraction * profile.coherence_time_s,
+            ).stride
+        scenario = replace(
+            profile_scenario(profile, noise_variance=noise_variance),
+            guard_band_sigma=guard_band_sigma,
+            decimation_stride=stride,
+        )
+        result = simulate_key_latency(
+            scenario,
+            block_length=block_length,
+            sessions=sessions,
+            key_bits=key_bits,
+            keys_per_session=keys_per_session,
+            round_trip_s=round_trip_s,
+            max_windows_per_key=max_windows_per_key,
+            seed=seed + index,
+        )
+        rows.append(
+            {
+                "profile_name": name,
+                "sample_interval_s": profile.sample_interval_s,
+                "decimation_stride": stride,
+                **result.as_dict(),
+            }
+        )
+
+    save_run("key_latency_profiles", parameters, rows, seed)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", nargs="+", default=list(list_profiles()))
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--block-length", type=int, default=127)
+    parser.add_argument("--key-bits", type=int, default=128)
+    parser.add_argument("--keys-per-session", type=int, default=4)
+    parser.add_argument("--coherence-fraction", type=float, default=0.25)
+    parser.add_argument("--noise-variance", type=float, default=0.01)
+    parser.add_argument("--guard-band-sigma", type=float, default=1.0)
+    parser.add_argument("--round-trip-s", type=float, default=0.0)
+    parser.add_argument("--max-windows-per-key", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    for row in run(
+        args.profiles,
+        sessions=args.sessions,
+        block_length=args.block_length,
+        seed=args.seed,
+        key_bits=args.key_bits,
+        keys_per_session=args.keys_per_session,
+        coherence_fraction=args.coherence_fraction,
+        noise_variance=args.noise_variance,
+        guard_band_sigma=args.guard_band_sigma,
+        round_trip_s=args.round_trip_s,
+        max_windows_per_key=args.max_windows_per_key,
+    ):
+        print(
+            f"{row['profile_name']}: first key p50/p95/p99 "
+            f"{row['time_to_first_key_p50_s']:.3g}/"
+            f"{row['time_to_first_key_p95_s']:.3g}/"
+            f"{row['time_to_first_key_p99_s']:.3g} s, "
+            f"sustained p50 {row['sustained_key_bits_per_second_p50']:.3g} bits/s"
+        )
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import replace
 
-from experiments.utils import save_run
+from experiments.utils import (
+    add_precision_arguments,
+    channel_bank_parameters,
+    checkpoint_arguments,
+    precision_arguments,
+    precision_from_arguments,
+    save_run,
+    start_run,
+)
 from plkg.radio.profiles import get_profile
+from plkg.security import PrecisionTarget
 from plkg.simulation import RssiScenario, run_rssi_monte_carlo
 
 
@@ -14,39 +24,67 @@ def run(
     block_length: int,
     seed: int,
     profile_name: str = "iot_static_sensor",
+    workers: int = 1,
+    precision: PrecisionTarget | None = None,
+    jakes_fading: bool = False,
+    channel_bank: str | None = None,
+    single_precision: bool = False,
+    run_id: str | None = None,
+    extend_trials: int = 0,
 ) -> list[dict[str, float]]:
     profile = get_profile(profile_name)
     if profile.measurement != "rssi":
         raise ValueError(f"profile {profile_name!r} is not an RSSI profile")
+    parameters = {
+        "noise_values_db": noise_values_db,
+        "trials": trials,
+        "block_length": block_length,
+        "profile_name": profile_name,
+        "workers": workers,
+        "precision": precision,
+        "jakes_fading": jakes_fading,
+        "channel_bank": channel_bank,
+        "single_precision": single_precision,
+    }
+    run_id = start_run(
+        "rssi_noise_sweep",
+        parameters,
+        run_id,
+        extend_trials=extend_trials,
+    )
+    channel_parameters = channel_bank_parameters(channel_bank)
     rows = []
     for index, noise_std_db in enumerate(noise_values_db):
-        scenario = RssiScenario(
-            reference_power_dbm=profile.rssi_reference_power_dbm,
-            measurement_noise_std_db=noise_std_db,
-            resolution_db=profile.rssi_resolution_db,
-            alice_bob_correlation=profile.alice_bob_correlation,
-            alice_eve_correlation=profile.alice_eve_correlation,
-            sample_interval_s=profile.sample_interval_s,
+        scenario = replace(
+            RssiScenario(
+                reference_power_dbm=profile.rssi_reference_power_dbm,
+                measurement_noise_std_db=noise_std_db,
+                resolution_db=profile.rssi_resolution_db,
+                alice_bob_correlation=profile.alice_bob_correlation,
+                alice_eve_correlation=profile.alice_eve_correlation,
+                sample_interval_s=profile.sample_interval_s,
+                doppler_hz=profile.doppler_hz if jakes_fading else None,
+                numeric_precision="single" if single_precision else "double",
+            ),
+            **channel_parameters,
         )
         result = run_rssi_monte_carlo(
             scenario,
             block_length=block_length,
-            trials=trials,
+            **checkpoint_arguments(
+                "rssi_noise_sweep",
+                run_id,
+                index,
+                trials,
+            ),
+            **precision_arguments(precision),
             seed=seed + index,
+            workers=workers,
+            channel_bank=channel_bank,
         )
         rows.append({"measurement_noise_std_db": noise_std_db, **result.as_dict()})
 
-    save_run(
-        "rssi_noise_sweep",
-        {
-            "noise_values_db": noise_values_db,
-            "trials": trials,
-            "block_length": block_length,
-            "profile_name": profile_name,
-        },
-        rows,
-        seed,
-    )
+    save_run("rssi_noise_sweep", parameters, rows, seed, run_id)
     return rows
 
 
@@ -56,6 +94,13 @@ if __name__ == "__main__":
     parser.add_argument("--block-length", type=int, default=127)
     parser.add_argument("--seed", type=int, default=20260612)
     parser.add_argument("--profile", default="iot_static_sensor")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
+    add_precision_arguments(parser)
+    parser.add_argument("--jakes-fading", action="store_true")
+    parser.add_argument("--channel-bank", metavar="DIRECTORY")
+    parser.add_argument("--single-precision", action="store_true")
     args = parser.parse_args()
     run(
         [0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0],
@@ -63,4 +108,11 @@ if __name__ == "__main__":
         block_length=args.block_length,
         seed=args.seed,
         profile_name=args.profile,
+        workers=args.workers,
+        precision=precision_from_arguments(args),
+        jakes_fading=args.jakes_fading,
+        channel_bank=args.channel_bank,
+        single_precision=args.single_precision,
+        run_id=args.resume,
+        extend_trials=args.extend_trials,
     )
@@ -7,9 +7,40 @@ from experiments.csi_snr_sweep import run as run_csi_snr
 from experiments.eve_correlation_sweep import run as run_eve
 from experiments.guard_band_sweep import run as run_guard_band
 from experiments.rssi_noise_sweep import run as run_rssi_noise
+from experiments.utils import new_run_id
+from plkg.security import PrecisionTarget
 
+FULL_PRECISION = PrecisionTarget(
+    relative_half_width=0.2,
+    absolute_half_width=0.01,
+    min_trials=200,
+)
 
-def run_all(*, quick: bool, seed: int) -> None:
+
+def run_all(
+    *,
+    quick: bool,
+    seed: int,
+    workers: int = 1,
+    run_id: str | None = None,
+    extend_trials: int = 0,
+) -> None:
+    """Run every experiment under one ``run_id``.
+
+    Passing the ``run_id`` of an interrupted run resumes every experiment
+    from its checkpoints; ``extend_trials`` adds trials to every point. Full
+    runs are sequential: each point stops once ``FULL_PRECISION`` is met,
+    with the fixed trial counts as budgets.
+    """
+    if extend_trials and run_id is None:
+        raise ValueError("extend_trials needs the run_id of an existing run")
+    run_id = run_id or new_run_id()
+    print(f"run_id {run_id}")
+    shared = {
+        "precision": None if quick else FULL_PRECISION,
+        "run_id": run_id,
+        "extend_trials": extend_trials,
+    }
     trials = 20 if quick else 1_000
     total_observations = 1_000 if quick else 127_000
     failures: list[str] = []
@@ -21,6 +52,9 @@ def run_all(*, quick: bool, seed: int) -> None:
                 trials=trials,
                 block_length=127,
                 seed=seed,
+                workers=workers,
+                **shared,
+                final_key_bits=64,
             ),
         ),
         (
@@ -30,6 +64,8 @@ def run_all(*, quick: bool, seed: int) -> None:
                 trials=trials,
                 block_length=127,
                 seed=seed + 1_000,
+                workers=workers,
+                **shared,
             ),
         ),
         (
@@ -39,6 +75,9 @@ def run_all(*, quick: bool, seed: int) -> None:
                 trials=trials,
                 block_length=127,
                 seed=seed + 2_000,
+                workers=workers,
+                **shared,
+                final_key_bits=64,
             ),
         ),
         (
@@ -48,6 +87,8 @@ def run_all(*, quick: bool, seed: int) -> None:
                 trials=trials,
                 block_length=127,
                 seed=seed + 3_000,
+                workers=workers,
+                **shared,
             ),
         ),
         (
@@ -56,14 +97,16 @@ def run_all(*, quick: bool, seed: int) -> None:
                 [7, 15, 127] if quick else [7, 15, 127, 255],
                 total_observations=total_observations,
                 seed=seed + 4_000,
+                workers=workers,
+                **shared,
             ),
         ),
     ]
 
     for name, job in jobs:
         try:
-            job()
-            print(f"[OK] {name}")
+            rows = job()
+            print(f"[OK] {name}: {sum(row['trials'] for row in rows)} trials")
         except Exception as error:
             failures.append(f"{name}: {error}")
             print(f"[FAIL] {name}: {error}")
@@ -76,5 +119,14 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--full", action="store_true")
     parser.add_argument("--seed", type=int, default=20260612)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--resume", metavar="RUN_ID")
+    parser.add_argument("--extend-trials", type=int, default=0)
     arguments = parser.parse_args()
-    run_all(quick=not arguments.full, seed=arguments.seed)
+    run_all(
+        quick=not arguments.full,
+        seed=arguments.seed,
+        workers=arguments.workers,
+        run_id=arguments.resume,
+        extend_trials=arguments.extend_trials,
+    )
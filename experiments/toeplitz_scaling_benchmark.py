@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from experiments.utils import save_run
+from plkg.protocol.privacy_amplification import ToeplitzHashAmplifier
+
+DENSE_MAX_ENTRIES = 1 << 28
+
+
+def _median_seconds(action: Callable[[], object], repeats: int) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations))
+
+
+def run(
+    input_lengths: list[int],
+    *,
+    repeats: int,
+    seed: int,
+) -> list[dict[str, float]]:
+    """Toeplitz hashing time of the dense and FFT paths versus key length.
+
+    Keys are compressed to half their length. The dense path is skipped
+    (``nan``) once its packed matrix would exceed ``DENSE_MAX_ENTRIES`` bits.
+    """
+    rng = np.random.default_rng(seed)
+    dense = ToeplitzHashAmplifier(dense_max_entries=DENSE_MAX_ENTRIES)
+    convolution = ToeplitzHashAmplifier(dense_max_entries=0)
+    rows = []
+    for input_bits in input_lengths:
+        output_bits = input_bits // 2
+        source = rng.integers(0, 2, input_bits, dtype=np.uint8)
+        public_seed = dense.generate_seed(input_bits, output_bits, rng)
+        fft_seconds = _median_seconds(
+            partial(convolution.extract, source, output_bits, public_seed),
+            repeats,
+        )
+        dense_seconds = float("nan")
+        if input_bits * output_bits <= DENSE_MAX_ENTRIES:
+            dense_seconds = _median_seconds(
+                partial(dense.extract, source, output_bits, public_seed),
+                repeats,
+            )
+        rows.append(
+            {
+                "input_bits": input_bits,
+                "output_bits": output_bits,
+                "dense_s": dense_seconds,
+                "fft_s": fft_seconds,
+                "speedup": dense_seconds / fft_seconds,
+            }
+        )
+
+    save_run(
+        "toeplitz_scaling_benchmark",
+        {"input_lengths": input_lengths, "repeats": repeats},
+        rows,
+        seed,
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    lengths = [127, 1_000, 10_000, 100_000, 1_000_000]
+    for row in run(lengths, repeats=args.repeats, seed=args.seed):
+        print(
+            f"{row['input_bits']:>9} bits: dense {row['dense_s'] * 1e3:.2f} ms, "
+            f"FFT {row['fft_s'] * 1e3:.2f} ms"
+        )
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from experiments.utils import save_run
+from plkg.radio.channels.rayleigh import add_complex_estimation_noise
+from plkg.radio.measurements.traces import (
+    DEFAULT_CHUNK_SAMPLES,
+    TRACE_OBSERVERS,
+    CaptureTrace,
+    write_trace,
+)
+from plkg.radio.profiles import get_profile
+from plkg.simulation import CsiScenario, run_trace
+from plkg.simulation.planning import default_window_samples
+from plkg.simulation.scenario import sample_observer_channels
+
+GIGABYTE = 1 << 30
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _megabytes(size: int | None) -> float | None:
+    return None if size is None else size / 2**20
+
+
+def _synthetic_capture(
+    scenario: CsiScenario,
+    samples: int,
+    rng: np.random.Generator,
+) -> Iterator[np.ndarray]:
+    """Noisy Alice, Bob and Eve CSI estimates, one chunk at a time."""
+    for start in range(0, samples, DEFAULT_CHUNK_SAMPLES):
+        size = min(DEFAULT_CHUNK_SAMPLES, samples - start)
+        yield np.stack(
+            [
+                add_complex_estimation_noise(
+                    channel,
+                    scenario.noise_variance,
+                    scenario.relative_estimation_error,
+                    rng,
+                )
+                for channel in sample_observer_channels(scenario, size, rng)
+            ],
+            axis=1,
+        )
+
+
+def _ingest(trace: CaptureTrace, window: int) -> None:
+    """Map the capture chunk by chunk and compute every window's threshold."""
+    chunk_samples = DEFAULT_CHUNK_SAMPLES - DEFAULT_CHUNK_SAMPLES % window
+    for chunk in trace.iter_chunks(chunk_samples):
+        rows = len(chunk) // window
+        amplitudes = np.abs(chunk[: rows * window].reshape(rows, window, 3))
+        np.median(amplitudes, axis=1)
+
+
+def run(
+    gigabytes: float,
+    *,
+    profile_name: str,
+    block_length: int,
+    guard_band_sigma: float,
+    directory: str | None,
+    ingest_only: bool,
+    seed: int,
+) -> dict[str, float | None]:
+    """Throughput and peak memory of trace ingestion on a synthetic capture.
+
+    A single-precision CSI capture of about ``gigabytes`` is streamed to a
+    trace file and read back twice: once for feature extraction alone and
+    once through ``run_trace``, whose throughput is bound by BCH decoding.
+    The peak RSS is sampled after writing and after each pass; with
+    memory-mapped chunks it should not grow with the capture size.
+    """
+    profile = get_profile(profile_name)
+    scenario = CsiScenario(
+        noise_variance=0.05,
+        alice_bob_correlation=profile.alice_bob_correlation,
+        alice_eve_correlation=profile.alice_eve_correlation,
+        relative_estimation_error=profile.estimation_error,
+        sample_interval_s=profile.sample_interval_s,
+        numeric_precision="single",
+    )
+    bytes_per_sample = TRACE_OBSERVERS * np.dtype(np.complex64).itemsize
+    samples = int(gigabytes * GIGABYTE) // bytes_per_sample
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        start = time.perf_counter()
+        trace = write_trace(
+            Path(scratch) / "capture.trace",
+            "csi",
+            _synthetic_capture(scenario, samples, rng),
+            sample_interval_s=scenario.sample_interval_s,
+        )
+        write_seconds = time.perf_counter() - start
+        write_rss = _peak_rss_bytes()
+        start = time.perf_counter()
+        _ingest(trace, default_window_samples(block_length, guard_band_sigma))
+        ingest_seconds = time.perf_counter() - start
+        ingest_rss = _peak_rss_bytes()
+        row: dict[str, float | None] = {
+            "capture_gb": samples * bytes_per_sample / GIGABYTE,
+            "samples": samples,
+            "write_s": write_seconds,
+            "ingest_s": ingest_seconds,
+            "ingest_samples_per_s": samples / ingest_seconds,
+            "peak_rss_after_write_mb": _megabytes(write_rss),
+            "peak_rss_after_ingest_mb": _megabytes(ingest_rss),
+        }
+        if not ingest_only:
+            start = time.perf_counter()
+            result = run_trace(
+                trace,
+                block_length=block_length,
+                guard_band_sigma=guard_band_sigma,
+                seed=seed,
+            )
+            protocol_seconds = time.perf_counter() - start
+            row |= {
+                "windows": result.trials,
+                "protocol_s": protocol_seconds,
+                "protocol_samples_per_s": samples / protocol_seconds,
+                "peak_rss_after_protocol_mb": _megabytes(_peak_rss_bytes()),
+                "bob_reconciled_mismatch_rate": result.bob_reconciled_mismatch_rate,
+                "eve_raw_mismatch_rate": result.eve_raw_mismatch_rate,
+            }
+    save_run(
+        "trace_benchmark",
+        {
+            "gigabytes": gigabytes,
+            "profile_name": profile_name,
+            "block_length": block_length,
+            "guard_band_sigma": guard_band_sigma,
+            "ingest_only": ingest_only,
+        },
+        [row],
+        seed,
+    )
+    return row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--gigabytes", type=float, default=2.0)
+    parser.add_argument("--profile", default="nr_fr1_n78")
+    parser.add_argument("--block-length", type=int, default=127)
+    parser.add_argument("--guard-band-sigma", type=float, default=0.0)
+    parser.add_argument("--directory", help="scratch directory for the capture")
+    parser.add_argument("--ingest-only", action="store_true")
+    parser.add_argument("--seed", type=int, default=20260612)
+    args = parser.parse_args()
+    row = run(
+        args.gigabytes,
+        profile_name=args.profile,
+        block_length=args.block_length,
+        guard_band_sigma=args.guard_band_sigma,
+        directory=args.directory,
+        ingest_only=args.ingest_only,
+        seed=args.seed,
+    )
+    for name, value in row.items():
+        print(f"{name}: {value}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import csv
 import json
 import platform
@@ -7,12 +8,20 @@ import subprocess
 import sys
 from dataclasses import asdict, is_dataclass
 from datetime import UTC, datetime
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any
 
+from plkg.security import PrecisionTarget
+from plkg.simulation import ChannelBank, MonteCarloCheckpoint
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 RESULTS_ROOT = PROJECT_ROOT / "results"
+# Parameters that may change when a run is resumed.
+RESUMABLE_PARAMETERS = frozenset({"workers"})
+# Sequential runs check their stopping rule after every shard of this size.
+SEQUENTIAL_BATCH_SIZE = 100
 
 
 def _package_version(name: str) -> str:
@@ -47,15 +56,201 @@ def runtime_metadata(seed: int) -> dict[str, Any]:
     }
 
 
+def new_run_id() -> str:
+    return datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def start_run(
+    experiment: str,
+    parameters: dict[str, Any],
+    run_id: str | None = None,
+    *,
+    extend_trials: int = 0,
+) -> str:
+    """Create the output directory of a run, or reopen it to resume.
+
+    A resumed run must repeat the parameters it was started with, except
+    those in ``RESUMABLE_PARAMETERS``; more trials are requested through
+    ``extend_trials`` instead. Extensions are recorded in the run directory
+    until ``save_run`` completes them, so rerunning an interrupted extension
+    with the same ``extend_trials``, or with none, resumes it instead of
+    appending another.
+    """
+    if extend_trials < 0:
+        raise ValueError("extend_trials cannot be negative")
+    if extend_trials and run_id is None:
+        raise ValueError("extend_trials needs the run_id of an existing run")
+    run_id = run_id or new_run_id()
+    output_dir = RESULTS_ROOT / experiment / run_id
+    parameters_path = output_dir / "parameters.json"
+    current = json.loads(json.dumps(parameters, default=_json_default))
+    if parameters_path.exists():
+        stored = json.loads(parameters_path.read_text(encoding="utf-8"))
+        changed = sorted(
+            name
+            for name in stored.keys() | current.keys()
+            if name not in RESUMABLE_PARAMETERS
+            and stored.get(name) != current.get(name)
+        )
+        if changed:
+            raise ValueError(f"cannot resume {run_id} with different {changed}")
+    else:
+        (output_dir / "checkpoints").mkdir(parents=True, exist_ok=True)
+        _write_json(parameters_path, current)
+    if extend_trials:
+        _record_extension(experiment, run_id, extend_trials)
+    return run_id
+
+
+def _extensions_path(experiment: str, run_id: str) -> Path:
+    return RESULTS_ROOT / experiment / run_id / "extensions.json"
+
+
+def _load_extensions(experiment: str, run_id: str) -> dict[str, Any]:
+    path = _extensions_path(experiment, run_id)
+    if not path.exists():
+        return {"segments": [], "complete": True}
+    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return data
+
+
+def _record_extension(experiment: str, run_id: str, extend_trials: int) -> None:
+    extensions = _load_extensions(experiment, run_id)
+    if not extensions["complete"]:
+        pending = extensions["segments"][-1]
+        if extend_trials == pending:
+            return
+        raise ValueError(
+            f"{run_id} is still being extended by {pending} trials; "
+            f"resume it with extend_trials={pending} or none"
+        )
+    extensions["segments"].append(extend_trials)
+    extensions["complete"] = False
+    _write_json(_extensions_path(experiment, run_id), extensions)
+
+
+def extended_trials(experiment: str, run_id: str) -> int:
+    """Trials added to every point of a run by its recorded extensions."""
+    return int(sum(_load_extensions(experiment, run_id)["segments"]))
+
+
+def load_checkpoint(
+    experiment: str,
+    run_id: str,
+    point: int,
+) -> MonteCarloCheckpoint | None:
+    path = _checkpoint_path(experiment, run_id, point)
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return MonteCarloCheckpoint.from_dict(data)
+
+
+def save_checkpoint(
+    experiment: str,
+    run_id: str,
+    point: int,
+    checkpoint: MonteCarloCheckpoint,
+) -> None:
+    _write_json(_checkpoint_path(experiment, run_id, point), checkpoint.as_dict())
+
+
+def checkpoint_arguments(
+    experiment: str,
+    run_id: str,
+    point: int,
+    trials: int,
+) -> dict[str, Any]:
+    """Keyword arguments that make one sweep point resumable.
+
+    Every point runs up to its ``trials`` plus the run's recorded
+    extensions. A point that already has a checkpoint only gains the trials
+    it is missing, so resuming twice never extends it twice, and its
+    finished shards are not recomputed.
+    """
+    checkpoint = load_checkpoint(experiment, run_id, point)
+    return {
+        "trials": trials + extended_trials(experiment, run_id),
+        "checkpoint": checkpoint,
+        "on_checkpoint": partial(save_checkpoint, experiment, run_id, point),
+    }
+
+
+def add_precision_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--relative-half-width",
+        type=float,
+        help="stop each point once its frame error rate interval is this tight",
+    )
+    parser.add_argument("--absolute-half-width", type=float, default=0.01)
+    parser.add_argument("--min-trials", type=int, default=200)
+
+
+def precision_from_arguments(arguments: argparse.Namespace) -> PrecisionTarget | None:
+    if arguments.relative_half_width is None:
+        return None
+    return PrecisionTarget(
+        relative_half_width=arguments.relative_half_width,
+        absolute_half_width=arguments.absolute_half_width,
+        min_trials=arguments.min_trials,
+    )
+
+
+def precision_arguments(precision: PrecisionTarget | None) -> dict[str, Any]:
+    """Keyword arguments of a sequential run; ``trials`` becomes its budget."""
+    if precision is None:
+        return {}
+    return {"precision": precision, "batch_size": SEQUENTIAL_BATCH_SIZE}
+
+
+def check_common_random_numbers(
+    precision: PrecisionTarget | None,
+    extend_trials: int,
+) -> None:
+    """Common-random-numbers sweeps run every point at once, without checkpoints."""
+    if precision is not None or extend_trials:
+        raise ValueError(
+            "common random numbers sweeps cannot be sequential or extended"
+        )
+
+
+def channel_bank_parameters(path: str | None) -> dict[str, Any]:
+    """Scenario channel parameters of the bank at ``path``, if any.
+
+    Sweeps replace their own channel parameters with these, so CSI and RSSI
+    sweeps on one bank see the same channels.
+    """
+    if path is None:
+        return {}
+    header = ChannelBank.open(path).header
+    return {
+        "sigma": header.sigma,
+        "alice_bob_correlation": header.alice_bob_correlation,
+        "alice_eve_correlation": header.alice_eve_correlation,
+        "doppler_hz": header.doppler_hz,
+        "sample_interval_s": header.sample_interval_s,
+    }
+
+
 def save_run(
     experiment: str,
     parameters: dict[str, Any],
     rows: list[dict[str, Any]],
     seed: int,
+    run_id: str | None = None,
 ) -> tuple[Path, Path]:
-    run_id = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
-    output_dir = RESULTS_ROOT / experiment / run_id
-    output_dir.mkdir(parents=True, exist_ok=False)
+    """Write the results and manifest of a run.
+
+    With the ``run_id`` of ``start_run`` the files go to the existing run
+    directory, and the manifest records the trials of every segment of
+    every checkpointed point.
+    """
+    if run_id is None:
+        run_id = new_run_id()
+        output_dir = RESULTS_ROOT / experiment / run_id
+        output_dir.mkdir(parents=True, exist_ok=False)
+    else:
+        output_dir = RESULTS_ROOT / experiment / run_id
 
     csv_path = output_dir / "results.csv"
     if rows:
@@ -72,14 +267,40 @@ def save_run(
         "created_at": datetime.now(UTC).isoformat(),
         "parameters": parameters,
         "runtime": runtime_metadata(seed),
+        "segments": _segments(experiment, run_id, len(rows)),
         "rows": rows,
     }
     json_path = output_dir / "manifest.json"
-    json_path.write_text(
-        json.dumps(manifest, indent=2, default=_json_default),
+    _write_json(json_path, manifest)
+    extensions = _load_extensions(experiment, run_id)
+    if not extensions["complete"]:
+        extensions["complete"] = True
+        _write_json(_extensions_path(experiment, run_id), extensions)
+    return csv_path, json_path
+
+
+def _checkpoint_path(experiment: str, run_id: str, point: int) -> Path:
+    checkpoints = RESULTS_ROOT / experiment / run_id / "checkpoints"
+    return checkpoints / f"point_{point:03d}.json"
+
+
+def _segments(experiment: str, run_id: str, points: int) -> list[list[int]]:
+    """Trials of every segment of every point; empty for unsaved points."""
+    segments = []
+    for point in range(points):
+        checkpoint = load_checkpoint(experiment, run_id, point)
+        segments.append([] if checkpoint is None else list(checkpoint.segments))
+    return segments
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write atomically, so an interrupted run never leaves a partial file."""
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(
+        json.dumps(data, indent=2, default=_json_default),
         encoding="utf-8",
     )
-    return csv_path, json_path
+    temporary.replace(path)
 
 
 def _json_default(value: Any) -> Any:
@@ -1,9 +1,18 @@
 """Shared domain models and extension contracts."""
 
 from plkg.core.models import (
+    BatchQuantizationMetadata,
+    BatchQuantizationResult,
+    BatchReconciliationResult,
+    BatchReconciliationTranscript,
     CsiObservation,
+    CsiTensorObservation,
+    EavesdropperReport,
     FeatureSeries,
+    FinalKeyBatch,
     FinalKeyResult,
+    FrameErrorEstimate,
+    KeyLatencyResult,
     MonteCarloResult,
     PublicTranscript,
     QuantizationMetadata,
@@ -11,13 +20,24 @@ from plkg.core.models import (
     ReconciliationResult,
     ReconciliationTranscript,
     RssiObservation,
+    StreamQuantizationBlock,
+    TrialBatch,
     TrialResult,
 )
 
 __all__ = [
+    "BatchQuantizationMetadata",
+    "BatchQuantizationResult",
+    "BatchReconciliationResult",
+    "BatchReconciliationTranscript",
     "CsiObservation",
+    "CsiTensorObservation",
+    "EavesdropperReport",
     "FeatureSeries",
+    "FinalKeyBatch",
     "FinalKeyResult",
+    "FrameErrorEstimate",
+    "KeyLatencyResult",
     "MonteCarloResult",
     "PublicTranscript",
     "QuantizationMetadata",
@@ -25,5 +45,7 @@ __all__ = [
     "ReconciliationResult",
     "ReconciliationTranscript",
     "RssiObservation",
+    "StreamQuantizationBlock",
+    "TrialBatch",
     "TrialResult",
 ]
@@ -1,9 +1,90 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any
+
 import numpy as np
+from numpy.typing import NDArray
 
 from plkg.core.models import BitArray, as_bits
 
+WORD_BITS = 64
+_WORD_DTYPE = np.dtype("<u8")
+
+
+def _word_count(length: int) -> int:
+    return -(-length // WORD_BITS)
+
+
+@dataclass(frozen=True)
+class PackedBits:
+    """Bits packed into little-endian 64-bit words along the last axis.
+
+    Bit ``i`` is bit ``i % 64`` of word ``i // 64``. Padding bits are always
+    zero, so XOR and popcount can work on whole words. Leading axes index
+    independent bit vectors, e.g. one row per block.
+    """
+
+    words: NDArray[np.uint64]
+    length: int
+
+    def __post_init__(self) -> None:
+        words = np.asarray(self.words, dtype=_WORD_DTYPE)
+        if self.length < 0:
+            raise ValueError("length cannot be negative")
+        if words.ndim == 0 or words.shape[-1] != _word_count(self.length):
+            raise ValueError(f"expected {_word_count(self.length)} words per vector")
+        object.__setattr__(self, "words", words)
+
+    @classmethod
+    def from_bits(cls, bits: Any) -> PackedBits:
+        raw = np.asarray(bits)
+        if raw.ndim == 0:
+            raise ValueError("bits must have at least one dimension")
+        if not np.all((raw == 0) | (raw == 1)):
+            raise ValueError("bits must contain only 0 and 1")
+        length = raw.shape[-1]
+        packed = np.packbits(raw.astype(np.uint8), axis=-1, bitorder="little")
+        padded = np.zeros(
+            (*raw.shape[:-1], _word_count(length) * 8),
+            dtype=np.uint8,
+        )
+        padded[..., : packed.shape[-1]] = packed
+        return cls(words=padded.view(_WORD_DTYPE), length=length)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (*self.words.shape[:-1], self.length)
+
+    def unpack(self) -> BitArray:
+        data = np.ascontiguousarray(self.words).view(np.uint8)
+        return np.unpackbits(data, axis=-1, count=self.length, bitorder="little")
+
+    def popcount(self) -> NDArray[np.int64]:
+        """Number of set bits of every vector, summed over its words."""
+        return np.asarray(
+            np.bitwise_count(self.words).sum(axis=-1, dtype=np.int64),
+            dtype=np.int64,
+        )
+
+    def __xor__(self, other: PackedBits) -> PackedBits:
+        if other.length != self.length:
+            raise ValueError("bit arrays must have equal length")
+        return PackedBits(np.bitwise_xor(self.words, other.words), self.length)
+
+    def __getitem__(self, index: slice) -> PackedBits:
+        """Slice the bit axis; word-aligned slices avoid unpacking."""
+        start, stop, step = index.indices(self.length)
+        if step != 1 or start % WORD_BITS != 0:
+            return PackedBits.from_bits(self.unpack()[..., index])
+        length = max(0, stop - start)
+        first = start // WORD_BITS
+        words = self.words[..., first : first + _word_count(length)].copy()
+        tail = length % WORD_BITS
+        if tail:
+            words[..., -1] &= np.uint64((1 << tail) - 1)
+        return PackedBits(words, length)
+
 
 def xor_bits(left: BitArray, right: BitArray) -> BitArray:
     left_bits = as_bits(left, name="left")
@@ -13,7 +94,20 @@ def xor_bits(left: BitArray, right: BitArray) -> BitArray:
     return np.bitwise_xor(left_bits, right_bits).astype(np.uint8)
 
 
-def hamming_distance(left: BitArray, right: BitArray) -> int:
+def hamming_distance(
+    left: BitArray | PackedBits,
+    right: BitArray | PackedBits,
+) -> int:
+    """Differing bits; packed operands are compared with word popcounts."""
+    if isinstance(left, PackedBits) and isinstance(right, PackedBits):
+        for name, operand in (("left", left), ("right", right)):
+            if len(operand.shape) != 1:
+                raise ValueError(f"{name} must be one-dimensional")
+        return int((left ^ right).popcount())
+    if isinstance(left, PackedBits):
+        left = left.unpack()
+    if isinstance(right, PackedBits):
+        right = right.unpack()
     return int(np.count_nonzero(xor_bits(left, right)))
 
 
@@ -1,21 +1,51 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from statistics import NormalDist
+from typing import Any, Literal
 
 import numpy as np
 from numpy.typing import NDArray
 
 BitArray = NDArray[np.uint8]
-FloatArray = NDArray[np.float64]
-ComplexArray = NDArray[np.complex128]
+BoolArray = NDArray[np.bool_]
+# Single-precision runs carry float32 and complex64 arrays through the same
+# code paths; every other value is double precision.
+FloatArray = NDArray[np.floating[Any]]
+ComplexArray = NDArray[np.complexfloating[Any, Any]]
+Precision = Literal["double", "single"]
+PRECISIONS: tuple[Precision, ...] = ("double", "single")
+
+
+def real_dtype(precision: Precision) -> type[np.floating[Any]]:
+    return np.float32 if precision == "single" else np.float64
+
+
+def complex_dtype(precision: Precision) -> type[np.complexfloating[Any, Any]]:
+    return np.complex64 if precision == "single" else np.complex128
+
+
+def as_real(values: Any) -> FloatArray:
+    """``values`` as float64, keeping float32 arrays in single precision."""
+    array = np.asarray(values)
+    if array.dtype == np.float32:
+        return array
+    return array.astype(np.float64, copy=False)
+
+
+def as_complex(values: Any) -> ComplexArray:
+    """``values`` as complex128, keeping complex64 arrays in single precision."""
+    array = np.asarray(values)
+    if array.dtype == np.complex64:
+        return array
+    return array.astype(np.complex128, copy=False)
 
 
 def as_bits(values: Any, *, name: str = "bits") -> BitArray:
     raw = np.asarray(values)
     if raw.ndim != 1:
         raise ValueError(f"{name} must be one-dimensional")
-    if not np.all(np.isin(raw, (0, 1))):
+    if not np.all((raw == 0) | (raw == 1)):
         raise ValueError(f"{name} must contain only 0 and 1")
     return raw.astype(np.uint8)
 
@@ -27,7 +57,7 @@ class CsiObservation:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        values = np.asarray(self.values, dtype=np.complex128)
+        values = as_complex(self.values)
         if values.ndim != 1:
             raise ValueError("CSI values must be one-dimensional")
         if self.sample_interval_s <= 0:
@@ -35,6 +65,30 @@ class CsiObservation:
         object.__setattr__(self, "values", values)
 
 
+@dataclass(frozen=True)
+class CsiTensorObservation:
+    """OFDM CSI reports laid out as ``(time, subcarrier, antenna)``.
+
+    Time is the leading axis, so consecutive snapshots are contiguous and a
+    capture can be processed in time chunks; ``values`` may be a memory map.
+    """
+
+    values: ComplexArray
+    sample_interval_s: float = 1.0
+    subcarrier_spacing_hz: float = 30e3
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        values = as_complex(self.values)
+        if values.ndim != 3:
+            raise ValueError("CSI tensors must be (time, subcarrier, antenna)")
+        if self.sample_interval_s <= 0:
+            raise ValueError("sample_interval_s must be positive")
+        if self.subcarrier_spacing_hz <= 0:
+            raise ValueError("subcarrier_spacing_hz must be positive")
+        object.__setattr__(self, "values", values)
+
+
 @dataclass(frozen=True)
 class RssiObservation:
     values_dbm: FloatArray
@@ -42,7 +96,7 @@ class RssiObservation:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        values = np.asarray(self.values_dbm, dtype=np.float64)
+        values = as_real(self.values_dbm)
         if values.ndim != 1:
             raise ValueError("RSSI values must be one-dimensional")
         if self.sample_interval_s <= 0:
@@ -56,18 +110,42 @@ class FeatureSeries:
     name: str
 
     def __post_init__(self) -> None:
-        values = np.asarray(self.values, dtype=np.float64)
+        values = as_real(self.values)
         if values.ndim != 1:
             raise ValueError("features must be one-dimensional")
         object.__setattr__(self, "values", values)
 
 
+def _levels_bits(levels: int) -> int:
+    """Bits per sample of a quantizer with ``levels`` thresholds."""
+    if levels == 0:
+        return 1
+    if levels & (levels + 1):
+        raise ValueError("a multi-level quantizer has 2**bits - 1 thresholds")
+    return (levels + 1).bit_length() - 1
+
+
 @dataclass(frozen=True)
 class QuantizationMetadata:
+    """Alice's public quantization decisions for one window.
+
+    Multi-level quantizers also publish ``level_thresholds``, the ascending
+    ``2**bits - 1`` thresholds, and their ``level_guard_band_widths``. A
+    sample then yields ``bits_per_sample`` bits and its index is repeated
+    once per bit in ``accepted_indices``, so entry ``j`` is bit
+    ``j % bits_per_sample`` of its sample.
+    """
+
     threshold: float
     accepted_indices: NDArray[np.int64]
     source_length: int
     guard_band_width: float
+    level_thresholds: FloatArray = field(
+        default_factory=lambda: np.array([], dtype=np.float64)
+    )
+    level_guard_band_widths: FloatArray = field(
+        default_factory=lambda: np.array([], dtype=np.float64)
+    )
 
     def __post_init__(self) -> None:
         indices = np.asarray(self.accepted_indices, dtype=np.int64)
@@ -75,7 +153,18 @@ class QuantizationMetadata:
             raise ValueError("accepted_indices must be one-dimensional")
         if np.any(indices < 0) or np.any(indices >= self.source_length):
             raise ValueError("accepted_indices contains an invalid index")
+        thresholds = np.asarray(self.level_thresholds, dtype=np.float64)
+        widths = np.asarray(self.level_guard_band_widths, dtype=np.float64)
+        if thresholds.ndim != 1 or widths.shape != thresholds.shape:
+            raise ValueError("level thresholds and widths must be equal 1-D arrays")
+        _levels_bits(len(thresholds))
         object.__setattr__(self, "accepted_indices", indices)
+        object.__setattr__(self, "level_thresholds", thresholds)
+        object.__setattr__(self, "level_guard_band_widths", widths)
+
+    @property
+    def bits_per_sample(self) -> int:
+        return _levels_bits(len(self.level_thresholds))
 
 
 @dataclass(frozen=True)
@@ -91,9 +180,139 @@ class QuantizationResult:
 
     @property
     def retention_rate(self) -> float:
+        """Share of the window's samples that were quantized."""
         if self.metadata.source_length == 0:
             return 0.0
-        return len(self.bits) / self.metadata.source_length
+        return len(self.bits) / (
+            self.metadata.bits_per_sample * self.metadata.source_length
+        )
+
+
+@dataclass(frozen=True)
+class StreamQuantizationBlock:
+    """A quantized block of a continuous stream.
+
+    ``metadata`` describes the stream segment of ``metadata.source_length``
+    samples starting at stream index ``start``; another observer quantizes
+    its own samples of that segment with it, as with ``QuantizationResult``.
+    """
+
+    start: int
+    result: QuantizationResult
+
+    def __post_init__(self) -> None:
+        if self.start < 0:
+            raise ValueError("start cannot be negative")
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.result.metadata.source_length
+
+    @property
+    def bits(self) -> BitArray:
+        return self.result.bits
+
+    @property
+    def metadata(self) -> QuantizationMetadata:
+        return self.result.metadata
+
+
+def as_bit_matrix(values: Any, *, name: str = "bits") -> BitArray:
+    raw = np.asarray(values)
+    if raw.ndim != 2:
+        raise ValueError(f"{name} must be two-dimensional")
+    if not np.all((raw == 0) | (raw == 1)):
+        raise ValueError(f"{name} must contain only 0 and 1")
+    return raw.astype(np.uint8)
+
+
+@dataclass(frozen=True)
+class BatchQuantizationMetadata:
+    """Row-wise quantization metadata; row ``i`` belongs to trial ``i``.
+
+    ``level_thresholds`` and ``level_guard_band_widths`` are
+    ``(rows, 2**bits - 1)`` for multi-level quantizers and empty otherwise.
+    """
+
+    thresholds: FloatArray
+    accepted_indices: NDArray[np.int64]
+    source_length: int
+    guard_band_widths: FloatArray
+    level_thresholds: FloatArray = field(
+        default_factory=lambda: np.array([], dtype=np.float64)
+    )
+    level_guard_band_widths: FloatArray = field(
+        default_factory=lambda: np.array([], dtype=np.float64)
+    )
+
+    def __post_init__(self) -> None:
+        thresholds = np.asarray(self.thresholds, dtype=np.float64)
+        widths = np.asarray(self.guard_band_widths, dtype=np.float64)
+        indices = np.asarray(self.accepted_indices, dtype=np.int64)
+        if thresholds.ndim != 1 or widths.shape != thresholds.shape:
+            raise ValueError("thresholds and guard_band_widths must be 1-D rows")
+        if indices.ndim != 2 or len(indices) != len(thresholds):
+            raise ValueError("accepted_indices must have one row per threshold")
+        if np.any(indices < 0) or np.any(indices >= self.source_length):
+            raise ValueError("accepted_indices contains an invalid index")
+        levels = np.asarray(self.level_thresholds, dtype=np.float64)
+        level_widths = np.asarray(self.level_guard_band_widths, dtype=np.float64)
+        if levels.ndim == level_widths.ndim == 1 and levels.size == 0:
+            levels = level_widths = np.empty((len(thresholds), 0))
+        if levels.ndim != 2 or len(levels) != len(thresholds):
+            raise ValueError("level_thresholds must have one row per threshold")
+        if level_widths.shape != levels.shape:
+            raise ValueError("level thresholds and widths must have equal shape")
+        _levels_bits(levels.shape[1])
+        object.__setattr__(self, "thresholds", thresholds)
+        object.__setattr__(self, "guard_band_widths", widths)
+        object.__setattr__(self, "accepted_indices", indices)
+        object.__setattr__(self, "level_thresholds", levels)
+        object.__setattr__(self, "level_guard_band_widths", level_widths)
+
+    @property
+    def rows(self) -> int:
+        return len(self.thresholds)
+
+    @property
+    def bits_per_sample(self) -> int:
+        return _levels_bits(self.level_thresholds.shape[1])
+
+    def row(self, index: int) -> QuantizationMetadata:
+        return QuantizationMetadata(
+            threshold=float(self.thresholds[index]),
+            accepted_indices=self.accepted_indices[index],
+            source_length=self.source_length,
+            guard_band_width=float(self.guard_band_widths[index]),
+            level_thresholds=self.level_thresholds[index],
+            level_guard_band_widths=self.level_guard_band_widths[index],
+        )
+
+
+@dataclass(frozen=True)
+class BatchQuantizationResult:
+    """Quantized rows that retained enough samples for one block.
+
+    ``source_rows`` maps every result row back to the row of the feature
+    matrix it was taken from; rows that retained too few samples are absent.
+    """
+
+    bits: BitArray
+    metadata: BatchQuantizationMetadata
+    retention_rates: FloatArray
+    source_rows: NDArray[np.int64]
+
+    def __post_init__(self) -> None:
+        bits = as_bit_matrix(self.bits)
+        if bits.shape != self.metadata.accepted_indices.shape:
+            raise ValueError("bits and accepted_indices must have equal shape")
+        retention = np.asarray(self.retention_rates, dtype=np.float64)
+        source_rows = np.asarray(self.source_rows, dtype=np.int64)
+        if retention.shape != (len(bits),) or source_rows.shape != (len(bits),):
+            raise ValueError("retention_rates and source_rows need one entry per row")
+        object.__setattr__(self, "bits", bits)
+        object.__setattr__(self, "retention_rates", retention)
+        object.__setattr__(self, "source_rows", source_rows)
 
 
 @dataclass(frozen=True)
@@ -139,6 +358,55 @@ class ReconciliationResult:
         object.__setattr__(self, "bits", as_bits(self.bits))
 
 
+@dataclass(frozen=True)
+class BatchReconciliationTranscript:
+    """Helper data of many blocks, one row per block, under one scheme."""
+
+    scheme: str
+    helper_data: BitArray
+    leakage_bits: int
+
+    def __post_init__(self) -> None:
+        helper_data = as_bit_matrix(self.helper_data, name="helper_data")
+        if self.leakage_bits < 0:
+            raise ValueError("leakage_bits cannot be negative")
+        object.__setattr__(self, "helper_data", helper_data)
+
+    def row(self, index: int) -> ReconciliationTranscript:
+        return ReconciliationTranscript(
+            scheme=self.scheme,
+            helper_data=self.helper_data[index],
+            leakage_bits=self.leakage_bits,
+        )
+
+
+@dataclass(frozen=True)
+class BatchReconciliationResult:
+    """Row-wise reconciliation outcome; ``corrected_errors`` is -1 on failure."""
+
+    bits: BitArray
+    success: BoolArray
+    corrected_errors: NDArray[np.int64]
+
+    def __post_init__(self) -> None:
+        bits = as_bit_matrix(self.bits)
+        success = np.asarray(self.success, dtype=np.bool_)
+        corrected_errors = np.asarray(self.corrected_errors, dtype=np.int64)
+        if success.shape != (len(bits),) or corrected_errors.shape != success.shape:
+            raise ValueError("success and corrected_errors need one entry per row")
+        object.__setattr__(self, "bits", bits)
+        object.__setattr__(self, "success", success)
+        object.__setattr__(self, "corrected_errors", corrected_errors)
+
+    def row(self, index: int) -> ReconciliationResult:
+        success = bool(self.success[index])
+        return ReconciliationResult(
+            bits=self.bits[index],
+            success=success,
+            corrected_errors=int(self.corrected_errors[index]) if success else None,
+        )
+
+
 @dataclass(frozen=True)
 class TrialResult:
     alice_bits: BitArray
@@ -150,6 +418,171 @@ class TrialResult:
     retention_rate: float
     alice_bob_observation_correlation: float
     alice_eve_observation_correlation: float
+    blocks: int = 1
+    sample_retries: int = 0
+    discarded_samples: int = 0
+
+    @property
+    def block_length(self) -> int:
+        return len(self.alice_bits) // self.blocks
+
+
+@dataclass(frozen=True)
+class EavesdropperReport:
+    """Outcome of many Eves attacking one public transcript, one entry each.
+
+    The worst case is the Eve closest to Alice's key, i.e. the lowest
+    mismatch rate.
+    """
+
+    eve_bits: BitArray
+    eve_reconciled_bits: BitArray
+    eve_success: BoolArray
+    raw_mismatch_rates: FloatArray
+    reconciled_mismatch_rates: FloatArray
+
+    def __post_init__(self) -> None:
+        eve_bits = as_bit_matrix(self.eve_bits, name="eve_bits")
+        reconciled = as_bit_matrix(
+            self.eve_reconciled_bits,
+            name="eve_reconciled_bits",
+        )
+        if reconciled.shape != eve_bits.shape:
+            raise ValueError("all bit matrices must have equal shape")
+        object.__setattr__(self, "eve_bits", eve_bits)
+        object.__setattr__(self, "eve_reconciled_bits", reconciled)
+        object.__setattr__(
+            self,
+            "eve_success",
+            np.asarray(self.eve_success, dtype=np.bool_),
+        )
+        for name in ("raw_mismatch_rates", "reconciled_mismatch_rates"):
+            object.__setattr__(
+                self,
+                name,
+                np.asarray(getattr(self, name), dtype=np.float64),
+            )
+        for name in ("eve_success", "raw_mismatch_rates", "reconciled_mismatch_rates"):
+            if np.shape(getattr(self, name)) != (len(eve_bits),):
+                raise ValueError(f"{name} needs one entry per eavesdropper")
+
+    @property
+    def eavesdroppers(self) -> int:
+        return len(self.eve_bits)
+
+    @property
+    def worst_case_index(self) -> int:
+        return int(np.argmin(self.reconciled_mismatch_rates))
+
+    @property
+    def worst_case_raw_mismatch_rate(self) -> float:
+        return float(np.min(self.raw_mismatch_rates))
+
+    @property
+    def worst_case_reconciled_mismatch_rate(self) -> float:
+        return float(np.min(self.reconciled_mismatch_rates))
+
+    @property
+    def success_rate(self) -> float:
+        return float(np.mean(self.eve_success))
+
+
+@dataclass(frozen=True)
+class TrialBatch:
+    """Bit matrices of many independent trials, one reconciliation block per row.
+
+    ``block_trials`` maps every row to the trial it belongs to, in
+    non-decreasing order; left empty, every trial has one block. The per-trial
+    arrays (retention and correlations) have one entry per trial, and every
+    trial observed a window of ``source_length`` channel samples.
+    ``source_rows`` maps every trial to its row of the input features (left
+    empty, the rows kept their order). ``sample_retries`` and
+    ``discarded_samples`` count the extra draws made before these trials
+    retained a full block.
+    """
+
+    alice_bits: BitArray
+    bob_bits: BitArray
+    eve_bits: BitArray
+    bob_reconciled_bits: BitArray
+    eve_reconciled_bits: BitArray
+    bob_success: BoolArray
+    eve_success: BoolArray
+    retention_rates: FloatArray
+    alice_bob_observation_correlations: FloatArray
+    alice_eve_observation_correlations: FloatArray
+    source_length: int = 0
+    block_trials: NDArray[np.int64] = field(
+        default_factory=lambda: np.array([], dtype=np.int64)
+    )
+    source_rows: NDArray[np.int64] = field(
+        default_factory=lambda: np.array([], dtype=np.int64)
+    )
+    sample_retries: int = 0
+    discarded_samples: int = 0
+
+    def __post_init__(self) -> None:
+        shape = np.shape(self.alice_bits)
+        trials = len(np.asarray(self.retention_rates))
+        for name in (
+            "alice_bits",
+            "bob_bits",
+            "eve_bits",
+            "bob_reconciled_bits",
+            "eve_reconciled_bits",
+        ):
+            bits = as_bit_matrix(getattr(self, name), name=name)
+            if bits.shape != shape:
+                raise ValueError("all bit matrices must have equal shape")
+            object.__setattr__(self, name, bits)
+        for name in ("bob_success", "eve_success"):
+            flags = np.asarray(getattr(self, name), dtype=np.bool_)
+            if flags.shape != (shape[0],):
+                raise ValueError(f"{name} needs one entry per block")
+            object.__setattr__(self, name, flags)
+        for name in (
+            "retention_rates",
+            "alice_bob_observation_correlations",
+            "alice_eve_observation_correlations",
+        ):
+            values = np.asarray(getattr(self, name), dtype=np.float64)
+            if values.shape != (trials,):
+                raise ValueError(f"{name} needs one entry per trial")
+            object.__setattr__(self, name, values)
+        block_trials = np.asarray(self.block_trials, dtype=np.int64)
+        if block_trials.size == 0:
+            block_trials = np.arange(shape[0], dtype=np.int64)
+        if block_trials.shape != (shape[0],):
+            raise ValueError("block_trials needs one entry per block")
+        if np.any(np.diff(block_trials) < 0) or np.any(
+            np.bincount(block_trials, minlength=trials)[:trials] == 0
+        ):
+            raise ValueError("every trial needs consecutive blocks")
+        if len(block_trials) and block_trials[-1] >= trials:
+            raise ValueError("block_trials refers to a missing trial")
+        if self.source_length < 0:
+            raise ValueError("source_length cannot be negative")
+        source_rows = np.asarray(self.source_rows, dtype=np.int64)
+        if source_rows.size == 0:
+            source_rows = np.arange(trials, dtype=np.int64)
+        if source_rows.shape != (trials,):
+            raise ValueError("source_rows needs one entry per trial")
+        if self.sample_retries < 0 or self.discarded_samples < 0:
+            raise ValueError("retry counters cannot be negative")
+        object.__setattr__(self, "block_trials", block_trials)
+        object.__setattr__(self, "source_rows", source_rows)
+
+    @property
+    def trials(self) -> int:
+        return len(self.retention_rates)
+
+    @property
+    def blocks(self) -> int:
+        return int(self.alice_bits.shape[0])
+
+    @property
+    def block_length(self) -> int:
+        return int(self.alice_bits.shape[1])
 
 
 @dataclass(frozen=True)
@@ -170,8 +603,52 @@ class FinalKeyResult:
         object.__setattr__(self, "eve_key", eve_key)
 
 
+@dataclass(frozen=True)
+class FinalKeyBatch:
+    """Final keys of many trials, one row per trial, each with its own seed."""
+
+    alice_keys: BitArray
+    bob_keys: BitArray
+    eve_keys: BitArray
+
+    def __post_init__(self) -> None:
+        shape = np.shape(self.alice_keys)
+        for name in ("alice_keys", "bob_keys", "eve_keys"):
+            keys = as_bit_matrix(getattr(self, name), name=name)
+            if keys.shape != shape:
+                raise ValueError("all final key matrices must have equal shape")
+            object.__setattr__(self, name, keys)
+
+    @property
+    def trials(self) -> int:
+        return int(self.alice_keys.shape[0])
+
+    @property
+    def key_length(self) -> int:
+        return int(self.alice_keys.shape[1])
+
+
 @dataclass(frozen=True)
 class MonteCarloResult:
+    """Aggregated metrics of a Monte Carlo run.
+
+    ``bits_per_trial`` is the reconciliation block length; multi-block trials
+    reconcile ``mean_blocks_per_trial`` such blocks on average. Mismatch
+    rates are per reconciled bit and ``bob_block_error_rate`` is per block.
+    ``key_bits_per_sample`` divides the reconciled bits by the channel
+    samples of the windows they were quantized from. ``mean_sample_retries``
+    counts redraws or top-ups per trial, and ``wasted_sample_fraction`` is
+    the share of all drawn samples that belonged to discarded windows.
+    The ``*_lower``/``*_upper`` pairs are ``interval_method`` confidence
+    intervals at level ``interval_confidence``; mismatch-rate intervals
+    treat bits as independent. Scenario runs also report the rate of
+    roughly independent quantized samples and the secure key rate, both
+    per second of channel probing. Runs with a sample plan report
+    ``mean_sample_retries_avoided``: the redraws per trial the default
+    windows are expected to need, by the plan's calibrated retention model,
+    minus the retries the run made.
+    """
+
     trials: int
     bits_per_trial: int
     bob_raw_mismatch_rate: float
@@ -182,6 +659,108 @@ class MonteCarloResult:
     mean_retention_rate: float
     mean_alice_bob_correlation: float
     mean_alice_eve_correlation: float
+    std_retention_rate: float
+    std_alice_bob_correlation: float
+    std_alice_eve_correlation: float
+    mean_blocks_per_trial: float
+    bob_block_error_rate: float
+    key_bits_per_sample: float
+    mean_sample_retries: float
+    wasted_sample_fraction: float
+    bob_frame_error_rate_lower: float
+    bob_frame_error_rate_upper: float
+    bob_raw_mismatch_rate_lower: float
+    bob_raw_mismatch_rate_upper: float
+    bob_reconciled_mismatch_rate_lower: float
+    bob_reconciled_mismatch_rate_upper: float
+    eve_reconciled_mismatch_rate_lower: float
+    eve_reconciled_mismatch_rate_upper: float
+    interval_confidence: float
+    interval_method: str
+    seed: int
+    final_key_bits: int | None = None
+    final_key_agreement_rate: float | None = None
+    eve_final_key_mismatch_rate: float | None = None
+    independent_samples_per_second: float | None = None
+    secure_key_bits_per_second: float | None = None
+    mean_sample_retries_avoided: float | None = None
+
+    def as_dict(self) -> dict[str, int | float | str | None]:
+        return {
+            field_name: getattr(self, field_name)
+            for field_name in self.__dataclass_fields__
+        }
+
+
+@dataclass(frozen=True)
+class FrameErrorEstimate:
+    """Conditional Monte Carlo estimate of Bob's frame error rate.
+
+    Each trial contributes the exact probability that Bob's block has more
+    errors than the code corrects, given the sampled channels, instead of a
+    0/1 outcome. ``standard_error`` is the standard error of that mean, and
+    ``variance_reduction`` is the number of plain Monte Carlo trials with the
+    same variance as one conditional trial. ``bit_error_rate`` is the
+    expected raw mismatch rate per accepted bit.
+    """
+
+    trials: int
+    bits_per_trial: int
+    correctable_errors: int
+    frame_error_rate: float
+    standard_error: float
+    bit_error_rate: float
+    variance_reduction: float
+    mean_sample_retries: float
+    seed: int
+
+    def interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Normal-approximation interval, clipped to ``[0, 1]``."""
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        z = float(NormalDist().inv_cdf(0.5 + confidence / 2))
+        half_width = z * self.standard_error
+        return (
+            max(0.0, self.frame_error_rate - half_width),
+            min(1.0, self.frame_error_rate + half_width),
+        )
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            field_name: getattr(self, field_name)
+            for field_name in self.__dataclass_fields__
+        }
+
+
+@dataclass(frozen=True)
+class KeyLatencyResult:
+    """Distribution of key-establishment latency and throughput over sessions.
+
+    Every session probes the channel until it has ``keys_per_session`` keys
+    of ``key_bits`` bits or gives up on one. ``time_to_first_key_*_s`` are
+    percentiles of the time until the first key is ready; sessions that
+    never get one count as infinitely slow. A session's sustained key rate
+    is its key bits over its whole duration, and since the slow tail is
+    the one that matters, its ``p05``/``p01`` are the rates that 95% and
+    99% of sessions exceed. Windows and retransmitted blocks (those Bob
+    failed to reconcile) are averaged over the keys that were completed.
+    """
+
+    sessions: int
+    key_bits: int
+    keys_per_session: int
+    security_bits: int
+    first_key_rate: float
+    completed_session_rate: float
+    time_to_first_key_p50_s: float
+    time_to_first_key_p95_s: float
+    time_to_first_key_p99_s: float
+    sustained_key_bits_per_second_p50: float
+    sustained_key_bits_per_second_p05: float
+    sustained_key_bits_per_second_p01: float
+    mean_sustained_key_bits_per_second: float
+    mean_windows_per_key: float
+    mean_retransmitted_blocks_per_key: float
     seed: int
 
     def as_dict(self) -> dict[str, int | float]:
@@ -5,8 +5,13 @@ from typing import Protocol
 import numpy as np
 
 from plkg.core.models import (
+    BatchQuantizationMetadata,
+    BatchQuantizationResult,
+    BatchReconciliationResult,
+    BatchReconciliationTranscript,
     BitArray,
     FeatureSeries,
+    FloatArray,
     QuantizationMetadata,
     QuantizationResult,
     ReconciliationResult,
@@ -28,6 +33,20 @@ class Quantizer(Protocol):
     ) -> BitArray: ...
 
 
+class BatchQuantizer(Quantizer, Protocol):
+    def prepare_batch(
+        self,
+        values: FloatArray,
+        block_length: int,
+    ) -> BatchQuantizationResult: ...
+
+    def apply_batch(
+        self,
+        values: FloatArray,
+        metadata: BatchQuantizationMetadata,
+    ) -> BitArray: ...
+
+
 class Reconciler(Protocol):
     @property
     def block_length(self) -> int: ...
@@ -45,6 +64,20 @@ class Reconciler(Protocol):
     ) -> ReconciliationResult: ...
 
 
+class BatchReconciler(Reconciler, Protocol):
+    def create_transcripts(
+        self,
+        reference_bits: BitArray,
+        rng: np.random.Generator,
+    ) -> BatchReconciliationTranscript: ...
+
+    def reconcile_many(
+        self,
+        observed_bits: BitArray,
+        transcript: BatchReconciliationTranscript,
+    ) -> BatchReconciliationResult: ...
+
+
 class PrivacyAmplifier(Protocol):
     def seed_length(self, input_bits: int, output_bits: int) -> int: ...
 
@@ -61,3 +94,25 @@ class PrivacyAmplifier(Protocol):
         output_bits: int,
         public_seed: BitArray,
     ) -> BitArray: ...
+
+    def generate_seeds(
+        self,
+        count: int,
+        input_bits: int,
+        output_bits: int,
+        rng: np.random.Generator,
+    ) -> BitArray: ...
+
+    def extract_many(
+        self,
+        bits: BitArray,
+        output_bits: int,
+        public_seed: BitArray,
+    ) -> BitArray: ...
+
+    def extract_with_seeds(
+        self,
+        bits: BitArray,
+        output_bits: int,
+        public_seeds: BitArray,
+    ) -> BitArray: ...
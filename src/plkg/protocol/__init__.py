@@ -1,5 +1,17 @@
 """Reusable PLKG protocol stages."""
 
-from plkg.protocol.pipeline import amplify_reconciled_keys, execute_protocol
+from plkg.protocol.pipeline import (
+    amplify_reconciled_keys,
+    amplify_trial_batch,
+    evaluate_eavesdroppers,
+    execute_protocol,
+    execute_protocol_batch,
+)
 
-__all__ = ["amplify_reconciled_keys", "execute_protocol"]
+__all__ = [
+    "amplify_reconciled_keys",
+    "amplify_trial_batch",
+    "evaluate_eavesdroppers",
+    "execute_protocol",
+    "execute_protocol_batch",
+]
@@ -3,16 +3,31 @@ from __future__ import annotations
 from dataclasses import replace
 
 import numpy as np
+from numpy.typing import NDArray
 
 from plkg.core.models import (
+    BatchQuantizationMetadata,
+    BatchReconciliationTranscript,
+    BitArray,
+    EavesdropperReport,
     FeatureSeries,
+    FinalKeyBatch,
     FinalKeyResult,
     FloatArray,
     PublicTranscript,
-    QuantizationMetadata,
+    ReconciliationResult,
+    ReconciliationTranscript,
+    TrialBatch,
     TrialResult,
+    as_real,
+)
+from plkg.core.protocols import (
+    BatchQuantizer,
+    BatchReconciler,
+    PrivacyAmplifier,
+    Quantizer,
+    Reconciler,
 )
-from plkg.core.protocols import PrivacyAmplifier, Quantizer, Reconciler
 from plkg.protocol.privacy_amplification import ToeplitzHashAmplifier
 
 
@@ -22,6 +37,38 @@ def _safe_correlation(left: FloatArray, right: FloatArray) -> float:
     return float(np.corrcoef(left, right)[0, 1])
 
 
+def _row_correlations(left: FloatArray, right: FloatArray) -> FloatArray:
+    """Row-wise version of ``_safe_correlation`` for ``(trials, samples)``."""
+    correlations = np.zeros(len(left), dtype=np.float64)
+    if left.shape[1] < 2:
+        return correlations
+    left_centered = left - left.mean(axis=1, keepdims=True)
+    right_centered = right - right.mean(axis=1, keepdims=True)
+    left_norm = np.sqrt(np.sum(left_centered**2, axis=1))
+    right_norm = np.sqrt(np.sum(right_centered**2, axis=1))
+    valid = (left_norm != 0) & (right_norm != 0)
+    correlations[valid] = np.sum(
+        left_centered[valid] * right_centered[valid],
+        axis=1,
+    ) / (left_norm[valid] * right_norm[valid])
+    return np.clip(correlations, -1.0, 1.0)
+
+
+def _combine_results(results: list[ReconciliationResult]) -> ReconciliationResult:
+    if len(results) == 1:
+        return results[0]
+    counts = [
+        result.corrected_errors
+        for result in results
+        if result.corrected_errors is not None
+    ]
+    return ReconciliationResult(
+        bits=np.concatenate([result.bits for result in results]),
+        success=all(result.success for result in results),
+        corrected_errors=sum(counts) if len(counts) == len(results) else None,
+    )
+
+
 def execute_protocol(
     alice_features: FeatureSeries,
     bob_features: FeatureSeries,
@@ -29,30 +76,56 @@ def execute_protocol(
     quantizer: Quantizer,
     reconciler: Reconciler,
     rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
 ) -> TrialResult:
+    """Run one trial; ``multi_block`` keeps every complete block retained.
+
+    By default only the first reconciliation block of the window is used.
+    With ``multi_block`` the retained bits are split into as many blocks as
+    they fill; each block gets its own helper data, and the transcript and
+    reconciliation results are the concatenation over blocks.
+    """
     prepared = quantizer.prepare(alice_features)
     block_length = reconciler.block_length
     if len(prepared.bits) < block_length:
         raise RuntimeError("not enough retained samples for one reconciliation block")
 
-    accepted_indices = prepared.metadata.accepted_indices[:block_length]
-    metadata = QuantizationMetadata(
-        threshold=prepared.metadata.threshold,
-        accepted_indices=accepted_indices,
-        source_length=prepared.metadata.source_length,
-        guard_band_width=prepared.metadata.guard_band_width,
-    )
-    alice_bits = prepared.bits[:block_length]
+    blocks = len(prepared.bits) // block_length if multi_block else 1
+    accepted_indices = prepared.metadata.accepted_indices[: blocks * block_length]
+    metadata = replace(prepared.metadata, accepted_indices=accepted_indices)
+    alice_bits = prepared.bits[: blocks * block_length]
     bob_bits = quantizer.apply(bob_features, metadata)
     eve_bits = quantizer.apply(eve_features, metadata)
 
-    reconciliation = reconciler.create_transcript(alice_bits, rng)
+    block_transcripts = [
+        reconciler.create_transcript(block, rng)
+        for block in np.split(alice_bits, blocks)
+    ]
+    reconciliation = ReconciliationTranscript(
+        scheme=block_transcripts[0].scheme,
+        helper_data=np.concatenate(
+            [block.helper_data for block in block_transcripts]
+        ),
+        leakage_bits=sum(block.leakage_bits for block in block_transcripts),
+    )
     transcript = PublicTranscript(
         quantization=metadata,
         reconciliation=reconciliation,
     )
-    bob_reconciled = reconciler.reconcile(bob_bits, reconciliation)
-    eve_reconciled = reconciler.reconcile(eve_bits, reconciliation)
+    bob_reconciled, eve_reconciled = (
+        _combine_results(
+            [
+                reconciler.reconcile(block, block_transcript)
+                for block, block_transcript in zip(
+                    np.split(observed_bits, blocks),
+                    block_transcripts,
+                    strict=True,
+                )
+            ]
+        )
+        for observed_bits in (bob_bits, eve_bits)
+    )
 
     return TrialResult(
         alice_bits=alice_bits,
@@ -70,6 +143,178 @@ def execute_protocol(
             alice_features.values,
             eve_features.values,
         ),
+        blocks=blocks,
+    )
+
+
+def execute_protocol_batch(
+    alice_features: FloatArray,
+    bob_features: FloatArray,
+    eve_features: FloatArray,
+    quantizer: BatchQuantizer,
+    reconciler: BatchReconciler,
+    rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
+) -> TrialBatch:
+    """Run ``execute_protocol`` on every row of ``(trials, samples)`` features.
+
+    Rows that retain fewer than one reconciliation block are dropped, so the
+    returned batch may hold fewer trials than rows were given; callers redraw
+    the missing trials, as the per-trial runner does after a RuntimeError.
+    With ``multi_block`` the blocks of all trials are reconciled together,
+    one block per row of the batch, grouped by trial.
+    """
+    if not alice_features.shape == bob_features.shape == eve_features.shape:
+        raise ValueError("Alice, Bob and Eve features must have equal shape")
+    block_length = reconciler.block_length
+    prepared = quantizer.prepare_batch(alice_features, block_length)
+    rows = prepared.source_rows
+    alice_bits = prepared.bits
+    bob_bits = quantizer.apply_batch(bob_features[rows], prepared.metadata)
+    eve_bits = quantizer.apply_batch(eve_features[rows], prepared.metadata)
+    block_trials = np.arange(len(rows), dtype=np.int64)
+
+    if multi_block and len(rows):
+        # Thresholds are per row, so each row is quantized once for all its
+        # blocks: rows are grouped by block count, one prefix per group.
+        retained = np.rint(prepared.retention_rates * alice_features.shape[1])
+        row_blocks = (
+            retained.astype(np.int64)
+            * prepared.metadata.bits_per_sample
+            // block_length
+        )
+        alice_parts: list[BitArray] = []
+        bob_parts: list[BitArray] = []
+        eve_parts: list[BitArray] = []
+        trial_parts: list[NDArray[np.int64]] = []
+        for blocks in np.unique(row_blocks):
+            positions = np.flatnonzero(row_blocks == blocks)
+            if blocks == 1:
+                group = (
+                    alice_bits[positions],
+                    bob_bits[positions],
+                    eve_bits[positions],
+                )
+            else:
+                extended = quantizer.prepare_batch(
+                    alice_features[rows[positions]],
+                    int(blocks) * block_length,
+                )
+                group = (
+                    extended.bits,
+                    quantizer.apply_batch(
+                        bob_features[rows[positions]],
+                        extended.metadata,
+                    ),
+                    quantizer.apply_batch(
+                        eve_features[rows[positions]],
+                        extended.metadata,
+                    ),
+                )
+            for parts, bits in zip(
+                (alice_parts, bob_parts, eve_parts),
+                group,
+                strict=True,
+            ):
+                parts.append(bits.reshape(-1, block_length))
+            trial_parts.append(np.repeat(positions, blocks))
+        order = np.argsort(np.concatenate(trial_parts), kind="stable")
+        block_trials = np.concatenate(trial_parts)[order].astype(np.int64)
+        alice_bits, bob_bits, eve_bits = (
+            np.concatenate(parts)[order]
+            for parts in (alice_parts, bob_parts, eve_parts)
+        )
+
+    reconciliation = reconciler.create_transcripts(alice_bits, rng)
+    bob_reconciled = reconciler.reconcile_many(bob_bits, reconciliation)
+    eve_reconciled = reconciler.reconcile_many(eve_bits, reconciliation)
+
+    return TrialBatch(
+        alice_bits=alice_bits,
+        bob_bits=bob_bits,
+        eve_bits=eve_bits,
+        bob_reconciled_bits=bob_reconciled.bits,
+        eve_reconciled_bits=eve_reconciled.bits,
+        bob_success=bob_reconciled.success,
+        eve_success=eve_reconciled.success,
+        retention_rates=prepared.retention_rates,
+        alice_bob_observation_correlations=_row_correlations(
+            alice_features[rows],
+            bob_features[rows],
+        ),
+        alice_eve_observation_correlations=_row_correlations(
+            alice_features[rows],
+            eve_features[rows],
+        ),
+        source_length=alice_features.shape[1],
+        block_trials=block_trials,
+        source_rows=rows,
+    )
+
+
+def evaluate_eavesdroppers(
+    alice_bits: BitArray,
+    eve_features: FloatArray,
+    transcript: PublicTranscript,
+    quantizer: BatchQuantizer,
+    reconciler: BatchReconciler,
+) -> EavesdropperReport:
+    """Quantize and reconcile every row of ``eve_features`` against one trial.
+
+    ``alice_bits`` and ``transcript`` come from ``execute_protocol`` and the
+    rows of ``eve_features`` are Eves' observations of the same window. All
+    Eves go through a single ``apply_batch`` and a single ``reconcile_many``
+    call, one row per Eve and block.
+    """
+    features = as_real(eve_features)
+    quantization = transcript.quantization
+    if quantization is None:
+        raise ValueError("the transcript has no quantization metadata")
+    if features.ndim != 2:
+        raise ValueError("eve_features must be (eavesdroppers, samples)")
+    eavesdroppers = len(features)
+    block_length = reconciler.block_length
+    blocks = len(alice_bits) // block_length
+    eve_bits = quantizer.apply_batch(
+        features,
+        BatchQuantizationMetadata(
+            thresholds=np.full(eavesdroppers, quantization.threshold),
+            accepted_indices=np.tile(quantization.accepted_indices, (eavesdroppers, 1)),
+            source_length=quantization.source_length,
+            guard_band_widths=np.full(
+                eavesdroppers,
+                quantization.guard_band_width,
+            ),
+            level_thresholds=np.tile(
+                quantization.level_thresholds,
+                (eavesdroppers, 1),
+            ),
+            level_guard_band_widths=np.tile(
+                quantization.level_guard_band_widths,
+                (eavesdroppers, 1),
+            ),
+        ),
+    )
+    helper_data = transcript.reconciliation.helper_data.reshape(blocks, block_length)
+    reconciled = reconciler.reconcile_many(
+        eve_bits.reshape(eavesdroppers * blocks, block_length),
+        BatchReconciliationTranscript(
+            scheme=transcript.reconciliation.scheme,
+            helper_data=np.tile(helper_data, (eavesdroppers, 1)),
+            leakage_bits=transcript.reconciliation.leakage_bits // blocks,
+        ),
+    )
+    reconciled_bits = reconciled.bits.reshape(eve_bits.shape)
+    return EavesdropperReport(
+        eve_bits=eve_bits,
+        eve_reconciled_bits=reconciled_bits,
+        eve_success=np.all(
+            reconciled.success.reshape(eavesdroppers, blocks),
+            axis=1,
+        ),
+        raw_mismatch_rates=np.mean(eve_bits != alice_bits, axis=1),
+        reconciled_mismatch_rates=np.mean(reconciled_bits != alice_bits, axis=1),
     )
 
 
@@ -87,21 +332,45 @@ def amplify_reconciled_keys(
         rng,
     )
     transcript = replace(trial.transcript, privacy_seed=seed)
-    return FinalKeyResult(
-        alice_key=selected_amplifier.extract(
-            trial.alice_bits,
-            output_bits,
-            seed,
-        ),
-        bob_key=selected_amplifier.extract(
-            trial.bob_reconciled.bits,
-            output_bits,
-            seed,
-        ),
-        eve_key=selected_amplifier.extract(
-            trial.eve_reconciled.bits,
-            output_bits,
-            seed,
+    alice_key, bob_key, eve_key = selected_amplifier.extract_many(
+        np.stack(
+            [
+                trial.alice_bits,
+                trial.bob_reconciled.bits,
+                trial.eve_reconciled.bits,
+            ]
         ),
+        output_bits,
+        seed,
+    )
+    return FinalKeyResult(
+        alice_key=alice_key,
+        bob_key=bob_key,
+        eve_key=eve_key,
         transcript=transcript,
     )
+
+
+def amplify_trial_batch(
+    batch: TrialBatch,
+    output_bits: int,
+    rng: np.random.Generator,
+    amplifier: PrivacyAmplifier | None = None,
+) -> FinalKeyBatch:
+    """Batched ``amplify_reconciled_keys``: one public seed per block row."""
+    selected_amplifier = amplifier or ToeplitzHashAmplifier()
+    seeds = selected_amplifier.generate_seeds(
+        batch.blocks,
+        batch.block_length,
+        output_bits,
+        rng,
+    )
+    keys = selected_amplifier.extract_with_seeds(
+        np.concatenate(
+            [batch.alice_bits, batch.bob_reconciled_bits, batch.eve_reconciled_bits]
+        ),
+        output_bits,
+        np.tile(seeds, (3, 1)),
+    )
+    alice_keys, bob_keys, eve_keys = np.split(keys, 3)
+    return FinalKeyBatch(alice_keys=alice_keys, bob_keys=bob_keys, eve_keys=eve_keys)
@@ -1,12 +1,62 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+
+from plkg.core.bits import PackedBits
+from plkg.core.models import BitArray, FloatArray, as_bit_matrix, as_bits
+
+DENSE_TOEPLITZ_MAX_ENTRIES = 1 << 14
+
+
+def _toeplitz_dense(sources: BitArray, output_bits: int, seeds: BitArray) -> BitArray:
+    """Hash every row of ``sources`` with the row of ``seeds`` it broadcasts to."""
+    # Row i of a Toeplitz matrix is seed[output_bits - 1 - i:][:n]; each
+    # output bit is the parity of a packed AND, one popcount per word.
+    rows = sliding_window_view(seeds, sources.shape[1], axis=1)[:, ::-1]
+    matrices = PackedBits.from_bits(rows).words
+    packed_sources = PackedBits.from_bits(sources).words[:, None, :]
+    products = np.bitwise_and(matrices, packed_sources)
+    parities = np.bitwise_count(products).sum(axis=-1) & 1
+    result: BitArray = np.asarray(parities, dtype=np.uint8)
+    return result
 
-from plkg.core.models import BitArray, as_bits
 
+def _toeplitz_fft(sources: BitArray, output_bits: int, seeds: BitArray) -> BitArray:
+    """Toeplitz products as integer convolutions, O(n log n) per row.
 
+    Output bit i is the parity of convolution term ``n + m - 2 - i`` of the
+    seed with the reversed source. Terms are counts of at most ``n``, so
+    rounding the float64 result is exact for any practical key length.
+    """
+    input_bits = sources.shape[1]
+    size = fft.next_fast_len(seeds.shape[1] + input_bits - 1, real=True)
+    spectrum = fft.rfft(seeds.astype(np.float64), size, axis=1) * fft.rfft(
+        sources[:, ::-1].astype(np.float64),
+        size,
+        axis=1,
+    )
+    terms: FloatArray = fft.irfft(spectrum, size, axis=1)[
+        :, input_bits - 1 : input_bits + output_bits - 1
+    ][:, ::-1]
+    counts = np.rint(terms)
+    if np.max(np.abs(terms - counts), initial=0.0) > 0.25:
+        raise RuntimeError("FFT Toeplitz product lost integer precision")
+    return np.asarray(counts.astype(np.int64) & 1, dtype=np.uint8)
+
+
+@dataclass(frozen=True)
 class ToeplitzHashAmplifier:
-    """Two-universal binary hashing with a public Toeplitz seed."""
+    """Two-universal binary hashing with a public Toeplitz seed.
+
+    Matrices with at most ``dense_max_entries`` entries are multiplied
+    directly; larger ones use an FFT convolution with identical output.
+    """
+
+    dense_max_entries: int = DENSE_TOEPLITZ_MAX_ENTRIES
 
     def seed_length(self, input_bits: int, output_bits: int) -> int:
         if input_bits <= 0 or output_bits <= 0:
@@ -24,6 +74,17 @@ class ToeplitzHashAmplifier:
         length = self.seed_length(input_bits, output_bits)
         return rng.integers(0, 2, length, dtype=np.uint8)
 
+    def generate_seeds(
+        self,
+        count: int,
+        input_bits: int,
+        output_bits: int,
+        rng: np.random.Generator,
+    ) -> BitArray:
+        """One independent seed per row, for ``extract_with_seeds``."""
+        length = self.seed_length(input_bits, output_bits)
+        return rng.integers(0, 2, (count, length), dtype=np.uint8)
+
     def extract(
         self,
         bits: BitArray,
@@ -31,19 +92,45 @@ class ToeplitzHashAmplifier:
         public_seed: BitArray,
     ) -> BitArray:
         source = as_bits(bits)
-        expected_seed_length = self.seed_length(len(source), output_bits)
         seed = as_bits(public_seed, name="public_seed")
-        if len(seed) != expected_seed_length:
+        result: BitArray = self._hash(source[None, :], output_bits, seed[None, :])[0]
+        return result
+
+    def extract_many(
+        self,
+        bits: BitArray,
+        output_bits: int,
+        public_seed: BitArray,
+    ) -> BitArray:
+        """Hash every row of a ``(keys, input_bits)`` matrix with one seed."""
+        sources = as_bit_matrix(bits)
+        seed = as_bits(public_seed, name="public_seed")
+        return self._hash(sources, output_bits, seed[None, :])
+
+    def extract_with_seeds(
+        self,
+        bits: BitArray,
+        output_bits: int,
+        public_seeds: BitArray,
+    ) -> BitArray:
+        """Hash row ``i`` of ``bits`` with row ``i`` of ``public_seeds``."""
+        sources = as_bit_matrix(bits)
+        seeds = as_bit_matrix(public_seeds, name="public_seeds")
+        if len(seeds) != len(sources):
+            raise ValueError("expected one public seed per key")
+        return self._hash(sources, output_bits, seeds)
+
+    def _hash(
+        self,
+        sources: BitArray,
+        output_bits: int,
+        seeds: BitArray,
+    ) -> BitArray:
+        expected_seed_length = self.seed_length(sources.shape[1], output_bits)
+        if seeds.shape[1] != expected_seed_length:
             raise ValueError(
                 f"expected {expected_seed_length} public seed bits"
             )
-
-        row_indices = np.arange(output_bits)[:, None]
-        column_indices = np.arange(len(source))[None, :]
-        matrix_indices = column_indices - row_indices + output_bits - 1
-        toeplitz = seed[matrix_indices]
-        result: BitArray = np.asarray(
-            np.mod(toeplitz @ source, 2),
-            dtype=np.uint8,
-        )
-        return result
+        if output_bits * sources.shape[1] <= self.dense_max_entries:
+            return _toeplitz_dense(sources, output_bits, seeds)
+        return _toeplitz_fft(sources, output_bits, seeds)
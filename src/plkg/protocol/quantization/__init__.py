@@ -1,3 +1,14 @@
 from plkg.protocol.quantization.median_guard_band import MedianGuardBandQuantizer
+from plkg.protocol.quantization.multi_level import MultiLevelQuantizer, gray_code
+from plkg.protocol.quantization.sliding_median import (
+    SlidingMedianQuantizer,
+    SlidingWindowStatistics,
+)
 
-__all__ = ["MedianGuardBandQuantizer"]
+__all__ = [
+    "MedianGuardBandQuantizer",
+    "MultiLevelQuantizer",
+    "SlidingMedianQuantizer",
+    "SlidingWindowStatistics",
+    "gray_code",
+]
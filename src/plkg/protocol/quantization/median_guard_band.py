@@ -4,10 +4,14 @@ import numpy as np
 from numpy.typing import NDArray
 
 from plkg.core.models import (
+    BatchQuantizationMetadata,
+    BatchQuantizationResult,
     BitArray,
     FeatureSeries,
+    FloatArray,
     QuantizationMetadata,
     QuantizationResult,
+    as_real,
 )
 
 
@@ -60,3 +64,56 @@ class MedianGuardBandQuantizer:
         return (
             features.values[metadata.accepted_indices] > metadata.threshold
         ).astype(np.uint8)
+
+    def prepare_batch(
+        self,
+        values: FloatArray,
+        block_length: int,
+    ) -> BatchQuantizationResult:
+        """Quantize every row and keep its first ``block_length`` accepted bits.
+
+        Each row uses its own median and standard deviation, exactly as
+        ``prepare`` does for a single window. Rows retaining fewer than
+        ``block_length`` samples are left out of the result.
+        """
+        matrix = as_real(values)
+        if matrix.ndim != 2:
+            raise ValueError("batched features must be two-dimensional")
+        if block_length <= 0:
+            raise ValueError("block_length must be positive")
+
+        thresholds = np.median(matrix, axis=1)
+        widths = self.guard_band_sigma * np.std(matrix, axis=1)
+        if self.guard_band_sigma == 0:
+            retained = np.ones(matrix.shape, dtype=np.bool_)
+        else:
+            retained = np.abs(matrix - thresholds[:, None]) > widths[:, None]
+        counts = np.count_nonzero(retained, axis=1)
+        source_rows = np.flatnonzero(counts >= block_length)
+
+        selected = retained[source_rows]
+        selected &= np.cumsum(selected, axis=1) <= block_length
+        accepted = np.nonzero(selected)[1].reshape(len(source_rows), block_length)
+        metadata = BatchQuantizationMetadata(
+            thresholds=thresholds[source_rows],
+            accepted_indices=accepted,
+            source_length=matrix.shape[1],
+            guard_band_widths=widths[source_rows],
+        )
+        return BatchQuantizationResult(
+            bits=self.apply_batch(matrix[source_rows], metadata),
+            metadata=metadata,
+            retention_rates=counts[source_rows] / max(matrix.shape[1], 1),
+            source_rows=source_rows,
+        )
+
+    def apply_batch(
+        self,
+        values: FloatArray,
+        metadata: BatchQuantizationMetadata,
+    ) -> BitArray:
+        matrix = as_real(values)
+        if matrix.shape != (metadata.rows, metadata.source_length):
+            raise ValueError("observer features do not match transcript shape")
+        observed = np.take_along_axis(matrix, metadata.accepted_indices, axis=1)
+        return (observed > metadata.thresholds[:, None]).astype(np.uint8)
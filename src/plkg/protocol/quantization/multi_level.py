@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import (
+    BatchQuantizationMetadata,
+    BatchQuantizationResult,
+    BitArray,
+    FeatureSeries,
+    FloatArray,
+    QuantizationMetadata,
+    QuantizationResult,
+    as_real,
+)
+
+MAX_BITS_PER_SAMPLE = 8
+
+
+def gray_code(levels: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Reflected binary code of level indices; neighbours differ in one bit."""
+    return levels ^ (levels >> 1)
+
+
+def _cells(matrix: FloatArray, thresholds: FloatArray) -> NDArray[np.int64]:
+    """Level of every sample: how many of its row's thresholds it exceeds."""
+    exceeded = matrix[..., None] > thresholds[:, None, :]
+    return np.asarray(np.count_nonzero(exceeded, axis=2), dtype=np.int64)
+
+
+class MultiLevelQuantizer:
+    """Equiprobable ``2**bits_per_sample``-level quantizer with Gray coding.
+
+    Alice's thresholds are the ``k / 2**bits`` quantiles of her window, so
+    every level is equally likely and each retained sample carries
+    ``bits_per_sample`` bits, most significant first. Gray coding makes a
+    disagreement between adjacent levels, the usual one, cost a single bit.
+    The guard band of each threshold is ``guard_band_sigma`` times the
+    standard deviation of the samples in the two levels it separates, so it
+    narrows where levels are dense; a sample inside any guard band is
+    dropped whole. With one bit this is ``MedianGuardBandQuantizer``.
+    """
+
+    def __init__(
+        self,
+        bits_per_sample: int = 2,
+        guard_band_sigma: float = 0.0,
+    ) -> None:
+        if not 1 <= bits_per_sample <= MAX_BITS_PER_SAMPLE:
+            raise ValueError(
+                f"bits_per_sample must be in [1, {MAX_BITS_PER_SAMPLE}]"
+            )
+        if guard_band_sigma < 0:
+            raise ValueError("guard_band_sigma cannot be negative")
+        self.bits_per_sample = bits_per_sample
+        self.guard_band_sigma = guard_band_sigma
+
+    @property
+    def levels(self) -> int:
+        return 1 << self.bits_per_sample
+
+    def _quantize(
+        self,
+        matrix: FloatArray,
+    ) -> tuple[FloatArray, FloatArray, NDArray[np.bool_]]:
+        """Per-row thresholds, guard band widths and retained samples."""
+        rows = len(matrix)
+        levels = self.levels
+        probabilities = np.arange(1, levels) / levels
+        thresholds = np.quantile(matrix, probabilities, axis=1).T
+        if self.guard_band_sigma == 0:
+            return (
+                thresholds,
+                np.zeros_like(thresholds),
+                np.ones(matrix.shape, dtype=np.bool_),
+            )
+
+        # Per-level moments from one bincount over (row, level) pairs;
+        # centring each row first keeps the variances accurate.
+        centred = matrix - np.mean(matrix, axis=1, keepdims=True)
+        flat = (
+            np.arange(rows, dtype=np.int64)[:, None] * levels
+            + _cells(matrix, thresholds)
+        ).ravel()
+        count, total, squares = (
+            np.bincount(flat, weights=weights, minlength=rows * levels).reshape(
+                rows,
+                levels,
+            )
+            for weights in (None, centred.ravel(), centred.ravel() ** 2)
+        )
+        pair_count = np.maximum(count[:, :-1] + count[:, 1:], 1)
+        pair_mean = (total[:, :-1] + total[:, 1:]) / pair_count
+        pair_variance = (squares[:, :-1] + squares[:, 1:]) / pair_count
+        widths = self.guard_band_sigma * np.sqrt(
+            np.maximum(pair_variance - pair_mean**2, 0.0)
+        )
+        distances = np.abs(matrix[..., None] - thresholds[:, None, :])
+        retained = np.all(distances > widths[:, None, :], axis=2)
+        return thresholds, widths, retained
+
+    def _metadata(
+        self,
+        thresholds: FloatArray,
+        widths: FloatArray,
+        accepted: NDArray[np.int64],
+        source_length: int,
+    ) -> BatchQuantizationMetadata:
+        middle = (self.levels - 1) // 2
+        return BatchQuantizationMetadata(
+            thresholds=thresholds[:, middle],
+            accepted_indices=accepted,
+            source_length=source_length,
+            guard_band_widths=widths[:, middle],
+            level_thresholds=thresholds,
+            level_guard_band_widths=widths,
+        )
+
+    def prepare(self, features: FeatureSeries) -> QuantizationResult:
+        values = features.values
+        if len(values) == 0:
+            metadata = QuantizationMetadata(
+                threshold=0.0,
+                accepted_indices=np.array([], dtype=np.int64),
+                source_length=0,
+                guard_band_width=0.0,
+                level_thresholds=np.zeros(self.levels - 1),
+                level_guard_band_widths=np.zeros(self.levels - 1),
+            )
+            return QuantizationResult(
+                bits=np.array([], dtype=np.uint8),
+                metadata=metadata,
+            )
+
+        matrix = values[None, :]
+        thresholds, widths, retained = self._quantize(matrix)
+        accepted = np.repeat(
+            np.flatnonzero(retained[0]).astype(np.int64),
+            self.bits_per_sample,
+        )
+        batch = self._metadata(thresholds, widths, accepted[None, :], len(values))
+        metadata = batch.row(0)
+        return QuantizationResult(
+            bits=self.apply_batch(matrix, batch)[0],
+            metadata=metadata,
+        )
+
+    def apply(
+        self,
+        features: FeatureSeries,
+        metadata: QuantizationMetadata,
+    ) -> BitArray:
+        if len(features.values) != metadata.source_length:
+            raise ValueError("observer features do not match transcript length")
+        batch = BatchQuantizationMetadata(
+            thresholds=np.array([metadata.threshold]),
+            accepted_indices=metadata.accepted_indices[None, :],
+            source_length=metadata.source_length,
+            guard_band_widths=np.array([metadata.guard_band_width]),
+            level_thresholds=metadata.level_thresholds[None, :],
+            level_guard_band_widths=metadata.level_guard_band_widths[None, :],
+        )
+        bits: BitArray = self.apply_batch(features.values[None, :], batch)[0]
+        return bits
+
+    def prepare_batch(
+        self,
+        values: FloatArray,
+        block_length: int,
+    ) -> BatchQuantizationResult:
+        """Quantize every row and keep its first ``block_length`` bits.
+
+        A row needs ``ceil(block_length / bits_per_sample)`` retained
+        samples; the last of them may contribute only its leading bits.
+        Retention rates count samples, not bits.
+        """
+        matrix = as_real(values)
+        if matrix.ndim != 2:
+            raise ValueError("batched features must be two-dimensional")
+        if block_length <= 0:
+            raise ValueError("block_length must be positive")
+
+        thresholds, widths, retained = self._quantize(matrix)
+        needed = -(-block_length // self.bits_per_sample)
+        counts = np.count_nonzero(retained, axis=1)
+        source_rows = np.flatnonzero(counts >= needed)
+
+        selected = retained[source_rows]
+        selected &= np.cumsum(selected, axis=1) <= needed
+        samples = np.nonzero(selected)[1].reshape(len(source_rows), needed)
+        accepted = np.repeat(samples, self.bits_per_sample, axis=1)[:, :block_length]
+        metadata = self._metadata(
+            thresholds[source_rows],
+            widths[source_rows],
+            accepted,
+            matrix.shape[1],
+        )
+        return BatchQuantizationResult(
+            bits=self.apply_batch(matrix[source_rows], metadata),
+            metadata=metadata,
+            retention_rates=counts[source_rows] / max(matrix.shape[1], 1),
+            source_rows=source_rows,
+        )
+
+    def apply_batch(
+        self,
+        values: FloatArray,
+        metadata: BatchQuantizationMetadata,
+    ) -> BitArray:
+        matrix = as_real(values)
+        if matrix.shape != (metadata.rows, metadata.source_length):
+            raise ValueError("observer features do not match transcript shape")
+        if metadata.bits_per_sample != self.bits_per_sample or (
+            metadata.level_thresholds.shape[1] == 0
+        ):
+            raise ValueError(
+                f"the transcript was not made by a {self.bits_per_sample}-bit "
+                "multi-level quantizer"
+            )
+        observed = np.take_along_axis(matrix, metadata.accepted_indices, axis=1)
+        codes = gray_code(_cells(observed, metadata.level_thresholds))
+        positions = np.arange(observed.shape[1]) % self.bits_per_sample
+        shifts = self.bits_per_sample - 1 - positions
+        return ((codes >> shifts) & 1).astype(np.uint8)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import (
+    BitArray,
+    FeatureSeries,
+    FloatArray,
+    QuantizationMetadata,
+    QuantizationResult,
+    StreamQuantizationBlock,
+)
+from plkg.protocol.quantization.median_guard_band import MedianGuardBandQuantizer
+
+
+class SlidingWindowStatistics:
+    """Median and standard deviation of the last ``window_samples`` values.
+
+    The median comes from two heaps split at the middle of the window, a
+    max-heap of the lower half and a min-heap of the upper half. Values
+    leaving the window are deleted lazily, when they reach the top of
+    their heap, so each update costs O(log w). The mean and sum of squared
+    deviations are updated in place (Welford's recurrence) and recomputed
+    once per window, and the median and deviation match ``np.median`` and
+    ``np.std`` over the window.
+    """
+
+    def __init__(self, window_samples: int) -> None:
+        if window_samples <= 0:
+            raise ValueError("window_samples must be positive")
+        self.window_samples = window_samples
+        self._window: deque[tuple[float, int]] = deque()
+        self._lower: list[tuple[float, int]] = []
+        self._upper: list[tuple[float, int]] = []
+        self._in_lower: dict[int, bool] = {}
+        self._lower_size = 0
+        self._upper_size = 0
+        self._pushed = 0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def full(self) -> bool:
+        return len(self._window) == self.window_samples
+
+    @property
+    def median(self) -> float:
+        if not self._window:
+            raise ValueError("the window is empty")
+        if self._lower_size > self._upper_size:
+            return -self._lower[0][0]
+        return (-self._lower[0][0] + self._upper[0][0]) / 2.0
+
+    @property
+    def std(self) -> float:
+        if not self._window:
+            raise ValueError("the window is empty")
+        return math.sqrt(max(0.0, self._squares / len(self._window)))
+
+    def push(self, value: float) -> None:
+        value = float(value)
+        index = self._pushed
+        self._pushed += 1
+        if self._lower_size and value <= -self._lower[0][0]:
+            heapq.heappush(self._lower, (-value, index))
+            self._in_lower[index] = True
+            self._lower_size += 1
+        else:
+            heapq.heappush(self._upper, (value, index))
+            self._in_lower[index] = False
+            self._upper_size += 1
+        self._window.append((value, index))
+
+        if len(self._window) > self.window_samples:
+            removed, removed_index = self._window.popleft()
+            if self._in_lower.pop(removed_index):
+                self._lower_size -= 1
+            else:
+                self._upper_size -= 1
+            count = len(self._window)
+            if index % count == 0:
+                # Recompute once per window so rounding cannot build up.
+                values = np.fromiter((item[0] for item in self._window), float)
+                self._mean = float(np.mean(values))
+                self._squares = float(np.sum((values - self._mean) ** 2))
+            else:
+                # Sliding Welford update for a window of constant size.
+                mean = self._mean + (value - removed) / count
+                self._squares += (value - removed) * (
+                    value - mean + removed - self._mean
+                )
+                self._mean = mean
+        else:
+            count = len(self._window)
+            mean = self._mean + (value - self._mean) / count
+            self._squares += (value - self._mean) * (value - mean)
+            self._mean = mean
+        self._rebalance()
+
+    def _prune(self) -> None:
+        for heap in (self._lower, self._upper):
+            while heap and heap[0][1] not in self._in_lower:
+                heapq.heappop(heap)
+            if len(heap) > 2 * self.window_samples + 16:
+                heap[:] = [item for item in heap if item[1] in self._in_lower]
+                heapq.heapify(heap)
+
+    def _rebalance(self) -> None:
+        self._prune()
+        while self._lower_size > self._upper_size + 1:
+            value, index = heapq.heappop(self._lower)
+            heapq.heappush(self._upper, (-value, index))
+            self._in_lower[index] = False
+            self._lower_size -= 1
+            self._upper_size += 1
+            self._prune()
+        while self._upper_size > self._lower_size:
+            value, index = heapq.heappop(self._upper)
+            heapq.heappush(self._lower, (-value, index))
+            self._in_lower[index] = True
+            self._upper_size -= 1
+            self._lower_size += 1
+            self._prune()
+
+
+class SlidingMedianQuantizer:
+    """Streaming median quantizer for continuous measurement sessions.
+
+    The first ``window_samples`` values only fill the sliding window. From
+    then on every block freezes the window's median as its threshold and
+    ``guard_band_sigma`` times its deviation as its guard band, and each
+    arriving value is accepted or rejected at once, so its bit and public
+    index are known before the block is complete. A block closes after
+    ``block_length`` accepted bits; its ``QuantizationMetadata`` covers the
+    stream segment since the previous block, which other observers quantize
+    with ``apply``. The window keeps sliding over every value, so memory is
+    O(window_samples) however long the session runs.
+    """
+
+    def __init__(
+        self,
+        window_samples: int,
+        block_length: int,
+        guard_band_sigma: float = 0.0,
+    ) -> None:
+        if block_length <= 0:
+            raise ValueError("block_length must be positive")
+        if guard_band_sigma < 0:
+            raise ValueError("guard_band_sigma cannot be negative")
+        self.statistics = SlidingWindowStatistics(window_samples)
+        self.block_length = block_length
+        self.guard_band_sigma = guard_band_sigma
+        self.samples_seen = 0
+        self._block_start = window_samples
+        self._threshold = 0.0
+        self._width = 0.0
+        self._bits: list[int] = []
+        self._accepted: list[int] = []
+
+    @property
+    def pending_bits(self) -> BitArray:
+        """Bits of the open block emitted so far."""
+        return np.asarray(self._bits, dtype=np.uint8)
+
+    @property
+    def pending_indices(self) -> NDArray[np.int64]:
+        """Segment positions of ``pending_bits``, public as they are emitted."""
+        return np.asarray(self._accepted, dtype=np.int64)
+
+    def push(self, value: float) -> StreamQuantizationBlock | None:
+        """Quantize one value; return the block it completes, if any."""
+        value = float(value)
+        position = self.samples_seen - self._block_start
+        self.samples_seen += 1
+        block = None
+        if position >= 0:
+            if position == 0:
+                self._threshold = self.statistics.median
+                self._width = self.guard_band_sigma * self.statistics.std
+            if (
+                self.guard_band_sigma == 0
+                or abs(value - self._threshold) > self._width
+            ):
+                self._bits.append(int(value > self._threshold))
+                self._accepted.append(position)
+            if len(self._bits) == self.block_length:
+                block = self._close_block(position + 1)
+        self.statistics.push(value)
+        return block
+
+    def extend(self, values: FloatArray) -> list[StreamQuantizationBlock]:
+        """``push`` every value in order and return the completed blocks."""
+        blocks = []
+        for value in np.asarray(values, dtype=np.float64).ravel().tolist():
+            block = self.push(value)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
+    def _close_block(self, source_length: int) -> StreamQuantizationBlock:
+        result = QuantizationResult(
+            bits=self.pending_bits,
+            metadata=QuantizationMetadata(
+                threshold=self._threshold,
+                accepted_indices=self.pending_indices,
+                source_length=source_length,
+                guard_band_width=self._width,
+            ),
+        )
+        block = StreamQuantizationBlock(start=self._block_start, result=result)
+        self._block_start += source_length
+        self._bits = []
+        self._accepted = []
+        return block
+
+    def apply(
+        self,
+        features: FeatureSeries,
+        metadata: QuantizationMetadata,
+    ) -> BitArray:
+        """Quantize another observer's samples of one emitted block."""
+        return MedianGuardBandQuantizer(self.guard_band_sigma).apply(
+            features,
+            metadata,
+        )
@@ -1,13 +1,25 @@
 from plkg.protocol.reconciliation.bch import (
     BCH_CONFIGURATIONS,
     BchCodec,
+    BchCodeTables,
+    clear_bch_codec_registry,
     create_bch_codec,
+    load_bch_codec,
 )
 from plkg.protocol.reconciliation.code_offset import BchCodeOffsetReconciler
+from plkg.protocol.reconciliation.syndrome import (
+    SYNDROME_TABLE_BUDGET_BYTES,
+    SyndromeTableDecoder,
+)
 
 __all__ = [
     "BCH_CONFIGURATIONS",
-    "BchCodec",
+    "SYNDROME_TABLE_BUDGET_BYTES",
     "BchCodeOffsetReconciler",
+    "BchCodeTables",
+    "BchCodec",
+    "SyndromeTableDecoder",
+    "clear_bch_codec_registry",
     "create_bch_codec",
+    "load_bch_codec",
 ]
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import galois
 import numpy as np
+from numpy.typing import NDArray
 
-from plkg.core.models import BitArray, as_bits
+from plkg.core.models import BitArray, BoolArray, as_bit_matrix, as_bits
+from plkg.protocol.reconciliation.syndrome import (
+    SYNDROME_TABLE_BUDGET_BYTES,
+    SyndromeTableDecoder,
+    syndrome_table_bytes,
+)
 
 BCH_CONFIGURATIONS = {
     7: (4, 1),
@@ -13,50 +21,194 @@ BCH_CONFIGURATIONS = {
     127: (64, 10),
     255: (139, 15),
 }
+BCH_CACHE_DIR_ENV = "PLKG_BCH_CACHE_DIR"
+
+
+@dataclass(frozen=True)
+class BchCodeTables:
+    """Binary tables derived from a BCH code, storable without galois.
+
+    ``irreducible_poly`` is the integer form of the polynomial that defines
+    the extension field, so a galois code rebuilt from these tables has the
+    same generator matrix.
+    """
+
+    n: int
+    k: int
+    t: int
+    irreducible_poly: int
+    generator_matrix: BitArray
+    parity_check_matrix: BitArray
+
+    def __post_init__(self) -> None:
+        generator = np.asarray(self.generator_matrix, dtype=np.uint8)
+        parity_check = np.asarray(self.parity_check_matrix, dtype=np.uint8)
+        if generator.shape != (self.k, self.n):
+            raise ValueError(f"generator_matrix must have shape ({self.k}, {self.n})")
+        if parity_check.shape != (self.n - self.k, self.n):
+            raise ValueError(
+                f"parity_check_matrix must have shape ({self.n - self.k}, {self.n})"
+            )
+        object.__setattr__(self, "generator_matrix", generator)
+        object.__setattr__(self, "parity_check_matrix", parity_check)
+
+    @classmethod
+    def from_code(cls, code: galois.BCH) -> BchCodeTables:
+        return cls(
+            n=int(code.n),
+            k=int(code.k),
+            t=int(code.t),
+            irreducible_poly=int(code.extension_field.irreducible_poly),
+            generator_matrix=np.asarray(code.G, dtype=np.uint8),
+            parity_check_matrix=np.asarray(code.H, dtype=np.uint8),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> BchCodeTables:
+        with np.load(path) as data:
+            return cls(
+                n=int(data["n"]),
+                k=int(data["k"]),
+                t=int(data["t"]),
+                irreducible_poly=int(data["irreducible_poly"]),
+                generator_matrix=data["generator_matrix"],
+                parity_check_matrix=data["parity_check_matrix"],
+            )
+
+    def save(self, path: Path) -> None:
+        """Write atomically, so concurrent workers never read a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with partial.open("wb") as output:
+            np.savez(
+                output,
+                n=self.n,
+                k=self.k,
+                t=self.t,
+                irreducible_poly=self.irreducible_poly,
+                generator_matrix=self.generator_matrix,
+                parity_check_matrix=self.parity_check_matrix,
+            )
+        os.replace(partial, path)
+
+    def build_code(self) -> galois.BCH:
+        degree = self.n.bit_length()
+        extension_field = galois.GF(2**degree, irreducible_poly=self.irreducible_poly)
+        code = galois.BCH(
+            self.n,
+            self.k,
+            2 * self.t + 1,
+            extension_field=extension_field,
+        )
+        generator = np.asarray(code.G, dtype=np.uint8)
+        if not np.array_equal(generator, self.generator_matrix):
+            raise ValueError("cached BCH tables do not match the rebuilt code")
+        return code
 
 
 @dataclass(frozen=True)
 class BchCodec:
-    code: galois.BCH
+    """BCH codec that encodes from its tables and decodes with galois.
+
+    The galois code is only needed for decoding and is built on first use,
+    since building it compiles numba kernels once per process. Short codes
+    carry a ``syndrome_decoder`` instead and never build it.
+    """
+
+    tables: BchCodeTables
+    syndrome_decoder: SyndromeTableDecoder | None = field(default=None, repr=False)
+    _code: galois.BCH | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def code(self) -> galois.BCH:
+        code = self._code
+        if code is None:
+            code = self.tables.build_code()
+            object.__setattr__(self, "_code", code)
+        return code
+
+    @property
+    def decoder(self) -> str:
+        return "galois" if self.syndrome_decoder is None else "syndrome_table"
 
     @property
     def n(self) -> int:
-        return int(self.code.n)
+        return self.tables.n
 
     @property
     def k(self) -> int:
-        return int(self.code.k)
+        return self.tables.k
 
     @property
     def t(self) -> int:
-        return int(self.code.t)
+        return self.tables.t
 
     def encode(self, information_bits: BitArray) -> BitArray:
         bits = as_bits(information_bits, name="information_bits")
         if len(bits) != self.k:
             raise ValueError(f"expected {self.k} information bits")
-        return np.asarray(self.code.encode(bits), dtype=np.uint8)
+        codeword: BitArray = self.encode_many(bits[None, :])[0]
+        return codeword
+
+    def encode_many(self, information_bits: BitArray) -> BitArray:
+        """Encode a ``(blocks, k)`` matrix of messages with one matrix product."""
+        bits = as_bit_matrix(information_bits, name="information_bits")
+        if bits.shape[1] != self.k:
+            raise ValueError(f"expected {self.k} information bits per block")
+        generator = self.tables.generator_matrix
+        return np.asarray(
+            np.bitwise_and(bits.astype(np.int64) @ generator, 1),
+            dtype=np.uint8,
+        )
 
     def decode_codeword(self, received_bits: BitArray) -> tuple[BitArray, int | None]:
         received = as_bits(received_bits, name="received_bits")
         if len(received) != self.n:
             raise ValueError(f"expected a codeword with {self.n} bits")
-        try:
-            message = self.code.decode(received)
-            corrected = np.asarray(self.code.encode(message), dtype=np.uint8)
-        except (ValueError, ArithmeticError, RuntimeError):
+        corrected, success, errors = self.decode_many(received[None, :])
+        if not success[0]:
             return received.copy(), None
+        return corrected[0], int(errors[0])
 
-        corrected_errors = int(np.count_nonzero(corrected != received))
-        if corrected_errors > self.t:
-            return received.copy(), None
-        return corrected, corrected_errors
+    def decode_many(
+        self,
+        received_bits: BitArray,
+    ) -> tuple[BitArray, BoolArray, NDArray[np.int64]]:
+        """Decode a ``(blocks, n)`` matrix in one call.
 
+        Returns the corrected codewords, per-row success flags and the number
+        of corrected errors reported by the decoder, ``-1`` where decoding
+        failed. Failed rows are returned unchanged.
+        """
+        received = as_bit_matrix(received_bits, name="received_bits")
+        if received.shape[1] != self.n:
+            raise ValueError(f"expected codewords with {self.n} bits")
+        if self.syndrome_decoder is not None:
+            return self.syndrome_decoder.decode_many(received)
+        if len(received) == 0:
+            return received.copy(), np.zeros(0, dtype=np.bool_), np.zeros(
+                0,
+                dtype=np.int64,
+            )
+        decoded, errors = self.code.decode(received, output="codeword", errors=True)
+        corrected_errors = np.asarray(errors, dtype=np.int64)
+        success = (corrected_errors >= 0) & (corrected_errors <= self.t)
+        corrected = np.where(
+            success[:, None],
+            np.asarray(decoded, dtype=np.uint8),
+            received,
+        )
+        corrected_errors[~success] = -1
+        return corrected, success, corrected_errors
 
-def create_bch_codec(
+
+_CODEC_REGISTRY: dict[tuple[int, int, int], BchCodec] = {}
+
+
+def _configuration(
     block_length: int,
-    information_length: int | None = None,
-) -> BchCodec:
+    information_length: int | None,
+) -> tuple[int, int]:
     try:
         expected_k, correction_capacity = BCH_CONFIGURATIONS[block_length]
     except KeyError as error:
@@ -70,6 +222,78 @@ def create_bch_codec(
             f"BCH({block_length}, {information_length}) is unsupported; "
             f"expected k={expected_k}"
         )
+    return expected_k, correction_capacity
+
+
+def _with_decoder(
+    tables: BchCodeTables,
+    code: galois.BCH | None,
+    syndrome_table_budget: int,
+) -> BchCodec:
+    syndrome_decoder = None
+    if syndrome_table_bytes(tables.n, tables.k) <= syndrome_table_budget:
+        syndrome_decoder = SyndromeTableDecoder.from_parity_check(
+            tables.parity_check_matrix,
+            tables.t,
+        )
+    return BchCodec(tables, syndrome_decoder, code)
+
+
+def load_bch_codec(
+    block_length: int,
+    information_length: int | None = None,
+    *,
+    cache_dir: str | Path | None = None,
+    syndrome_table_budget: int = SYNDROME_TABLE_BUDGET_BYTES,
+) -> BchCodec:
+    """Build a codec without the registry, reusing tables from ``cache_dir``.
+
+    Without a cache the galois code is built immediately and its tables are
+    written to ``cache_dir`` when one is given. Codes whose syndrome table
+    fits in ``syndrome_table_budget`` bytes decode by table lookup; pass 0 to
+    always decode with galois.
+    """
+    k, t = _configuration(block_length, information_length)
+    path = (
+        None
+        if cache_dir is None
+        else Path(cache_dir) / f"bch_{block_length}_{k}_{t}.npz"
+    )
+    if path is not None and path.exists():
+        tables = BchCodeTables.load(path)
+        if (tables.n, tables.k, tables.t) == (block_length, k, t):
+            return _with_decoder(tables, None, syndrome_table_budget)
+
+    code = galois.BCH(block_length, k, 2 * t + 1)
+    tables = BchCodeTables.from_code(code)
+    if path is not None:
+        tables.save(path)
+    return _with_decoder(tables, code, syndrome_table_budget)
+
+
+def create_bch_codec(
+    block_length: int,
+    information_length: int | None = None,
+    *,
+    cache_dir: str | Path | None = None,
+) -> BchCodec:
+    """Return the process-wide codec for ``block_length``.
+
+    Codecs are memoized by ``(n, k, t)``, so construction is paid once per
+    process. On a registry miss the tables are read from ``cache_dir``, or
+    from the directory in ``PLKG_BCH_CACHE_DIR``, when available. Codes
+    whose syndrome table fits in ``SYNDROME_TABLE_BUDGET_BYTES`` (BCH(7) and
+    BCH(15)) decode by table lookup.
+    """
+    k, t = _configuration(block_length, information_length)
+    key = (block_length, k, t)
+    codec = _CODEC_REGISTRY.get(key)
+    if codec is None:
+        directory = cache_dir or os.environ.get(BCH_CACHE_DIR_ENV) or None
+        codec = load_bch_codec(block_length, k, cache_dir=directory)
+        codec = _CODEC_REGISTRY.setdefault(key, codec)
+    return codec
+
 
-    minimum_distance = 2 * correction_capacity + 1
-    return BchCodec(galois.BCH(block_length, expected_k, minimum_distance))
+def clear_bch_codec_registry() -> None:
+    _CODEC_REGISTRY.clear()
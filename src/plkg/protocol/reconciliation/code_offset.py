@@ -4,9 +4,12 @@ import numpy as np
 
 from plkg.core.bits import xor_bits
 from plkg.core.models import (
+    BatchReconciliationResult,
+    BatchReconciliationTranscript,
     BitArray,
     ReconciliationResult,
     ReconciliationTranscript,
+    as_bit_matrix,
     as_bits,
 )
 from plkg.protocol.reconciliation.bch import BchCodec
@@ -20,6 +23,10 @@ class BchCodeOffsetReconciler:
     def block_length(self) -> int:
         return self.codec.n
 
+    @property
+    def scheme(self) -> str:
+        return f"BCH({self.codec.n},{self.codec.k})-code-offset"
+
     def create_transcript(
         self,
         reference_bits: BitArray,
@@ -32,7 +39,7 @@ class BchCodeOffsetReconciler:
         codeword = self.codec.encode(message)
         helper_data = xor_bits(reference, codeword)
         return ReconciliationTranscript(
-            scheme=f"BCH({self.codec.n},{self.codec.k})-code-offset",
+            scheme=self.scheme,
             helper_data=helper_data,
             leakage_bits=self.codec.n - self.codec.k,
         )
@@ -58,3 +65,45 @@ class BchCodeOffsetReconciler:
             success=corrected_errors is not None,
             corrected_errors=corrected_errors,
         )
+
+    def create_transcripts(
+        self,
+        reference_bits: BitArray,
+        rng: np.random.Generator,
+    ) -> BatchReconciliationTranscript:
+        """Offset every row of a ``(blocks, n)`` matrix by a random codeword."""
+        reference = as_bit_matrix(reference_bits, name="reference_bits")
+        if reference.shape[1] != self.codec.n:
+            raise ValueError(f"expected {self.codec.n} reference bits per block")
+        messages = rng.integers(
+            0,
+            2,
+            (len(reference), self.codec.k),
+            dtype=np.uint8,
+        )
+        return BatchReconciliationTranscript(
+            scheme=self.scheme,
+            helper_data=reference ^ self.codec.encode_many(messages),
+            leakage_bits=self.codec.n - self.codec.k,
+        )
+
+    def reconcile_many(
+        self,
+        observed_bits: BitArray,
+        transcript: BatchReconciliationTranscript,
+    ) -> BatchReconciliationResult:
+        """Reconcile every row against the helper data of the same row."""
+        observed = as_bit_matrix(observed_bits, name="observed_bits")
+        if observed.shape[1] != self.codec.n:
+            raise ValueError(f"expected {self.codec.n} observed bits per block")
+        if transcript.helper_data.shape != observed.shape:
+            raise ValueError("transcript does not match the observed blocks")
+
+        corrected, success, corrected_errors = self.codec.decode_many(
+            observed ^ transcript.helper_data
+        )
+        return BatchReconciliationResult(
+            bits=transcript.helper_data ^ corrected,
+            success=success,
+            corrected_errors=corrected_errors,
+        )
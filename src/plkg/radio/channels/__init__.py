@@ -1,19 +1,48 @@
+from plkg.radio.channels.jakes import jakes_spectrum_weights, sample_jakes_channel
 from plkg.radio.channels.mobility import (
     coherence_time_s,
+    doppler_coherence_time_s,
     doppler_frequency_hz,
     jakes_correlation,
 )
+from plkg.radio.channels.ofdm import (
+    OfdmGrid,
+    PowerDelayProfile,
+    iter_ofdm_channel,
+    ofdm_frequency_response,
+    sample_ofdm_channel,
+    sample_ofdm_taps,
+)
 from plkg.radio.channels.rayleigh import (
     add_complex_estimation_noise,
     correlated_complex_channel,
+    joint_channel_factor,
+    mix_correlated_channel,
+    mix_joint_channels,
+    observer_correlation_matrix,
+    sample_joint_channels,
     sample_rayleigh_channel,
 )
 
 __all__ = [
+    "OfdmGrid",
+    "PowerDelayProfile",
     "add_complex_estimation_noise",
     "coherence_time_s",
     "correlated_complex_channel",
+    "doppler_coherence_time_s",
     "doppler_frequency_hz",
+    "iter_ofdm_channel",
     "jakes_correlation",
+    "jakes_spectrum_weights",
+    "joint_channel_factor",
+    "mix_correlated_channel",
+    "mix_joint_channels",
+    "observer_correlation_matrix",
+    "ofdm_frequency_response",
+    "sample_jakes_channel",
+    "sample_joint_channels",
+    "sample_ofdm_channel",
+    "sample_ofdm_taps",
     "sample_rayleigh_channel",
 ]
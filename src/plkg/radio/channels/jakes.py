@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy import fft
+
+from plkg.core.models import (
+    ComplexArray,
+    FloatArray,
+    Precision,
+    complex_dtype,
+    real_dtype,
+)
+
+MIN_DOPPLER_CYCLES = 8
+MAX_SEQUENCE_LENGTH = 1 << 20
+MAX_CHUNK_ELEMENTS = 1 << 22
+
+
+def _doppler_cdf(frequencies: FloatArray, doppler_hz: float) -> FloatArray:
+    """CDF of the Doppler shift ``doppler_hz * cos(angle)``, angle uniform."""
+    ratio = np.clip(frequencies / doppler_hz, -1.0, 1.0)
+    return np.asarray(1.0 - np.arccos(ratio) / np.pi, dtype=np.float64)
+
+
+def jakes_spectrum_weights(
+    samples: int,
+    doppler_hz: float,
+    sample_interval_s: float,
+) -> FloatArray:
+    """Power of Clarke's Doppler spectrum in each bin of a ``samples``-point DFT.
+
+    Each bin receives the exact probability mass of the Doppler shift over
+    its frequency interval, aliased into ``[-1 / (2 T), 1 / (2 T))``, so the
+    integrable singularities at ``+-doppler_hz`` need no special casing and
+    the weights sum to one. Bins are in ``numpy.fft`` order.
+    """
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    if doppler_hz < 0:
+        raise ValueError("doppler_hz cannot be negative")
+    if sample_interval_s <= 0:
+        raise ValueError("sample_interval_s must be positive")
+    weights = np.zeros(samples, dtype=np.float64)
+    if doppler_hz == 0:
+        weights[0] = 1.0
+        return weights
+    sampling_hz = 1.0 / sample_interval_s
+    spacing = sampling_hz / samples
+    centers = np.asarray(np.fft.fftfreq(samples, d=sample_interval_s), np.float64)
+    aliases = math.ceil(doppler_hz / sampling_hz + 0.5)
+    for alias in range(-aliases, aliases + 1):
+        shifted = centers + alias * sampling_hz
+        upper = _doppler_cdf(shifted + spacing / 2, doppler_hz)
+        weights += upper - _doppler_cdf(shifted - spacing / 2, doppler_hz)
+    return weights
+
+
+def sample_jakes_channel(
+    sigma: float,
+    doppler_hz: float,
+    sample_interval_s: float,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+    *,
+    precision: Precision = "double",
+) -> ComplexArray:
+    """Time-correlated Rayleigh taps with Clarke's (Jakes) Doppler spectrum.
+
+    The last axis is time and every other index is an independent sequence.
+    White complex Gaussian spectra are shaped by ``jakes_spectrum_weights``
+    and inverted with one FFT per sequence, O(N log N). Sequences shorter
+    than ``MIN_DOPPLER_CYCLES`` Doppler periods are generated at that length
+    and truncated, since a coarser DFT grid cannot resolve the spectrum. The
+    taps have the marginal law of ``sample_rayleigh_channel`` and follow
+    ``jakes_correlation``; the generated sequence is circular, so the last
+    taps of a long sequence are correlated with the first ones. With
+    ``precision="single"`` the spectra and FFTs are complex64.
+    """
+    if sigma <= 0:
+        raise ValueError("sigma must be positive")
+    shape = (size,) if isinstance(size, int) else tuple(size)
+    if any(length < 0 for length in shape):
+        raise ValueError("size cannot be negative")
+    if not shape or shape[-1] == 0:
+        return np.zeros(shape, dtype=complex_dtype(precision))
+    samples = shape[-1]
+    length = samples
+    if doppler_hz > 0:
+        cycles = math.ceil(MIN_DOPPLER_CYCLES / (doppler_hz * sample_interval_s))
+        length = fft.next_fast_len(max(samples, min(cycles, MAX_SEQUENCE_LENGTH)))
+    amplitudes = np.sqrt(jakes_spectrum_weights(length, doppler_hz, sample_interval_s))
+    sequences = math.prod(shape[:-1])
+    taps = np.empty((sequences, samples), dtype=complex_dtype(precision))
+    chunk = max(1, MAX_CHUNK_ELEMENTS // length)
+    for start in range(0, sequences, chunk):
+        rows = min(chunk, sequences - start)
+        if precision == "single":
+            spectrum = sigma * (
+                rng.standard_normal((rows, length), dtype=np.float32)
+                + 1j * rng.standard_normal((rows, length), dtype=np.float32)
+            )
+            spectrum *= amplitudes.astype(real_dtype(precision))
+        else:
+            spectrum = rng.normal(0.0, sigma, (rows, length)) + 1j * rng.normal(
+                0.0,
+                sigma,
+                (rows, length),
+            )
+            spectrum *= amplitudes
+        taps[start : start + rows] = fft.ifft(spectrum, axis=-1, norm="forward")[
+            :, :samples
+        ]
+    return taps.reshape(shape)
@@ -14,11 +14,19 @@ def doppler_frequency_hz(speed_kmh: float, carrier_frequency_hz: float) -> float
     return (speed_kmh / 3.6) * carrier_frequency_hz / SPEED_OF_LIGHT_M_S
 
 
-def coherence_time_s(speed_kmh: float, carrier_frequency_hz: float) -> float:
-    doppler = doppler_frequency_hz(speed_kmh, carrier_frequency_hz)
-    if doppler == 0:
+def doppler_coherence_time_s(doppler_hz: float) -> float:
+    """Delay at which the fading envelope correlation falls to about 0.5."""
+    if doppler_hz < 0:
+        raise ValueError("doppler_hz cannot be negative")
+    if doppler_hz == 0:
         return float("inf")
-    return float(9.0 / (16.0 * np.pi * doppler))
+    return float(9.0 / (16.0 * np.pi * doppler_hz))
+
+
+def coherence_time_s(speed_kmh: float, carrier_frequency_hz: float) -> float:
+    return doppler_coherence_time_s(
+        doppler_frequency_hz(speed_kmh, carrier_frequency_hz)
+    )
 
 
 def jakes_correlation(delay_s: float, doppler_hz: float) -> float:
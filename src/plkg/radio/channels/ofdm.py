@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import fft
+
+from plkg.core.models import (
+    ComplexArray,
+    FloatArray,
+    Precision,
+    as_complex,
+    real_dtype,
+)
+from plkg.radio.channels.jakes import sample_jakes_channel
+from plkg.radio.channels.rayleigh import sample_rayleigh_channel
+
+DEFAULT_CHUNK_SAMPLES = 1024
+
+
+@dataclass(frozen=True)
+class PowerDelayProfile:
+    """Tap delays and relative powers of a wideband multipath channel."""
+
+    delays_s: tuple[float, ...]
+    powers_db: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        delays = tuple(float(delay) for delay in self.delays_s)
+        powers = tuple(float(power) for power in self.powers_db)
+        if not delays:
+            raise ValueError("a power-delay profile needs at least one tap")
+        if len(delays) != len(powers):
+            raise ValueError("delays_s and powers_db must have the same length")
+        if any(delay < 0 for delay in delays):
+            raise ValueError("tap delays cannot be negative")
+        if not all(math.isfinite(power) for power in powers):
+            raise ValueError("tap powers must be finite")
+        object.__setattr__(self, "delays_s", delays)
+        object.__setattr__(self, "powers_db", powers)
+
+    @classmethod
+    def exponential(
+        cls,
+        rms_delay_spread_s: float,
+        taps: int,
+        tap_spacing_s: float | None = None,
+    ) -> PowerDelayProfile:
+        """Equally spaced taps whose power decays with ``rms_delay_spread_s``.
+
+        The spacing defaults to half the delay spread, which covers four
+        spreads with eight taps.
+        """
+        if rms_delay_spread_s <= 0:
+            raise ValueError("rms_delay_spread_s must be positive")
+        if taps <= 0:
+            raise ValueError("taps must be positive")
+        spacing = rms_delay_spread_s / 2 if tap_spacing_s is None else tap_spacing_s
+        if spacing <= 0:
+            raise ValueError("tap_spacing_s must be positive")
+        delays = tuple(index * spacing for index in range(taps))
+        powers = tuple(
+            -10.0 * math.log10(math.e) * delay / rms_delay_spread_s
+            for delay in delays
+        )
+        return cls(delays, powers)
+
+    @property
+    def linear_powers(self) -> FloatArray:
+        """Tap powers normalized to a unit total."""
+        powers = 10.0 ** (np.asarray(self.powers_db) / 10.0)
+        return np.asarray(powers / powers.sum(), dtype=np.float64)
+
+    @property
+    def rms_delay_spread_s(self) -> float:
+        powers = self.linear_powers
+        delays = np.asarray(self.delays_s)
+        mean = float(powers @ delays)
+        return math.sqrt(max(0.0, float(powers @ delays**2) - mean**2))
+
+    @property
+    def coherence_bandwidth_hz(self) -> float:
+        """Bandwidth over which the frequency correlation stays near 0.5."""
+        spread = self.rms_delay_spread_s
+        return math.inf if spread == 0 else 1.0 / (5.0 * spread)
+
+    def frequency_correlation(self, frequency_offsets_hz: FloatArray) -> ComplexArray:
+        """``E[H(f + offset) conj(H(f))]`` for unit-power responses ``H``."""
+        offsets = np.asarray(frequency_offsets_hz, dtype=np.float64)
+        phases = np.exp(
+            -2j * np.pi * offsets[..., None] * np.asarray(self.delays_s)
+        )
+        return np.asarray(phases @ self.linear_powers, dtype=np.complex128)
+
+
+@dataclass(frozen=True)
+class OfdmGrid:
+    """Subcarriers and receive antennas of a CSI report.
+
+    The channel is evaluated with an ``fft_size``-point DFT, so tap delays
+    resolve to ``1 / (fft_size * subcarrier_spacing_hz)``, the sampling
+    period of an OFDM receiver with that FFT. It defaults to the smallest
+    fast length covering the subcarriers; narrow grids then merge close taps
+    and look flatter than ``PowerDelayProfile.frequency_correlation``.
+    """
+
+    subcarriers: int
+    subcarrier_spacing_hz: float = 30e3
+    antennas: int = 1
+    fft_size: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.subcarriers <= 0:
+            raise ValueError("subcarriers must be positive")
+        if self.subcarrier_spacing_hz <= 0:
+            raise ValueError("subcarrier_spacing_hz must be positive")
+        if self.antennas <= 0:
+            raise ValueError("antennas must be positive")
+        if self.fft_size is not None and self.fft_size < self.subcarriers:
+            raise ValueError("fft_size cannot be smaller than subcarriers")
+
+    @property
+    def transform_size(self) -> int:
+        if self.fft_size is not None:
+            return self.fft_size
+        return int(fft.next_fast_len(self.subcarriers))
+
+    def tap_indices(self, profile: PowerDelayProfile) -> FloatArray:
+        """Delay-grid positions of the taps, before rounding."""
+        resolution = 1.0 / (self.transform_size * self.subcarrier_spacing_hz)
+        positions = np.asarray(profile.delays_s) / resolution
+        if np.any(np.round(positions) >= self.transform_size):
+            raise ValueError("tap delays must be shorter than an OFDM symbol")
+        return np.asarray(positions, dtype=np.float64)
+
+
+def sample_ofdm_taps(
+    sigma: float,
+    profile: PowerDelayProfile,
+    antennas: int,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+    *,
+    doppler_hz: float | None = None,
+    sample_interval_s: float = 1.0,
+    precision: Precision = "double",
+) -> ComplexArray:
+    """Tap gains of shape ``(*size, taps, antennas)``.
+
+    The last entry of ``size`` is time. Taps and antennas fade independently,
+    each with the marginal law of ``sample_rayleigh_channel`` scaled by the
+    tap's share of the power, and with Jakes fading along time when
+    ``doppler_hz`` is given. This delay-domain form holds a handful of
+    values per snapshot, so long captures are kept here and expanded to
+    subcarriers chunk by chunk.
+    """
+    shape = (size,) if isinstance(size, int) else tuple(size)
+    if not shape:
+        raise ValueError("size needs a time axis")
+    taps = len(profile.delays_s)
+    if doppler_hz is None:
+        gains = sample_rayleigh_channel(
+            sigma,
+            (*shape, taps, antennas),
+            rng,
+            precision=precision,
+        )
+    else:
+        # Jakes sequences run along the last axis; move time there and back.
+        gains = np.moveaxis(
+            sample_jakes_channel(
+                sigma,
+                doppler_hz,
+                sample_interval_s,
+                (*shape[:-1], taps, antennas, shape[-1]),
+                rng,
+                precision=precision,
+            ),
+            -1,
+            len(shape) - 1,
+        )
+    scale = np.sqrt(profile.linear_powers)[:, None].astype(real_dtype(precision))
+    return np.ascontiguousarray(gains * scale)
+
+
+def ofdm_frequency_response(
+    taps: ComplexArray,
+    profile: PowerDelayProfile,
+    grid: OfdmGrid,
+) -> ComplexArray:
+    """Subcarrier responses of tap gains ``(..., taps, antennas)``.
+
+    Taps are placed on the receiver's delay grid, taps sharing a bin add
+    up, and one batched FFT along the delay axis yields the responses, of
+    shape ``(..., subcarriers, antennas)``, in the precision of ``taps``.
+    """
+    taps = as_complex(taps)
+    if taps.ndim < 2 or taps.shape[-2:] != (len(profile.delays_s), grid.antennas):
+        raise ValueError("taps must end with (taps, antennas) axes")
+    indices = np.round(grid.tap_indices(profile)).astype(np.int64)
+    delay_domain = np.zeros(
+        (*taps.shape[:-2], grid.transform_size, grid.antennas),
+        dtype=taps.dtype,
+    )
+    bins, tap_bins = np.unique(indices, return_inverse=True)
+    if len(bins) < len(indices):
+        merge = np.zeros((len(bins), len(indices)), dtype=taps.real.dtype)
+        merge[tap_bins, np.arange(len(indices))] = 1.0
+        taps = merge @ taps
+    delay_domain[..., bins, :] = taps
+    response = fft.fft(delay_domain, axis=-2)[..., : grid.subcarriers, :]
+    return np.ascontiguousarray(response)
+
+
+def sample_ofdm_channel(
+    sigma: float,
+    profile: PowerDelayProfile,
+    grid: OfdmGrid,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+    *,
+    doppler_hz: float | None = None,
+    sample_interval_s: float = 1.0,
+    precision: Precision = "double",
+) -> ComplexArray:
+    """Channel tensor of shape ``(*size, subcarriers, antennas)``.
+
+    Every element has the marginal law of ``sample_rayleigh_channel``;
+    subcarriers follow ``profile.frequency_correlation`` up to the delay
+    rounding of ``grid``.
+    """
+    taps = sample_ofdm_taps(
+        sigma,
+        profile,
+        grid.antennas,
+        size,
+        rng,
+        doppler_hz=doppler_hz,
+        sample_interval_s=sample_interval_s,
+        precision=precision,
+    )
+    return ofdm_frequency_response(taps, profile, grid)
+
+
+def iter_ofdm_channel(
+    taps: ComplexArray,
+    profile: PowerDelayProfile,
+    grid: OfdmGrid,
+    chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+) -> Iterator[ComplexArray]:
+    """Yield ``ofdm_frequency_response`` of consecutive time chunks.
+
+    ``taps`` are ``(time, taps, antennas)`` gains from ``sample_ofdm_taps``
+    and may be a memory map; at most ``chunk_samples`` snapshots are
+    expanded to subcarriers at a time.
+    """
+    if chunk_samples <= 0:
+        raise ValueError("chunk_samples must be positive")
+    if np.ndim(taps) != 3:
+        raise ValueError("taps must be (time, taps, antennas)")
+    for start in range(0, len(taps), chunk_samples):
+        yield ofdm_frequency_response(
+            taps[start : start + chunk_samples],
+            profile,
+            grid,
+        )
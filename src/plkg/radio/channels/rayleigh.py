@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import numpy as np
 
-from plkg.core.models import ComplexArray
+from plkg.core.models import (
+    ComplexArray,
+    FloatArray,
+    Precision,
+    as_complex,
+    real_dtype,
+)
 
 
 def sample_rayleigh_channel(
     sigma: float,
-    size: int,
+    size: int | tuple[int, ...],
     rng: np.random.Generator,
+    *,
+    precision: Precision = "double",
 ) -> ComplexArray:
+    """Draw i.i.d. Rayleigh taps; a tuple size yields e.g. (trials, samples).
+
+    ``precision="single"`` draws complex64 taps from float32 normals, which
+    consume the generator differently from the double-precision draws.
+    """
     if sigma <= 0:
         raise ValueError("sigma must be positive")
-    if size < 0:
+    if np.any(np.asarray(size) < 0):
         raise ValueError("size cannot be negative")
+    if precision == "single":
+        return as_complex(
+            sigma
+            * (
+                rng.standard_normal(size, dtype=np.float32)
+                + 1j * rng.standard_normal(size, dtype=np.float32)
+            )
+        )
     in_phase = rng.normal(0.0, sigma, size)
     quadrature = rng.normal(0.0, sigma, size)
     return np.asarray(in_phase + 1j * quadrature, dtype=np.complex128)
@@ -27,12 +50,117 @@ def correlated_complex_channel(
 ) -> ComplexArray:
     if not -1.0 <= correlation <= 1.0:
         raise ValueError("correlation must be in [-1, 1]")
-    reference = np.asarray(reference, dtype=np.complex128)
-    independent = sample_rayleigh_channel(sigma, len(reference), rng)
-    return np.asarray(
-        correlation * reference
-        + np.sqrt(max(0.0, 1.0 - correlation**2)) * independent,
-        dtype=np.complex128,
+    reference = as_complex(reference)
+    precision: Precision = "single" if reference.dtype == np.complex64 else "double"
+    independent = sample_rayleigh_channel(
+        sigma,
+        reference.shape,
+        rng,
+        precision=precision,
+    )
+    return mix_correlated_channel(reference, independent, correlation)
+
+
+def mix_correlated_channel(
+    reference: ComplexArray,
+    independent: ComplexArray,
+    correlation: float,
+) -> ComplexArray:
+    """Combine a reference channel with an independent one of equal law.
+
+    Two complex64 inputs give a complex64 channel; anything else is mixed
+    in double precision.
+    """
+    if not -1.0 <= correlation <= 1.0:
+        raise ValueError("correlation must be in [-1, 1]")
+    reference = as_complex(reference)
+    independent = as_complex(independent)
+    if reference.dtype != independent.dtype:
+        reference = reference.astype(np.complex128)
+        independent = independent.astype(np.complex128)
+    weight = float(np.sqrt(max(0.0, 1.0 - correlation**2)))
+    return correlation * reference + weight * independent
+
+
+def observer_correlation_matrix(
+    alice_bob_correlation: float,
+    alice_eve_correlations: Sequence[float],
+) -> FloatArray:
+    """Channel correlations of Alice, Bob and every Eve, in that order.
+
+    As with ``correlated_complex_channel``, observers are independent given
+    Alice's channel, so two of them correlate through the product of their
+    correlations with Alice.
+    """
+    correlations = np.array(
+        [1.0, alice_bob_correlation, *alice_eve_correlations],
+        dtype=np.float64,
+    )
+    if np.any(np.abs(correlations) > 1.0):
+        raise ValueError("correlations must be in [-1, 1]")
+    matrix = np.outer(correlations, correlations)
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+
+def joint_channel_factor(correlation: FloatArray) -> FloatArray:
+    """Square root ``L`` of a correlation matrix, with ``L @ L.T`` equal to it.
+
+    This is the Cholesky factor when the matrix is positive definite, which
+    reproduces ``correlated_complex_channel`` for a pair. Singular matrices,
+    such as perfectly correlated observers, fall back to an eigenvalue
+    square root.
+    """
+    matrix = np.asarray(correlation, dtype=np.float64)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("correlation must be a square matrix")
+    if not np.allclose(matrix, matrix.T) or not np.allclose(np.diag(matrix), 1.0):
+        raise ValueError("correlation must be symmetric with a unit diagonal")
+    try:
+        return np.asarray(np.linalg.cholesky(matrix), dtype=np.float64)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues[0] < -1e-9:
+            raise ValueError("correlation must be positive semidefinite") from None
+        return np.asarray(
+            eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None)),
+            dtype=np.float64,
+        )
+
+
+def mix_joint_channels(
+    correlation: FloatArray,
+    independent: ComplexArray,
+) -> ComplexArray:
+    """Correlate ``independent`` channels of equal law along their first axis.
+
+    One factorization of ``correlation`` and one matrix product over all
+    samples turn the ``(observers, ...)`` input into channels with that
+    correlation; any time correlation of the input is preserved, and so is
+    a complex64 dtype.
+    """
+    independent = as_complex(independent)
+    factor = joint_channel_factor(correlation).astype(
+        real_dtype("single" if independent.dtype == np.complex64 else "double")
+    )
+    if independent.ndim == 0 or len(independent) != len(factor):
+        raise ValueError("independent needs one channel per observer")
+    mixed = factor @ independent.reshape(len(independent), -1)
+    return mixed.reshape(independent.shape)
+
+
+def sample_joint_channels(
+    sigma: float,
+    correlation: FloatArray,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+) -> ComplexArray:
+    """I.i.d. Rayleigh channels of every observer, shape ``(observers, *size)``."""
+    shape = (size,) if isinstance(size, int) else tuple(size)
+    observers = len(np.asarray(correlation))
+    return mix_joint_channels(
+        correlation,
+        sample_rayleigh_channel(sigma, (observers, *shape), rng),
     )
 
 
@@ -47,22 +175,42 @@ def add_complex_estimation_noise(
     if relative_error < 0:
         raise ValueError("relative_error cannot be negative")
 
-    channel = np.asarray(channel, dtype=np.complex128)
+    channel = as_complex(channel)
     result = channel.copy()
 
+    if channel.dtype == np.complex64:
+        # Single precision: float32 standard normals, scaled in place.
+        if noise_variance > 0:
+            component_std = float(np.sqrt(noise_variance / 2.0))
+            result += component_std * _standard_complex64(channel.shape, rng)
+        if relative_error > 0:
+            error_std = relative_error * np.abs(channel)
+            result += error_std * _standard_complex64(channel.shape, rng)
+        return result
+
     if noise_variance > 0:
         component_std = np.sqrt(noise_variance / 2.0)
-        noise = rng.normal(0.0, component_std, len(channel))
-        noise = noise + 1j * rng.normal(0.0, component_std, len(channel))
+        noise = rng.normal(0.0, component_std, channel.shape)
+        noise = noise + 1j * rng.normal(0.0, component_std, channel.shape)
         result += noise
 
     if relative_error > 0:
         error_std = relative_error * np.abs(channel)
-        error = rng.normal(0.0, error_std, len(channel))
-        error = error + 1j * rng.normal(0.0, error_std, len(channel))
+        error = rng.normal(0.0, error_std, channel.shape)
+        error = error + 1j * rng.normal(0.0, error_std, channel.shape)
         result += error
 
-    return np.asarray(result, dtype=np.complex128)
+    return result
+
+
+def _standard_complex64(
+    shape: tuple[int, ...],
+    rng: np.random.Generator,
+) -> ComplexArray:
+    return rng.standard_normal(shape, dtype=np.float32) + 1j * rng.standard_normal(
+        shape,
+        dtype=np.float32,
+    )
 
 
 def complex_noise_variance_from_snr(
@@ -1,4 +1,12 @@
-from plkg.radio.measurements.csi.features import CsiAmplitudeExtractor
-from plkg.radio.measurements.csi.observation import observe_csi
+from plkg.radio.measurements.csi.features import (
+    CsiAmplitudeExtractor,
+    CsiTensorExtractor,
+)
+from plkg.radio.measurements.csi.observation import observe_csi, observe_csi_tensor
 
-__all__ = ["CsiAmplitudeExtractor", "observe_csi"]
+__all__ = [
+    "CsiAmplitudeExtractor",
+    "CsiTensorExtractor",
+    "observe_csi",
+    "observe_csi_tensor",
+]
@@ -1,6 +1,16 @@
+from collections.abc import Iterable, Iterator
+
 import numpy as np
+from scipy import fft
 
-from plkg.core.models import CsiObservation, FeatureSeries
+from plkg.core.models import (
+    ComplexArray,
+    CsiObservation,
+    CsiTensorObservation,
+    FeatureSeries,
+    FloatArray,
+    as_real,
+)
 
 
 class CsiAmplitudeExtractor:
@@ -11,3 +21,66 @@ class CsiAmplitudeExtractor:
             values=np.abs(observation.values),
             name="csi_amplitude",
         )
+
+
+class CsiTensorExtractor:
+    """Flatten ``(time, subcarrier, antenna)`` CSI amplitudes into features.
+
+    Neighbouring subcarriers are strongly correlated, so their bits would be
+    largely redundant. ``subcarrier_stride`` keeps every stride-th
+    subcarrier, ideally about one coherence bandwidth apart, and
+    ``dct_coefficients`` replaces each snapshot's amplitudes with that many
+    of their leading DCT-II coefficients across subcarriers, which compact
+    and decorrelate them. The DC coefficient is dropped: it tracks the mean
+    amplitude, whose bits the other antennas and snapshots already carry,
+    and it would dominate a shared median threshold. Features are flattened
+    time first, then coefficient or subcarrier, then antenna.
+    """
+
+    def __init__(
+        self,
+        subcarrier_stride: int = 1,
+        dct_coefficients: int | None = None,
+    ) -> None:
+        if subcarrier_stride <= 0:
+            raise ValueError("subcarrier_stride must be positive")
+        if dct_coefficients is not None and dct_coefficients <= 0:
+            raise ValueError("dct_coefficients must be positive")
+        self.subcarrier_stride = subcarrier_stride
+        self.dct_coefficients = dct_coefficients
+
+    @property
+    def name(self) -> str:
+        if self.dct_coefficients is None:
+            return "csi_tensor_amplitude"
+        return "csi_tensor_dct"
+
+    def features(self, values: ComplexArray) -> FloatArray:
+        """Per-snapshot features of a ``(time, subcarrier, antenna)`` chunk."""
+        values = np.asarray(values)
+        if values.ndim != 3:
+            raise ValueError("CSI tensors must be (time, subcarrier, antenna)")
+        amplitudes = np.abs(values[:, :: self.subcarrier_stride, :])
+        if self.dct_coefficients is not None:
+            available = amplitudes.shape[1] - 1
+            if self.dct_coefficients > available:
+                raise ValueError(
+                    f"only {available} DCT coefficients follow the DC term"
+                )
+            amplitudes = fft.dct(amplitudes, type=2, axis=1, norm="ortho")[
+                :, 1 : self.dct_coefficients + 1, :
+            ]
+        return as_real(amplitudes.reshape(len(amplitudes), -1))
+
+    def extract(self, observation: CsiTensorObservation) -> FeatureSeries:
+        if not isinstance(observation, CsiTensorObservation):
+            raise TypeError("CsiTensorExtractor requires CsiTensorObservation")
+        return FeatureSeries(
+            values=self.features(observation.values).reshape(-1),
+            name=self.name,
+        )
+
+    def extract_stream(self, chunks: Iterable[ComplexArray]) -> Iterator[FloatArray]:
+        """Flattened features of consecutive time chunks, one chunk at a time."""
+        for chunk in chunks:
+            yield self.features(chunk).reshape(-1)
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import numpy as np
 
-from plkg.core.models import ComplexArray, CsiObservation
+from plkg.core.models import (
+    ComplexArray,
+    CsiObservation,
+    CsiTensorObservation,
+)
 from plkg.radio.channels.rayleigh import add_complex_estimation_noise
 
 
@@ -21,3 +25,26 @@ def observe_csi(
         rng,
     )
     return CsiObservation(values=values, sample_interval_s=sample_interval_s)
+
+
+def observe_csi_tensor(
+    channel: ComplexArray,
+    noise_variance: float,
+    relative_error: float,
+    rng: np.random.Generator,
+    *,
+    sample_interval_s: float = 1.0,
+    subcarrier_spacing_hz: float = 30e3,
+) -> CsiTensorObservation:
+    """``observe_csi`` for a ``(time, subcarrier, antenna)`` channel tensor."""
+    values = add_complex_estimation_noise(
+        channel,
+        noise_variance,
+        relative_error,
+        rng,
+    )
+    return CsiTensorObservation(
+        values=values,
+        sample_interval_s=sample_interval_s,
+        subcarrier_spacing_hz=subcarrier_spacing_hz,
+    )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import fft
+
+from plkg.core.models import FeatureSeries, FloatArray, as_real
+from plkg.radio.profiles import RadioProfile
+
+DECORRELATION_THRESHOLD = 0.5
+
+
+def autocorrelation(values: FloatArray, max_lag: int | None = None) -> FloatArray:
+    """Normalized autocorrelation of feature sequences, by lag.
+
+    ``values`` is one sequence or ``(sequences, samples)`` of them; each is
+    centred on its own mean and their biased autocovariances are pooled.
+    The transform is zero-padded to avoid circular wrap-around, so the cost
+    is O(n log n) per sequence.
+    """
+    matrix = np.atleast_2d(as_real(values)).astype(np.float64, copy=False)
+    samples = matrix.shape[-1]
+    if samples < 2:
+        raise ValueError("autocorrelation needs at least two samples")
+    lags = samples if max_lag is None else min(max_lag + 1, samples)
+    centred = matrix - np.mean(matrix, axis=-1, keepdims=True)
+    size = fft.next_fast_len(2 * samples - 1, real=True)
+    spectrum = fft.rfft(centred, size, axis=-1)
+    covariance = fft.irfft(np.abs(spectrum) ** 2, size, axis=-1)[..., :lags]
+    pooled = np.sum(covariance.reshape(-1, lags), axis=0)
+    if pooled[0] <= 0:
+        raise ValueError("constant sequences have no autocorrelation")
+    return np.asarray(pooled / pooled[0], dtype=np.float64)
+
+
+def decorrelation_lag(
+    values: FloatArray,
+    threshold: float = DECORRELATION_THRESHOLD,
+) -> int:
+    """First lag at which the measured autocorrelation drops to ``threshold``.
+
+    If it never does, the sequences are too short to tell and their length
+    is returned.
+    """
+    if not 0 < threshold < 1:
+        raise ValueError("threshold must be in (0, 1)")
+    correlation = autocorrelation(values)
+    below = np.flatnonzero(correlation <= threshold)
+    return int(below[0]) if len(below) else len(correlation)
+
+
+@dataclass(frozen=True)
+class CoherenceDecimator:
+    """Keep every ``stride``-th feature sample before quantization.
+
+    Samples closer than the coherence time are strongly correlated: they
+    add bits but little entropy, and inflate reconciliation work. A stride
+    of about one coherence time keeps roughly independent samples.
+    """
+
+    stride: int = 1
+    sample_interval_s: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.stride <= 0:
+            raise ValueError("stride must be positive")
+        if self.sample_interval_s <= 0:
+            raise ValueError("sample_interval_s must be positive")
+
+    @classmethod
+    def from_coherence_time(
+        cls,
+        sample_interval_s: float,
+        coherence_time_s: float,
+    ) -> CoherenceDecimator:
+        if not math.isfinite(coherence_time_s):
+            raise ValueError(
+                "a static channel has no finite coherence time; "
+                "measure the autocorrelation instead"
+            )
+        if coherence_time_s < 0:
+            raise ValueError("coherence_time_s cannot be negative")
+        stride = max(1, math.ceil(coherence_time_s / sample_interval_s - 1e-9))
+        return cls(stride, sample_interval_s)
+
+    @classmethod
+    def from_profile(cls, profile: RadioProfile) -> CoherenceDecimator:
+        """Stride of one coherence time at the profile's speed and carrier."""
+        return cls.from_coherence_time(
+            profile.sample_interval_s,
+            profile.coherence_time_s,
+        )
+
+    @classmethod
+    def from_autocorrelation(
+        cls,
+        values: FloatArray,
+        sample_interval_s: float = 1.0,
+        threshold: float = DECORRELATION_THRESHOLD,
+    ) -> CoherenceDecimator:
+        """Stride of the measured decorrelation lag of ``values``."""
+        return cls(max(1, decorrelation_lag(values, threshold)), sample_interval_s)
+
+    @property
+    def independent_samples_per_second(self) -> float:
+        return 1.0 / (self.stride * self.sample_interval_s)
+
+    def apply(self, features: FeatureSeries) -> FeatureSeries:
+        if self.stride == 1:
+            return features
+        return FeatureSeries(features.values[:: self.stride], features.name)
+
+    def apply_batch(self, values: FloatArray) -> FloatArray:
+        """Decimate ``(rows, samples)`` features along time; returns a view."""
+        return values[..., :: self.stride]
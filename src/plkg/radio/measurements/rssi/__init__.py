@@ -1,4 +1,4 @@
 from plkg.radio.measurements.rssi.features import RssiLevelExtractor
-from plkg.radio.measurements.rssi.observation import observe_rssi
+from plkg.radio.measurements.rssi.observation import observe_rssi, rssi_levels_dbm
 
-__all__ = ["RssiLevelExtractor", "observe_rssi"]
+__all__ = ["RssiLevelExtractor", "observe_rssi", "rssi_levels_dbm"]
@@ -2,29 +2,62 @@ from __future__ import annotations
 
 import numpy as np
 
-from plkg.core.models import ComplexArray, RssiObservation
+from plkg.core.models import (
+    ComplexArray,
+    FloatArray,
+    RssiObservation,
+    as_complex,
+    as_real,
+)
 
 
-def observe_rssi(
+def rssi_levels_dbm(
     channel: ComplexArray,
     reference_power_dbm: float,
     measurement_noise_std_db: float,
     resolution_db: float,
     rng: np.random.Generator,
-    *,
-    sample_interval_s: float = 1.0,
-) -> RssiObservation:
+) -> FloatArray:
+    """Reported RSSI levels for a channel array of any shape.
+
+    Complex64 channels give float32 levels, with float32 measurement noise.
+    """
     if measurement_noise_std_db < 0:
         raise ValueError("measurement_noise_std_db cannot be negative")
     if resolution_db <= 0:
         raise ValueError("resolution_db must be positive")
 
-    channel = np.asarray(channel, dtype=np.complex128)
-    power = np.maximum(np.abs(channel) ** 2, np.finfo(float).tiny)
+    channel = as_complex(channel)
+    power = np.abs(channel) ** 2
+    power = np.maximum(power, np.finfo(power.dtype).tiny)
     values_dbm = reference_power_dbm + 10.0 * np.log10(power)
     if measurement_noise_std_db > 0:
-        values_dbm += rng.normal(0.0, measurement_noise_std_db, len(channel))
-    values_dbm = np.round(values_dbm / resolution_db) * resolution_db
+        if values_dbm.dtype == np.float32:
+            values_dbm += measurement_noise_std_db * rng.standard_normal(
+                channel.shape,
+                dtype=np.float32,
+            )
+        else:
+            values_dbm += rng.normal(0.0, measurement_noise_std_db, channel.shape)
+    return as_real(np.round(values_dbm / resolution_db) * resolution_db)
+
+
+def observe_rssi(
+    channel: ComplexArray,
+    reference_power_dbm: float,
+    measurement_noise_std_db: float,
+    resolution_db: float,
+    rng: np.random.Generator,
+    *,
+    sample_interval_s: float = 1.0,
+) -> RssiObservation:
+    values_dbm = rssi_levels_dbm(
+        channel,
+        reference_power_dbm,
+        measurement_noise_std_db,
+        resolution_db,
+        rng,
+    )
     return RssiObservation(
         values_dbm=values_dbm,
         sample_interval_s=sample_interval_s,
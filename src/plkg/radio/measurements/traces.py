@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import CsiObservation, RssiObservation
+
+TraceMeasurement = Literal["csi", "rssi"]
+TraceObservation = CsiObservation | RssiObservation
+
+TRACE_MAGIC = b"PLKGTRC1"
+TRACE_HEADER_BYTES = 512
+TRACE_FORMAT_VERSION = 1
+TRACE_OBSERVERS = 3
+TRACE_DTYPES: dict[str, frozenset[str]] = {
+    "csi": frozenset({"complex64", "complex128"}),
+    "rssi": frozenset({"float32", "float64"}),
+}
+DEFAULT_CHUNK_SAMPLES = 1 << 20
+
+
+@dataclass(frozen=True)
+class TraceHeader:
+    """Layout of a capture: one column per observer (Alice, Bob, Eve)."""
+
+    measurement: TraceMeasurement
+    dtype: str
+    samples: int
+    sample_interval_s: float = 1.0
+    metadata: dict[str, Any] = field(default_factory=dict)
+    format_version: int = TRACE_FORMAT_VERSION
+
+    def __post_init__(self) -> None:
+        if self.measurement not in TRACE_DTYPES:
+            raise ValueError(f"measurement must be one of {sorted(TRACE_DTYPES)}")
+        if self.dtype not in TRACE_DTYPES[self.measurement]:
+            raise ValueError(
+                f"{self.measurement} traces hold one of "
+                f"{sorted(TRACE_DTYPES[self.measurement])}, not {self.dtype}"
+            )
+        if self.samples < 0:
+            raise ValueError("samples cannot be negative")
+        if self.sample_interval_s <= 0:
+            raise ValueError("sample_interval_s must be positive")
+        if self.format_version != TRACE_FORMAT_VERSION:
+            raise ValueError(f"unsupported trace format {self.format_version}")
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TraceHeader:
+        return cls(**data)
+
+    def encode(self) -> bytes:
+        """Magic, then the JSON header padded to ``TRACE_HEADER_BYTES``."""
+        text = json.dumps(self.as_dict(), separators=(",", ":")).encode("utf-8")
+        size = TRACE_HEADER_BYTES - len(TRACE_MAGIC) - 1
+        if len(text) > size:
+            raise ValueError("trace metadata does not fit in the header")
+        return TRACE_MAGIC + text.ljust(size) + b"\n"
+
+    @classmethod
+    def decode(cls, raw: bytes) -> TraceHeader:
+        if len(raw) != TRACE_HEADER_BYTES or not raw.startswith(TRACE_MAGIC):
+            raise ValueError("not a PLKG trace file")
+        return cls.from_dict(json.loads(raw[len(TRACE_MAGIC) :]))
+
+
+def _stored_dtype(name: str) -> np.dtype[Any]:
+    # Trace data is little-endian whatever the recording host.
+    return np.dtype(name).newbyteorder("<")
+
+
+def _npy_layout(path: Path) -> tuple[np.dtype[Any], tuple[int, ...], bool, int]:
+    with path.open("rb") as handle:
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            layout = np.lib.format.read_array_header_1_0(handle)
+        else:
+            layout = np.lib.format.read_array_header_2_0(handle)
+        shape, fortran_order, dtype = layout
+        return dtype, shape, fortran_order, handle.tell()
+
+
+@dataclass(frozen=True)
+class CaptureTrace:
+    """Time-aligned Alice, Bob and Eve captures in one memory-mapped file.
+
+    Samples are stored time-major, ``(samples, 3)``, either after a
+    ``TraceHeader`` or as a C-ordered ``.npy`` array. Only the path, header
+    and data offset are held; windows are views of a map of one chunk of
+    the file at a time, so resident memory stays near a chunk however large
+    the capture is.
+    """
+
+    path: Path
+    header: TraceHeader
+    offset: int = TRACE_HEADER_BYTES
+
+    @classmethod
+    def open(
+        cls,
+        path: str | Path,
+        *,
+        sample_interval_s: float = 1.0,
+    ) -> CaptureTrace:
+        """Open a trace file, or a ``.npy`` capture of complex CSI or real RSSI.
+
+        ``sample_interval_s`` only applies to ``.npy`` files, whose header
+        does not record it.
+        """
+        file = Path(path)
+        if file.suffix == ".npy":
+            dtype, shape, fortran_order, offset = _npy_layout(file)
+            if fortran_order or len(shape) != 2 or shape[1] != TRACE_OBSERVERS:
+                raise ValueError("a .npy capture must be C-ordered (samples, 3)")
+            if dtype != _stored_dtype(dtype.name):
+                raise ValueError("a .npy capture must be little-endian")
+            header = TraceHeader(
+                measurement="csi" if dtype.kind == "c" else "rssi",
+                dtype=dtype.name,
+                samples=shape[0],
+                sample_interval_s=sample_interval_s,
+            )
+            return cls(file, header, offset)
+        with file.open("rb") as handle:
+            header = TraceHeader.decode(handle.read(TRACE_HEADER_BYTES))
+        itemsize = np.dtype(header.dtype).itemsize
+        expected = TRACE_HEADER_BYTES + header.samples * TRACE_OBSERVERS * itemsize
+        if file.stat().st_size != expected:
+            raise ValueError("trace data does not match its header")
+        return cls(file, header)
+
+    @property
+    def samples(self) -> int:
+        return self.header.samples
+
+    def read(self, start: int, samples: int) -> NDArray[Any]:
+        """Read-only ``(samples, 3)`` map of the capture from ``start`` on."""
+        if start < 0 or samples < 0 or start + samples > self.samples:
+            raise ValueError(
+                f"the trace holds {self.samples} samples, but samples "
+                f"{start} to {start + samples} were requested"
+            )
+        dtype = _stored_dtype(self.header.dtype)
+        if samples == 0:
+            return np.empty((0, TRACE_OBSERVERS), dtype=dtype)
+        return np.memmap(
+            self.path,
+            dtype=dtype,
+            mode="r",
+            offset=self.offset + start * TRACE_OBSERVERS * dtype.itemsize,
+            shape=(samples, TRACE_OBSERVERS),
+        )
+
+    def observations(
+        self,
+        values: NDArray[Any],
+    ) -> tuple[TraceObservation, TraceObservation, TraceObservation]:
+        """Alice's, Bob's and Eve's observations of ``(samples, 3)`` values.
+
+        The observations hold strided views of ``values``, not copies.
+        """
+        interval = self.header.sample_interval_s
+        metadata = dict(self.header.metadata)
+        if self.header.measurement == "csi":
+            return (
+                CsiObservation(values[:, 0], interval, metadata),
+                CsiObservation(values[:, 1], interval, metadata),
+                CsiObservation(values[:, 2], interval, metadata),
+            )
+        return (
+            RssiObservation(values[:, 0], interval, metadata),
+            RssiObservation(values[:, 1], interval, metadata),
+            RssiObservation(values[:, 2], interval, metadata),
+        )
+
+    def window(
+        self,
+        start: int,
+        samples: int,
+    ) -> tuple[TraceObservation, TraceObservation, TraceObservation]:
+        return self.observations(self.read(start, samples))
+
+    def iter_chunks(
+        self,
+        chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+    ) -> Iterator[NDArray[Any]]:
+        """Yield consecutive ``(samples, 3)`` maps of at most ``chunk_samples``.
+
+        Each map is released once the caller drops it and its views.
+        """
+        if chunk_samples <= 0:
+            raise ValueError("chunk_samples must be positive")
+        for start in range(0, self.samples, chunk_samples):
+            yield self.read(start, min(chunk_samples, self.samples - start))
+
+    def iter_windows(
+        self,
+        window_samples: int,
+        *,
+        chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+    ) -> Iterator[tuple[TraceObservation, TraceObservation, TraceObservation]]:
+        """Yield the observations of consecutive, non-overlapping windows.
+
+        Chunks are rounded down to whole windows and a trailing partial
+        window is left out.
+        """
+        if window_samples <= 0:
+            raise ValueError("window_samples must be positive")
+        windows_per_chunk = max(1, chunk_samples // window_samples)
+        usable = self.samples - self.samples % window_samples
+        for start in range(0, usable, windows_per_chunk * window_samples):
+            chunk = self.read(
+                start,
+                min(windows_per_chunk * window_samples, usable - start),
+            )
+            for offset in range(0, len(chunk), window_samples):
+                yield self.observations(chunk[offset : offset + window_samples])
+
+
+def write_trace(
+    path: str | Path,
+    measurement: TraceMeasurement,
+    chunks: Iterable[NDArray[Any]],
+    *,
+    sample_interval_s: float = 1.0,
+    metadata: dict[str, Any] | None = None,
+) -> CaptureTrace:
+    """Stream ``(samples, 3)`` chunks of one dtype into a trace file.
+
+    Chunks are appended as they arrive, so captures larger than memory can
+    be recorded or converted; the sample count is written into the header
+    at the end. The header is validated before any data is written, the
+    dtype against ``measurement`` on the first chunk, and a failed write
+    removes the partial file.
+    """
+    header = TraceHeader(
+        measurement=measurement,
+        dtype="complex128" if measurement == "csi" else "float64",
+        samples=0,
+        sample_interval_s=sample_interval_s,
+        metadata={} if metadata is None else metadata,
+    )
+    header.encode()
+    file = Path(path)
+    dtype: np.dtype[Any] | None = None
+    samples = 0
+    try:
+        with file.open("wb") as handle:
+            handle.write(bytes(TRACE_HEADER_BYTES))
+            for chunk in chunks:
+                values = np.asarray(chunk)
+                if values.ndim != 2 or values.shape[1] != TRACE_OBSERVERS:
+                    raise ValueError("trace chunks must be (samples, 3)")
+                if dtype is None:
+                    dtype = values.dtype
+                    header = replace(header, dtype=dtype.name)
+                elif values.dtype != dtype:
+                    raise ValueError("trace chunks must share one dtype")
+                handle.write(
+                    np.ascontiguousarray(values, dtype=_stored_dtype(dtype.name)).data
+                )
+                samples += len(values)
+            header = replace(header, samples=samples)
+            handle.seek(0)
+            handle.write(header.encode())
+    except BaseException:
+        file.unlink(missing_ok=True)
+        raise
+    return CaptureTrace(file, header)
@@ -6,6 +6,8 @@ from functools import cache, lru_cache
 from importlib.resources import files
 from typing import Any, Literal, cast
 
+from plkg.radio.channels.mobility import coherence_time_s, doppler_frequency_hz
+
 PROFILE_PACKAGE = "plkg.radio.profile_data"
 REQUIRED_FIELDS = {
     "name",
@@ -51,6 +53,16 @@ class RadioProfile:
         if self.rssi_resolution_db <= 0:
             raise ValueError("rssi_resolution_db must be positive")
 
+    @property
+    def doppler_hz(self) -> float:
+        """Maximum Doppler shift at ``speed_kmh`` and the carrier frequency."""
+        return doppler_frequency_hz(self.speed_kmh, self.carrier_frequency_hz)
+
+    @property
+    def coherence_time_s(self) -> float:
+        """Coherence time at ``speed_kmh``; infinite for a static profile."""
+        return coherence_time_s(self.speed_kmh, self.carrier_frequency_hz)
+
 
 @lru_cache(maxsize=1)
 def _profile_names() -> tuple[str, ...]:
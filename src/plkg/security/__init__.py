@@ -1,4 +1,27 @@
 from plkg.security.entropy import extractable_key_length
-from plkg.security.metrics import aggregate_trials
+from plkg.security.intervals import (
+    PrecisionTarget,
+    binomial_interval,
+    clopper_pearson_interval,
+    wilson_interval,
+)
+from plkg.security.metrics import (
+    MonteCarloAccumulator,
+    RunningMoments,
+    aggregate_trial_batches,
+    aggregate_trials,
+    merge_accumulators,
+)
 
-__all__ = ["aggregate_trials", "extractable_key_length"]
+__all__ = [
+    "MonteCarloAccumulator",
+    "PrecisionTarget",
+    "RunningMoments",
+    "aggregate_trial_batches",
+    "aggregate_trials",
+    "binomial_interval",
+    "clopper_pearson_interval",
+    "extractable_key_length",
+    "merge_accumulators",
+    "wilson_interval",
+]
@@ -17,3 +17,14 @@ def extractable_key_length(
         0,
         math.floor(min_entropy_bits - public_leakage_bits - 2 * security_bits),
     )
+
+
+def guessing_min_entropy(mismatch_rate: float) -> float:
+    """Min-entropy per bit left to a guesser whose bits mismatch at this rate.
+
+    A guesser that mismatches more often than not flips its guesses, so it
+    is right with probability ``max(p, 1 - p)``.
+    """
+    if not 0 <= mismatch_rate <= 1:
+        raise ValueError("mismatch_rate must be in [0, 1]")
+    return -math.log2(max(mismatch_rate, 1 - mismatch_rate))
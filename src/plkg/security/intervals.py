@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Literal
+
+from scipy import stats
+
+IntervalMethod = Literal["wilson", "clopper_pearson"]
+IntervalMetric = Literal[
+    "bob_frame_error_rate",
+    "bob_raw_mismatch_rate",
+    "bob_reconciled_mismatch_rate",
+    "eve_reconciled_mismatch_rate",
+]
+INTERVAL_METRICS: tuple[IntervalMetric, ...] = (
+    "bob_frame_error_rate",
+    "bob_raw_mismatch_rate",
+    "bob_reconciled_mismatch_rate",
+    "eve_reconciled_mismatch_rate",
+)
+
+
+def _validate(events: int, total: int, confidence: float) -> None:
+    if total <= 0:
+        raise ValueError("total must be positive")
+    if not 0 <= events <= total:
+        raise ValueError("events must be in [0, total]")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+
+
+def wilson_interval(
+    events: int,
+    total: int,
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    _validate(events, total, confidence)
+    z = float(stats.norm.ppf(0.5 + confidence / 2))
+    proportion = events / total
+    denominator = 1 + z**2 / total
+    center = (proportion + z**2 / (2 * total)) / denominator
+    half_width = (
+        z
+        * math.sqrt(proportion * (1 - proportion) / total + z**2 / (4 * total**2))
+        / denominator
+    )
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def clopper_pearson_interval(
+    events: int,
+    total: int,
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """Exact (conservative) Clopper-Pearson interval from beta quantiles."""
+    _validate(events, total, confidence)
+    alpha = 1 - confidence
+    lower = 0.0
+    upper = 1.0
+    if events > 0:
+        lower = float(stats.beta.ppf(alpha / 2, events, total - events + 1))
+    if events < total:
+        upper = float(stats.beta.ppf(1 - alpha / 2, events + 1, total - events))
+    return lower, upper
+
+
+def binomial_interval(
+    events: int,
+    total: int,
+    confidence: float = 0.95,
+    method: IntervalMethod = "wilson",
+) -> tuple[float, float]:
+    if method == "wilson":
+        return wilson_interval(events, total, confidence)
+    if method == "clopper_pearson":
+        return clopper_pearson_interval(events, total, confidence)
+    raise ValueError("method must be 'wilson' or 'clopper_pearson'")
+
+
+@dataclass(frozen=True)
+class PrecisionTarget:
+    """Stopping rule for sequential Monte Carlo runs.
+
+    The rule is met once at least ``min_trials`` trials have run and the
+    interval on ``metric`` has a half-width of at most
+    ``relative_half_width`` times the estimate or ``absolute_half_width``,
+    whichever is larger; the absolute floor lets points whose rate is close
+    to zero stop. Mismatch-rate intervals treat bits as independent, which
+    understates their width when errors cluster in failed blocks, so frame
+    error rates make the more reliable stopping metric.
+    """
+
+    metric: IntervalMetric = "bob_frame_error_rate"
+    relative_half_width: float = 0.1
+    absolute_half_width: float = 0.0
+    confidence: float = 0.95
+    method: IntervalMethod = "wilson"
+    min_trials: int = 100
+
+    def __post_init__(self) -> None:
+        if self.metric not in INTERVAL_METRICS:
+            raise ValueError(f"metric must be one of {INTERVAL_METRICS}")
+        if self.method not in {"wilson", "clopper_pearson"}:
+            raise ValueError("method must be 'wilson' or 'clopper_pearson'")
+        if self.relative_half_width < 0 or self.absolute_half_width < 0:
+            raise ValueError("half-width targets cannot be negative")
+        if self.relative_half_width == 0 and self.absolute_half_width == 0:
+            raise ValueError("at least one half-width target must be positive")
+        if not 0 < self.confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        if self.min_trials <= 0:
+            raise ValueError("min_trials must be positive")
+
+    def is_met(self, events: int, total: int) -> bool:
+        if total == 0:
+            return False
+        lower, upper = binomial_interval(events, total, self.confidence, self.method)
+        tolerance = max(
+            self.relative_half_width * events / total,
+            self.absolute_half_width,
+        )
+        return (upper - lower) / 2 <= tolerance
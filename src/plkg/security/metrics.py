@@ -1,58 +1,368 @@
 from __future__ import annotations
 
+import math
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import Any
+
 import numpy as np
 
 from plkg.core.bits import hamming_distance
-from plkg.core.models import MonteCarloResult, TrialResult
+from plkg.core.models import (
+    FinalKeyBatch,
+    FinalKeyResult,
+    FloatArray,
+    MonteCarloResult,
+    TrialBatch,
+    TrialResult,
+)
+from plkg.security.intervals import (
+    INTERVAL_METRICS,
+    IntervalMethod,
+    IntervalMetric,
+    binomial_interval,
+)
+
+
+@dataclass(frozen=True)
+class RunningMoments:
+    """Count, mean and sum of squared deviations of a stream of values.
+
+    Partial moments are combined with the pairwise update of Chan, Golub and
+    LeVeque, so shards can be summarized independently and merged later.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: FloatArray) -> RunningMoments:
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return cls()
+        mean = float(np.mean(values))
+        return cls(
+            count=int(values.size),
+            mean=mean,
+            m2=float(np.sum((values - mean) ** 2)),
+        )
+
+    def merge(self, other: RunningMoments) -> RunningMoments:
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return RunningMoments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta**2 * self.count * other.count / count,
+        )
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation; zero with fewer than two values."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@dataclass(frozen=True)
+class MonteCarloAccumulator:
+    """Online, mergeable summary of a Monte Carlo run.
+
+    Trials are ingested as they are produced (``add_trial``/``add_batch``)
+    and discarded, so memory does not grow with the number of trials.
+    Shards of a run return accumulators instead of trial objects; merging
+    them in shard order makes the ``MonteCarloResult`` independent of how
+    shards were scheduled. Final keys, when a run amplifies them, are
+    counted separately in the ``final_key_*`` fields.
+    """
+
+    block_length: int
+    trials: int = 0
+    blocks: int = 0
+    channel_samples: int = 0
+    bob_raw_errors: int = 0
+    bob_reconciled_errors: int = 0
+    eve_raw_errors: int = 0
+    eve_reconciled_errors: int = 0
+    bob_failed_frames: int = 0
+    bob_failed_blocks: int = 0
+    sample_retries: int = 0
+    discarded_samples: int = 0
+    retention_rate: RunningMoments = field(default_factory=RunningMoments)
+    alice_bob_correlation: RunningMoments = field(default_factory=RunningMoments)
+    alice_eve_correlation: RunningMoments = field(default_factory=RunningMoments)
+    final_key_bits: int = 0
+    final_key_trials: int = 0
+    final_key_agreements: int = 0
+    eve_final_key_errors: int = 0
+
+    @classmethod
+    def from_trial(cls, trial: TrialResult) -> MonteCarloAccumulator:
+        alice = trial.alice_bits
+        failed_blocks = np.any(
+            alice.reshape(trial.blocks, -1)
+            != trial.bob_reconciled.bits.reshape(trial.blocks, -1),
+            axis=1,
+        )
+        return cls(
+            block_length=trial.block_length,
+            trials=1,
+            blocks=trial.blocks,
+            channel_samples=trial.transcript.quantization.source_length,
+            bob_raw_errors=hamming_distance(alice, trial.bob_bits),
+            bob_reconciled_errors=hamming_distance(alice, trial.bob_reconciled.bits),
+            eve_raw_errors=hamming_distance(alice, trial.eve_bits),
+            eve_reconciled_errors=hamming_distance(alice, trial.eve_reconciled.bits),
+            bob_failed_frames=int(np.any(failed_blocks)),
+            bob_failed_blocks=int(np.count_nonzero(failed_blocks)),
+            sample_retries=trial.sample_retries,
+            discarded_samples=trial.discarded_samples,
+            retention_rate=RunningMoments(1, trial.retention_rate),
+            alice_bob_correlation=RunningMoments(
+                1,
+                trial.alice_bob_observation_correlation,
+            ),
+            alice_eve_correlation=RunningMoments(
+                1,
+                trial.alice_eve_observation_correlation,
+            ),
+        )
+
+    @classmethod
+    def from_batch(cls, batch: TrialBatch) -> MonteCarloAccumulator:
+        alice = batch.alice_bits
+        failed_blocks = np.any(alice != batch.bob_reconciled_bits, axis=1)
+        failed_trials = np.unique(batch.block_trials[failed_blocks])
+        return cls(
+            block_length=batch.block_length,
+            trials=batch.trials,
+            blocks=batch.blocks,
+            channel_samples=batch.trials * batch.source_length,
+            bob_raw_errors=int(np.count_nonzero(alice != batch.bob_bits)),
+            bob_reconciled_errors=int(
+                np.count_nonzero(alice != batch.bob_reconciled_bits)
+            ),
+            eve_raw_errors=int(np.count_nonzero(alice != batch.eve_bits)),
+            eve_reconciled_errors=int(
+                np.count_nonzero(alice != batch.eve_reconciled_bits)
+            ),
+            bob_failed_frames=len(failed_trials),
+            bob_failed_blocks=int(np.count_nonzero(failed_blocks)),
+            sample_retries=batch.sample_retries,
+            discarded_samples=batch.discarded_samples,
+            retention_rate=RunningMoments.from_values(batch.retention_rates),
+            alice_bob_correlation=RunningMoments.from_values(
+                batch.alice_bob_observation_correlations
+            ),
+            alice_eve_correlation=RunningMoments.from_values(
+                batch.alice_eve_observation_correlations
+            ),
+        )
+
+    def add_final_key(self, final_key: FinalKeyResult) -> MonteCarloAccumulator:
+        return self.add_final_keys(
+            FinalKeyBatch(
+                alice_keys=final_key.alice_key[None, :],
+                bob_keys=final_key.bob_key[None, :],
+                eve_keys=final_key.eve_key[None, :],
+            )
+        )
+
+    def add_final_keys(self, final_keys: FinalKeyBatch) -> MonteCarloAccumulator:
+        if final_keys.trials == 0:
+            return self
+        if self.final_key_trials and final_keys.key_length != self.final_key_bits:
+            raise ValueError("all final keys must have the same length")
+        alice = final_keys.alice_keys
+        agreements = np.count_nonzero(np.all(alice == final_keys.bob_keys, axis=1))
+        eve_errors = np.count_nonzero(alice != final_keys.eve_keys)
+        return replace(
+            self,
+            final_key_bits=final_keys.key_length,
+            final_key_trials=self.final_key_trials + final_keys.trials,
+            final_key_agreements=self.final_key_agreements + int(agreements),
+            eve_final_key_errors=self.eve_final_key_errors + int(eve_errors),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-compatible state; ``from_dict`` restores it exactly."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MonteCarloAccumulator:
+        values = {}
+        for item in fields(cls):
+            value = data[item.name]
+            if isinstance(value, dict):
+                value = RunningMoments(**value)
+            values[item.name] = value
+        return cls(**values)
+
+    def add_trial(self, trial: TrialResult) -> MonteCarloAccumulator:
+        return self.merge(MonteCarloAccumulator.from_trial(trial))
+
+    def add_batch(self, batch: TrialBatch) -> MonteCarloAccumulator:
+        return self.merge(MonteCarloAccumulator.from_batch(batch))
+
+    def merge(self, other: MonteCarloAccumulator) -> MonteCarloAccumulator:
+        if other.block_length != self.block_length:
+            raise ValueError("all trials must use the same block length")
+        if other.trials == 0:
+            return self
+        if self.trials == 0:
+            return other
+        if (
+            self.final_key_trials
+            and other.final_key_trials
+            and self.final_key_bits != other.final_key_bits
+        ):
+            raise ValueError("all final keys must have the same length")
+        return MonteCarloAccumulator(
+            block_length=self.block_length,
+            trials=self.trials + other.trials,
+            blocks=self.blocks + other.blocks,
+            channel_samples=self.channel_samples + other.channel_samples,
+            bob_raw_errors=self.bob_raw_errors + other.bob_raw_errors,
+            bob_reconciled_errors=(
+                self.bob_reconciled_errors + other.bob_reconciled_errors
+            ),
+            eve_raw_errors=self.eve_raw_errors + other.eve_raw_errors,
+            eve_reconciled_errors=(
+                self.eve_reconciled_errors + other.eve_reconciled_errors
+            ),
+            bob_failed_frames=self.bob_failed_frames + other.bob_failed_frames,
+            bob_failed_blocks=self.bob_failed_blocks + other.bob_failed_blocks,
+            sample_retries=self.sample_retries + other.sample_retries,
+            discarded_samples=self.discarded_samples + other.discarded_samples,
+            retention_rate=self.retention_rate.merge(other.retention_rate),
+            alice_bob_correlation=self.alice_bob_correlation.merge(
+                other.alice_bob_correlation
+            ),
+            alice_eve_correlation=self.alice_eve_correlation.merge(
+                other.alice_eve_correlation
+            ),
+            final_key_bits=self.final_key_bits or other.final_key_bits,
+            final_key_trials=self.final_key_trials + other.final_key_trials,
+            final_key_agreements=(
+                self.final_key_agreements + other.final_key_agreements
+            ),
+            eve_final_key_errors=(
+                self.eve_final_key_errors + other.eve_final_key_errors
+            ),
+        )
+
+    def counts(self, metric: IntervalMetric) -> tuple[int, int]:
+        """Events and opportunities behind a rate reported by ``finalize``."""
+        total_bits = self.block_length * self.blocks
+        counts = {
+            "bob_frame_error_rate": (self.bob_failed_frames, self.trials),
+            "bob_raw_mismatch_rate": (self.bob_raw_errors, total_bits),
+            "bob_reconciled_mismatch_rate": (self.bob_reconciled_errors, total_bits),
+            "eve_reconciled_mismatch_rate": (self.eve_reconciled_errors, total_bits),
+        }
+        if metric not in counts:
+            raise ValueError(f"metric must be one of {INTERVAL_METRICS}")
+        return counts[metric]
+
+    def finalize(
+        self,
+        seed: int,
+        confidence: float = 0.95,
+        method: IntervalMethod = "wilson",
+    ) -> MonteCarloResult:
+        if self.trials == 0:
+            raise ValueError("at least one trial is required")
+        frame_interval, raw_interval, reconciled_interval, eve_interval = (
+            binomial_interval(*self.counts(metric), confidence, method)
+            for metric in INTERVAL_METRICS
+        )
+        total_bits = self.block_length * self.blocks
+        drawn_samples = self.channel_samples + self.discarded_samples
+        final_key_bits = None
+        final_key_agreement_rate = None
+        eve_final_key_mismatch_rate = None
+        if self.final_key_trials:
+            final_key_bits = self.final_key_bits
+            final_key_agreement_rate = (
+                self.final_key_agreements / self.final_key_trials
+            )
+            eve_final_key_mismatch_rate = self.eve_final_key_errors / (
+                self.final_key_bits * self.final_key_trials
+            )
+        return MonteCarloResult(
+            trials=self.trials,
+            bits_per_trial=self.block_length,
+            bob_raw_mismatch_rate=self.bob_raw_errors / total_bits,
+            bob_reconciled_mismatch_rate=self.bob_reconciled_errors / total_bits,
+            bob_frame_error_rate=self.bob_failed_frames / self.trials,
+            eve_raw_mismatch_rate=self.eve_raw_errors / total_bits,
+            eve_reconciled_mismatch_rate=self.eve_reconciled_errors / total_bits,
+            mean_retention_rate=self.retention_rate.mean,
+            mean_alice_bob_correlation=self.alice_bob_correlation.mean,
+            mean_alice_eve_correlation=self.alice_eve_correlation.mean,
+            std_retention_rate=self.retention_rate.std,
+            std_alice_bob_correlation=self.alice_bob_correlation.std,
+            std_alice_eve_correlation=self.alice_eve_correlation.std,
+            mean_blocks_per_trial=self.blocks / self.trials,
+            bob_block_error_rate=self.bob_failed_blocks / self.blocks,
+            key_bits_per_sample=(
+                total_bits / self.channel_samples if self.channel_samples else 0.0
+            ),
+            mean_sample_retries=self.sample_retries / self.trials,
+            wasted_sample_fraction=(
+                self.discarded_samples / drawn_samples if drawn_samples else 0.0
+            ),
+            bob_frame_error_rate_lower=frame_interval[0],
+            bob_frame_error_rate_upper=frame_interval[1],
+            bob_raw_mismatch_rate_lower=raw_interval[0],
+            bob_raw_mismatch_rate_upper=raw_interval[1],
+            bob_reconciled_mismatch_rate_lower=reconciled_interval[0],
+            bob_reconciled_mismatch_rate_upper=reconciled_interval[1],
+            eve_reconciled_mismatch_rate_lower=eve_interval[0],
+            eve_reconciled_mismatch_rate_upper=eve_interval[1],
+            interval_confidence=confidence,
+            interval_method=method,
+            seed=seed,
+            final_key_bits=final_key_bits,
+            final_key_agreement_rate=final_key_agreement_rate,
+            eve_final_key_mismatch_rate=eve_final_key_mismatch_rate,
+        )
 
 
 def aggregate_trials(trials: list[TrialResult], seed: int) -> MonteCarloResult:
     if not trials:
         raise ValueError("at least one trial is required")
-    block_length = len(trials[0].alice_bits)
-    if any(len(trial.alice_bits) != block_length for trial in trials):
-        raise ValueError("all trials must use the same block length")
-
-    total_bits = block_length * len(trials)
-    bob_raw_errors = sum(
-        hamming_distance(trial.alice_bits, trial.bob_bits) for trial in trials
-    )
-    bob_reconciled_errors = sum(
-        hamming_distance(trial.alice_bits, trial.bob_reconciled.bits)
-        for trial in trials
-    )
-    eve_raw_errors = sum(
-        hamming_distance(trial.alice_bits, trial.eve_bits) for trial in trials
-    )
-    eve_reconciled_errors = sum(
-        hamming_distance(trial.alice_bits, trial.eve_reconciled.bits)
-        for trial in trials
-    )
-    failed_frames = sum(
-        not np.array_equal(trial.alice_bits, trial.bob_reconciled.bits)
-        for trial in trials
-    )
-
-    return MonteCarloResult(
-        trials=len(trials),
-        bits_per_trial=block_length,
-        bob_raw_mismatch_rate=bob_raw_errors / total_bits,
-        bob_reconciled_mismatch_rate=bob_reconciled_errors / total_bits,
-        bob_frame_error_rate=failed_frames / len(trials),
-        eve_raw_mismatch_rate=eve_raw_errors / total_bits,
-        eve_reconciled_mismatch_rate=eve_reconciled_errors / total_bits,
-        mean_retention_rate=float(
-            np.mean([trial.retention_rate for trial in trials])
-        ),
-        mean_alice_bob_correlation=float(
-            np.mean(
-                [trial.alice_bob_observation_correlation for trial in trials]
-            )
-        ),
-        mean_alice_eve_correlation=float(
-            np.mean(
-                [trial.alice_eve_observation_correlation for trial in trials]
-            )
-        ),
-        seed=seed,
-    )
+    accumulator = MonteCarloAccumulator(block_length=len(trials[0].alice_bits))
+    for trial in trials:
+        accumulator = accumulator.add_trial(trial)
+    return accumulator.finalize(seed)
+
+
+def aggregate_trial_batches(
+    batches: list[TrialBatch],
+    seed: int,
+) -> MonteCarloResult:
+    """Aggregate batched trials into the same metrics as ``aggregate_trials``."""
+    if not batches:
+        raise ValueError("at least one trial is required")
+    accumulator = MonteCarloAccumulator(block_length=batches[0].block_length)
+    for batch in batches:
+        accumulator = accumulator.add_batch(batch)
+    return accumulator.finalize(seed)
+
+
+def merge_accumulators(
+    accumulators: list[MonteCarloAccumulator],
+    seed: int,
+) -> MonteCarloResult:
+    """Merge shard accumulators in order and finalize the combined result."""
+    if not accumulators:
+        raise ValueError("at least one trial is required")
+    merged = accumulators[0]
+    for accumulator in accumulators[1:]:
+        merged = merged.merge(accumulator)
+    return merged.finalize(seed)
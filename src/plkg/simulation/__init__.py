@@ -1,9 +1,41 @@
+from plkg.simulation.bank import ChannelBank, create_channel_bank
+from plkg.simulation.checkpoint import MonteCarloCheckpoint
+from plkg.simulation.eavesdroppers import (
+    run_csi_eavesdropper_trial,
+    run_rssi_eavesdropper_trial,
+)
+from plkg.simulation.key_rate import (
+    independent_samples_per_second,
+    secure_key_bits_per_second,
+)
+from plkg.simulation.latency import simulate_key_latency
+from plkg.simulation.rare_events import (
+    estimate_csi_frame_error_rate,
+    estimate_rssi_frame_error_rate,
+)
 from plkg.simulation.runner import run_csi_monte_carlo, run_rssi_monte_carlo
-from plkg.simulation.scenario import CsiScenario, RssiScenario
+from plkg.simulation.scenario import CsiScenario, RssiScenario, profile_scenario
+from plkg.simulation.sweep import run_csi_sweep, run_rssi_sweep
+from plkg.simulation.traces import iter_trace_trials, run_trace
 
 __all__ = [
+    "ChannelBank",
     "CsiScenario",
+    "MonteCarloCheckpoint",
     "RssiScenario",
+    "create_channel_bank",
+    "estimate_csi_frame_error_rate",
+    "estimate_rssi_frame_error_rate",
+    "independent_samples_per_second",
+    "iter_trace_trials",
+    "profile_scenario",
+    "run_csi_eavesdropper_trial",
     "run_csi_monte_carlo",
+    "run_csi_sweep",
+    "run_rssi_eavesdropper_trial",
     "run_rssi_monte_carlo",
+    "run_rssi_sweep",
+    "run_trace",
+    "secure_key_bits_per_second",
+    "simulate_key_latency",
 ]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import ComplexArray
+from plkg.simulation.scenario import (
+    CsiScenario,
+    RssiScenario,
+    sample_observer_channels,
+)
+
+BANK_FORMAT_VERSION = 1
+HEADER_FILE = "header.json"
+CHANNELS_FILE = "channels.npy"
+BANK_DTYPES = frozenset({"complex64", "complex128"})
+DEFAULT_WRITE_ROWS = 1_024
+
+
+@dataclass(frozen=True)
+class ChannelBankHeader:
+    """How a channel bank was drawn; stored next to it as JSON."""
+
+    seed: int
+    sigma: float
+    alice_bob_correlation: float
+    alice_eve_correlation: float
+    rows: int
+    samples: int
+    dtype: str = "complex128"
+    doppler_hz: float | None = None
+    sample_interval_s: float = 1.0
+    format_version: int = BANK_FORMAT_VERSION
+
+    def __post_init__(self) -> None:
+        if self.rows <= 0 or self.samples <= 0:
+            raise ValueError("a channel bank needs positive rows and samples")
+        if self.dtype not in BANK_DTYPES:
+            raise ValueError(f"dtype must be one of {sorted(BANK_DTYPES)}")
+        if self.format_version != BANK_FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported channel bank format {self.format_version}"
+            )
+
+    @classmethod
+    def for_scenario(
+        cls,
+        scenario: CsiScenario | RssiScenario,
+        rows: int,
+        samples: int,
+        seed: int,
+        dtype: str,
+    ) -> ChannelBankHeader:
+        return cls(
+            seed=seed,
+            sigma=scenario.sigma,
+            alice_bob_correlation=scenario.alice_bob_correlation,
+            alice_eve_correlation=scenario.alice_eve_correlation,
+            rows=rows,
+            samples=samples,
+            dtype=dtype,
+            doppler_hz=scenario.doppler_hz,
+            sample_interval_s=scenario.sample_interval_s,
+        )
+
+    def check_scenario(self, scenario: CsiScenario | RssiScenario) -> None:
+        """Reject scenarios whose channel law differs from the bank's."""
+        fields = [
+            ("sigma", scenario.sigma, self.sigma),
+            (
+                "alice_bob_correlation",
+                scenario.alice_bob_correlation,
+                self.alice_bob_correlation,
+            ),
+            (
+                "alice_eve_correlation",
+                scenario.alice_eve_correlation,
+                self.alice_eve_correlation,
+            ),
+        ]
+        if scenario.doppler_hz is not None or self.doppler_hz is not None:
+            # Without fading the sample interval does not shape the channels.
+            if scenario.doppler_hz is None or self.doppler_hz is None:
+                raise ValueError("scenario and channel bank differ in fading")
+            fields += [
+                ("doppler_hz", scenario.doppler_hz, self.doppler_hz),
+                (
+                    "sample_interval_s",
+                    scenario.sample_interval_s,
+                    self.sample_interval_s,
+                ),
+            ]
+        for name, scenario_value, bank_value in fields:
+            if not math.isclose(scenario_value, bank_value):
+                raise ValueError(
+                    f"scenario {name} {scenario_value} does not match "
+                    f"the channel bank's {bank_value}"
+                )
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChannelBankHeader:
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class ChannelBank:
+    """Pre-drawn Alice, Bob and Eve channels in a memory-mapped ``.npy`` file.
+
+    ``channels.npy`` has shape ``(3, rows, samples)``, one plane per
+    observer, and row ``i`` feeds trial ``i`` of a run. Only the path and
+    header are held (and pickled to worker processes); every read maps the
+    file again, so processes share the page cache instead of private copies.
+    """
+
+    path: Path
+    header: ChannelBankHeader
+
+    @classmethod
+    def open(cls, path: str | Path) -> ChannelBank:
+        directory = Path(path)
+        header = ChannelBankHeader.from_dict(
+            json.loads((directory / HEADER_FILE).read_text(encoding="utf-8"))
+        )
+        channels = np.load(directory / CHANNELS_FILE, mmap_mode="r")
+        if channels.shape != (3, header.rows, header.samples) or str(
+            channels.dtype
+        ) != header.dtype:
+            raise ValueError("channel bank data does not match its header")
+        return cls(directory, header)
+
+    @property
+    def channels(self) -> ComplexArray:
+        """Read-only memory map of every channel in the bank."""
+        return np.asarray(np.load(self.path / CHANNELS_FILE, mmap_mode="r"))
+
+    def read(
+        self,
+        rows: NDArray[np.int64],
+        column: int,
+        samples: int,
+    ) -> tuple[ComplexArray, ComplexArray, ComplexArray]:
+        """Alice's, Bob's and Eve's ``samples`` channels from ``column`` on.
+
+        A run of consecutive rows is returned as a view of the memory map;
+        scattered rows are gathered into a copy.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= self.header.rows):
+            raise ValueError(
+                f"the channel bank holds {self.header.rows} trials, "
+                f"but trial {int(rows.max())} was requested"
+            )
+        if column + samples > self.header.samples:
+            raise RuntimeError(
+                f"the channel bank holds {self.header.samples} samples per "
+                f"trial, but {column + samples} were needed"
+            )
+        channels = np.load(self.path / CHANNELS_FILE, mmap_mode="r")
+        columns = slice(column, column + samples)
+        if len(rows) and np.all(np.diff(rows) == 1):
+            selected = channels[:, rows[0] : rows[-1] + 1, columns]
+        else:
+            selected = channels[:, rows, columns]
+        return selected[0], selected[1], selected[2]
+
+
+def create_channel_bank(
+    path: str | Path,
+    scenario: CsiScenario | RssiScenario,
+    rows: int,
+    samples: int,
+    *,
+    seed: int = 0,
+    dtype: str = "complex128",
+    write_rows: int = DEFAULT_WRITE_ROWS,
+) -> ChannelBank:
+    """Draw ``rows`` trials of ``samples`` channels once and store them.
+
+    Channels follow ``sample_observer_channels`` and are written
+    ``write_rows`` rows at a time, so the bank may be larger than memory.
+    Rows must hold enough samples for the windows, retries and top-ups of
+    the runs that read them. The header is written last, so an interrupted
+    write leaves no bank that ``ChannelBank.open`` accepts.
+    """
+    if write_rows <= 0:
+        raise ValueError("write_rows must be positive")
+    header = ChannelBankHeader.for_scenario(scenario, rows, samples, seed, dtype)
+    directory = Path(path)
+    if (directory / HEADER_FILE).exists():
+        raise FileExistsError(f"a channel bank already exists at {directory}")
+    directory.mkdir(parents=True, exist_ok=True)
+    channels = np.lib.format.open_memmap(
+        directory / CHANNELS_FILE,
+        mode="w+",
+        dtype=np.dtype(dtype),
+        shape=(3, rows, samples),
+    )
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, write_rows):
+        stop = min(rows, start + write_rows)
+        for plane, drawn in enumerate(
+            sample_observer_channels(scenario, (stop - start, samples), rng)
+        ):
+            channels[plane, start:stop] = drawn
+    channels.flush()
+    del channels
+    (directory / HEADER_FILE).write_text(
+        json.dumps(header.as_dict(), indent=2),
+        encoding="utf-8",
+    )
+    return ChannelBank(directory, header)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+
+from plkg.security.metrics import MonteCarloAccumulator
+
+
+@dataclass(frozen=True)
+class MonteCarloCheckpoint:
+    """Progress of a sharded Monte Carlo run.
+
+    ``segments`` lists the trials of the initial run and of every extension.
+    Each segment is split into shards of at most ``batch_size`` trials, and
+    shards are numbered across segments: shard ``i`` always draws from child
+    ``i`` of ``SeedSequence(seed)``, so the generator state of every pending
+    shard is known without saving it. ``accumulator`` merges the first
+    ``completed_shards`` shards in order, exactly as an uninterrupted run does.
+    """
+
+    seed: int
+    batch_size: int
+    segments: tuple[int, ...]
+    completed_shards: int
+    accumulator: MonteCarloAccumulator
+
+    def __post_init__(self) -> None:
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if any(trials <= 0 for trials in self.segments):
+            raise ValueError("segments must have a positive number of trials")
+        if not 0 <= self.completed_shards <= len(self.shard_sizes):
+            raise ValueError("completed_shards exceeds the planned shards")
+        object.__setattr__(self, "segments", tuple(self.segments))
+
+    @classmethod
+    def start(
+        cls,
+        block_length: int,
+        trials: int,
+        seed: int,
+        batch_size: int,
+    ) -> MonteCarloCheckpoint:
+        return cls(
+            seed=seed,
+            batch_size=batch_size,
+            segments=(trials,),
+            completed_shards=0,
+            accumulator=MonteCarloAccumulator(block_length=block_length),
+        )
+
+    @property
+    def trials(self) -> int:
+        return sum(self.segments)
+
+    @property
+    def shard_sizes(self) -> list[int]:
+        return [
+            min(self.batch_size, trials - start)
+            for trials in self.segments
+            for start in range(0, trials, self.batch_size)
+        ]
+
+    @property
+    def complete(self) -> bool:
+        return self.completed_shards == len(self.shard_sizes)
+
+    def pending_shards(self) -> list[tuple[int, np.random.SeedSequence]]:
+        """``(trials, seed_sequence)`` of every shard still to run."""
+        first = self.completed_shards
+        return [
+            (trials, np.random.SeedSequence(self.seed, spawn_key=(index,)))
+            for index, trials in enumerate(self.shard_sizes[first:], start=first)
+        ]
+
+    def pending_first_trials(self) -> list[int]:
+        """Index of the first trial of every pending shard, across segments."""
+        offsets = np.cumsum([0, *self.shard_sizes[:-1]], dtype=np.int64)
+        return [int(offset) for offset in offsets[self.completed_shards :]]
+
+    def extend(self, trials: int) -> MonteCarloCheckpoint:
+        """Append a segment of ``trials`` new trials."""
+        return replace(self, segments=(*self.segments, trials))
+
+    def add_shard(self, accumulator: MonteCarloAccumulator) -> MonteCarloCheckpoint:
+        return replace(
+            self,
+            completed_shards=self.completed_shards + 1,
+            accumulator=self.accumulator.merge(accumulator),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "batch_size": self.batch_size,
+            "segments": list(self.segments),
+            "completed_shards": self.completed_shards,
+            "accumulator": self.accumulator.as_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MonteCarloCheckpoint:
+        return cls(
+            seed=data["seed"],
+            batch_size=data["batch_size"],
+            segments=tuple(data["segments"]),
+            completed_shards=data["completed_shards"],
+            accumulator=MonteCarloAccumulator.from_dict(data["accumulator"]),
+        )
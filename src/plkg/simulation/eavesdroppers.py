@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+
+import numpy as np
+
+from plkg.core.models import (
+    ComplexArray,
+    EavesdropperReport,
+    FeatureSeries,
+    FloatArray,
+    TrialResult,
+)
+from plkg.protocol.pipeline import evaluate_eavesdroppers, execute_protocol
+from plkg.protocol.reconciliation import (
+    BchCodeOffsetReconciler,
+    create_bch_codec,
+)
+from plkg.radio.channels.rayleigh import (
+    add_complex_estimation_noise,
+    mix_joint_channels,
+    observer_correlation_matrix,
+)
+from plkg.radio.measurements.decimation import CoherenceDecimator
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.simulation.planning import default_window_samples
+from plkg.simulation.runner import (
+    MAX_SAMPLE_ATTEMPTS,
+    _scenario_quantizer,
+)
+from plkg.simulation.scenario import (
+    CsiScenario,
+    RssiScenario,
+    sample_scenario_channel,
+)
+
+ObserverFeatures = Callable[[ComplexArray, np.random.Generator], FloatArray]
+
+
+def _run_eavesdropper_trial(
+    scenario: CsiScenario | RssiScenario,
+    alice_eve_correlations: Sequence[float],
+    block_length: int,
+    rng: np.random.Generator,
+    features: ObserverFeatures,
+    feature_name: str,
+    multi_block: bool,
+) -> tuple[TrialResult, EavesdropperReport]:
+    """Draw Alice, Bob and every Eve jointly and attack one transcript.
+
+    The ``2 + K`` channels come from one ``mix_joint_channels`` product of
+    sequences with the scenario's fading; ``alice_eve_correlations`` replaces
+    the scenario's single Eve. A window that retains no block is redrawn
+    with twice the samples. The trial's own Eve is the first eavesdropper.
+    """
+    if len(alice_eve_correlations) == 0:
+        raise ValueError("at least one eavesdropper is required")
+    correlation = observer_correlation_matrix(
+        scenario.alice_bob_correlation,
+        alice_eve_correlations,
+    )
+    quantizer = _scenario_quantizer(scenario)
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
+    sample_count = default_window_samples(
+        block_length,
+        scenario.guard_band_sigma,
+        None,
+        scenario.quantization_bits,
+    )
+    decimator = CoherenceDecimator(scenario.decimation_stride)
+    retries = 0
+    discarded = 0
+
+    for _ in range(MAX_SAMPLE_ATTEMPTS):
+        channels = mix_joint_channels(
+            correlation,
+            sample_scenario_channel(
+                scenario,
+                (len(correlation), sample_count * decimator.stride),
+                rng,
+            ),
+        )
+        observed = decimator.apply_batch(features(channels, rng))
+        alice, bob, eve = (FeatureSeries(row, feature_name) for row in observed[:3])
+        try:
+            trial = execute_protocol(
+                alice,
+                bob,
+                eve,
+                quantizer=quantizer,
+                reconciler=reconciler,
+                rng=rng,
+                multi_block=multi_block,
+            )
+        except RuntimeError:
+            retries += 1
+            discarded += sample_count
+            sample_count *= 2
+            continue
+        report = evaluate_eavesdroppers(
+            trial.alice_bits,
+            observed[2:],
+            trial.transcript,
+            quantizer,
+            reconciler,
+        )
+        trial = replace(trial, sample_retries=retries, discarded_samples=discarded)
+        return trial, report
+
+    raise RuntimeError("guard band retained too few samples after eight attempts")
+
+
+def run_csi_eavesdropper_trial(
+    scenario: CsiScenario,
+    alice_eve_correlations: Sequence[float],
+    block_length: int,
+    rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
+) -> tuple[TrialResult, EavesdropperReport]:
+    """``run_csi_trial`` with one Eve per entry of ``alice_eve_correlations``."""
+
+    def features(channels: ComplexArray, local_rng: np.random.Generator) -> FloatArray:
+        return np.abs(
+            add_complex_estimation_noise(
+                channels,
+                scenario.noise_variance,
+                scenario.relative_estimation_error,
+                local_rng,
+            )
+        )
+
+    return _run_eavesdropper_trial(
+        scenario,
+        alice_eve_correlations,
+        block_length,
+        rng,
+        features,
+        "csi_amplitude",
+        multi_block,
+    )
+
+
+def run_rssi_eavesdropper_trial(
+    scenario: RssiScenario,
+    alice_eve_correlations: Sequence[float],
+    block_length: int,
+    rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
+) -> tuple[TrialResult, EavesdropperReport]:
+    """``run_rssi_trial`` with one Eve per entry of ``alice_eve_correlations``."""
+
+    def features(channels: ComplexArray, local_rng: np.random.Generator) -> FloatArray:
+        return rssi_levels_dbm(
+            channels,
+            scenario.reference_power_dbm,
+            scenario.measurement_noise_std_db,
+            scenario.resolution_db,
+            local_rng,
+        )
+
+    return _run_eavesdropper_trial(
+        scenario,
+        alice_eve_correlations,
+        block_length,
+        rng,
+        features,
+        "rssi_level",
+        multi_block,
+    )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from plkg.protocol.reconciliation import create_bch_codec
+from plkg.radio.channels.mobility import doppler_coherence_time_s
+from plkg.security.entropy import extractable_key_length, guessing_min_entropy
+from plkg.security.metrics import MonteCarloAccumulator
+from plkg.simulation.scenario import CsiScenario, RssiScenario
+
+DEFAULT_SECURITY_BITS = 64
+
+
+def independent_samples_per_second(scenario: CsiScenario | RssiScenario) -> float:
+    """Rate of roughly independent samples that reach the quantizer.
+
+    Quantized samples arrive every ``decimation_stride * sample_interval_s``
+    seconds. Scenarios without ``doppler_hz`` draw independent channels, so
+    every one of them counts; with fading at most one per coherence time
+    does, and a static channel (zero Doppler) yields none.
+    """
+    quantized = 1.0 / (scenario.decimation_stride * scenario.sample_interval_s)
+    if scenario.doppler_hz is None:
+        return quantized
+    return min(quantized, 1.0 / doppler_coherence_time_s(scenario.doppler_hz))
+
+
+def probing_time_s(
+    accumulator: MonteCarloAccumulator,
+    scenario: CsiScenario | RssiScenario,
+) -> float:
+    """Channel probing time of every drawn sample, discarded windows included.
+
+    Drawn samples are counted after decimation, so each one took
+    ``decimation_stride`` probes.
+    """
+    drawn = accumulator.channel_samples + accumulator.discarded_samples
+    return drawn * scenario.decimation_stride * scenario.sample_interval_s
+
+
+def extractable_key_bits(
+    accumulator: MonteCarloAccumulator,
+    scenario: CsiScenario | RssiScenario,
+    *,
+    security_bits: int = DEFAULT_SECURITY_BITS,
+) -> int:
+    """Leftover-hash key length of the blocks Bob reconciled in a run.
+
+    Only blocks Bob reconciled count. A block's min-entropy is capped at
+    ``quantization_bits`` per independent sample of the window it was cut
+    from, so oversampled, correlated bits add no key, and the code-offset
+    syndromes of those blocks are charged as public leakage. What Eve's raw
+    bits reveal is removed first: each bit keeps only the min-entropy left
+    to a guesser who mismatches at the run's ``eve_raw_mismatch_rate``, so
+    the key shrinks to nothing as Eve's channel approaches Alice's.
+    """
+    if accumulator.blocks == 0:
+        return 0
+    interval = scenario.decimation_stride * scenario.sample_interval_s
+    independent_fraction = min(
+        1.0,
+        independent_samples_per_second(scenario) * interval,
+    )
+    # A block spans, on average, its share of the quantized windows.
+    block_entropy = min(
+        float(accumulator.block_length),
+        scenario.quantization_bits
+        * independent_fraction
+        * accumulator.channel_samples
+        / accumulator.blocks,
+    )
+    eve_mismatch_rate = accumulator.eve_raw_errors / (
+        accumulator.block_length * accumulator.blocks
+    )
+    block_entropy *= guessing_min_entropy(eve_mismatch_rate)
+    agreed_blocks = accumulator.blocks - accumulator.bob_failed_blocks
+    codec = create_bch_codec(accumulator.block_length)
+    return extractable_key_length(
+        agreed_blocks * block_entropy,
+        agreed_blocks * (codec.n - codec.k),
+        security_bits,
+    )
+
+
+def secure_key_bits_per_second(
+    accumulator: MonteCarloAccumulator,
+    scenario: CsiScenario | RssiScenario,
+    *,
+    security_bits: int = DEFAULT_SECURITY_BITS,
+) -> float:
+    """Leftover-hash key rate of a run, per second of channel probing.
+
+    The run is treated as one long session: ``extractable_key_bits`` over
+    ``probing_time_s``.
+    """
+    elapsed = probing_time_s(accumulator, scenario)
+    if elapsed == 0:
+        return 0.0
+    key_bits = extractable_key_bits(
+        accumulator,
+        scenario,
+        security_bits=security_bits,
+    )
+    return key_bits / elapsed
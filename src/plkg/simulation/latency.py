@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+import numpy as np
+
+from plkg.core.models import KeyLatencyResult, TrialResult
+from plkg.security.metrics import MonteCarloAccumulator
+from plkg.simulation.key_rate import (
+    DEFAULT_SECURITY_BITS,
+    extractable_key_bits,
+    probing_time_s,
+)
+from plkg.simulation.runner import run_csi_trial, run_rssi_trial
+from plkg.simulation.scenario import CsiScenario, RssiScenario
+
+DEFAULT_KEY_BITS = 128
+
+
+def _window_runner(
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    rng: np.random.Generator,
+) -> Callable[[], TrialResult]:
+    if isinstance(scenario, CsiScenario):
+        return lambda: run_csi_trial(scenario, block_length, rng, multi_block=True)
+    return lambda: run_rssi_trial(scenario, block_length, rng, multi_block=True)
+
+
+def _run_session(
+    next_window: Callable[[], TrialResult],
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    key_bits: int,
+    keys_per_session: int,
+    security_bits: int,
+    round_trip_s: float,
+    max_windows_per_key: int,
+) -> tuple[float, float, int, int, int]:
+    """First-key time, duration, keys, and windows and failed blocks per key."""
+    elapsed = 0.0
+    first_key_s = math.inf
+    keys = 0
+    windows = 0
+    failed_blocks = 0
+    while keys < keys_per_session:
+        pool = MonteCarloAccumulator(block_length=block_length)
+        for _ in range(max_windows_per_key):
+            sample = MonteCarloAccumulator.from_trial(next_window())
+            pool = pool.merge(sample)
+            elapsed += probing_time_s(sample, scenario)
+            elapsed += sample.blocks * round_trip_s
+            if (
+                extractable_key_bits(pool, scenario, security_bits=security_bits)
+                >= key_bits
+            ):
+                break
+        else:
+            break
+        if keys == 0:
+            first_key_s = elapsed
+        keys += 1
+        windows += pool.trials
+        failed_blocks += pool.bob_failed_blocks
+    return first_key_s, elapsed, keys, windows, failed_blocks
+
+
+def simulate_key_latency(
+    scenario: CsiScenario | RssiScenario,
+    *,
+    block_length: int = 127,
+    sessions: int = 200,
+    key_bits: int = DEFAULT_KEY_BITS,
+    keys_per_session: int = 4,
+    security_bits: int = DEFAULT_SECURITY_BITS,
+    round_trip_s: float = 0.0,
+    max_windows_per_key: int = 64,
+    seed: int = 0,
+) -> KeyLatencyResult:
+    """Sample how long sessions take to establish keys over a scenario.
+
+    A session probes one window after another, each a multi-block trial of
+    the per-trial engine, so a window's time includes the windows its
+    guard band discarded and the decimated-away probes. Every
+    reconciliation block adds ``round_trip_s`` for its syndrome exchange.
+    A block Bob fails to reconcile is dropped, so its bits are retransmitted
+    from later windows at the cost of their probing and another round trip.
+    A key is ready once ``extractable_key_bits`` of the blocks gathered for
+    it reaches ``key_bits``; the next key starts from an empty pool. A
+    session that needs more than ``max_windows_per_key`` windows for one
+    key gives up.
+    """
+    if block_length <= 0:
+        raise ValueError("block_length must be positive")
+    if sessions <= 0:
+        raise ValueError("sessions must be positive")
+    if key_bits <= 0:
+        raise ValueError("key_bits must be positive")
+    if keys_per_session <= 0:
+        raise ValueError("keys_per_session must be positive")
+    if round_trip_s < 0:
+        raise ValueError("round_trip_s cannot be negative")
+    if max_windows_per_key <= 0:
+        raise ValueError("max_windows_per_key must be positive")
+
+    next_window = _window_runner(
+        scenario,
+        block_length,
+        np.random.default_rng(seed),
+    )
+    outcomes = [
+        _run_session(
+            next_window,
+            scenario,
+            block_length,
+            key_bits,
+            keys_per_session,
+            security_bits,
+            round_trip_s,
+            max_windows_per_key,
+        )
+        for _ in range(sessions)
+    ]
+    first_key_s, elapsed, keys, windows, failed_blocks = (
+        np.array(column) for column in zip(*outcomes, strict=True)
+    )
+    rates = keys * key_bits / elapsed
+    completed_keys = max(int(np.sum(keys)), 1)
+    # Order statistics rather than interpolation, so infinite times stay put.
+    latency = np.percentile(first_key_s, [50, 95, 99], method="inverted_cdf")
+    throughput = np.percentile(rates, [50, 5, 1], method="inverted_cdf")
+    return KeyLatencyResult(
+        sessions=sessions,
+        key_bits=key_bits,
+        keys_per_session=keys_per_session,
+        security_bits=security_bits,
+        first_key_rate=float(np.mean(keys > 0)),
+        completed_session_rate=float(np.mean(keys == keys_per_session)),
+        time_to_first_key_p50_s=float(latency[0]),
+        time_to_first_key_p95_s=float(latency[1]),
+        time_to_first_key_p99_s=float(latency[2]),
+        sustained_key_bits_per_second_p50=float(throughput[0]),
+        sustained_key_bits_per_second_p05=float(throughput[1]),
+        sustained_key_bits_per_second_p01=float(throughput[2]),
+        mean_sustained_key_bits_per_second=float(np.mean(rates)),
+        mean_windows_per_key=float(np.sum(windows)) / completed_keys,
+        mean_retransmitted_blocks_per_key=float(np.sum(failed_blocks))
+        / completed_keys,
+        seed=seed,
+    )
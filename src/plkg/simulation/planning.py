@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+from plkg.core.models import FloatArray
+from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.radio.channels.rayleigh import add_complex_estimation_noise
+from plkg.radio.measurements.decimation import CoherenceDecimator
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.simulation.scenario import (
+    CsiScenario,
+    RssiScenario,
+    sample_scenario_channel,
+)
+
+_NODES, _HERMITE_WEIGHTS = np.polynomial.hermite_e.hermegauss(24)
+_WEIGHTS = _HERMITE_WEIGHTS / _HERMITE_WEIGHTS.sum()
+PILOT_WINDOWS = 512
+PILOT_ROUNDS = 2
+
+
+@dataclass(frozen=True)
+class SamplePlan:
+    """Window size that retains one block with probability ``confidence``.
+
+    Windows that still fall short are extended by ``top_up_samples`` fresh
+    samples instead of being redrawn. ``dispersion`` is the variance of the
+    retained count relative to a binomial one over the same samples.
+    """
+
+    block_length: int
+    retention_rate: float
+    confidence: float
+    window_samples: int
+    top_up_samples: int
+    dispersion: float = 1.0
+
+
+def rayleigh_retention_rate(guard_band_sigma: float) -> float:
+    """Retention of ``MedianGuardBandQuantizer`` on Rayleigh amplitudes.
+
+    CSI amplitudes with Gaussian estimation noise are Rayleigh; the median
+    and standard deviation both scale with the Rayleigh parameter, so the
+    retained fraction depends on the guard band alone.
+    """
+    if guard_band_sigma <= 0:
+        return 1.0
+    median = math.sqrt(2 * math.log(2))
+    width = guard_band_sigma * math.sqrt((4 - math.pi) / 2)
+    lower = max(median - width, 0.0)
+    upper = median + width
+    inside = math.exp(-(lower**2) / 2) - math.exp(-(upper**2) / 2)
+    return 1.0 - inside
+
+
+def rssi_retention_rate(
+    scenario: RssiScenario,
+    window_samples: int | None = None,
+) -> float:
+    """Retention of ``MedianGuardBandQuantizer`` on reported RSSI levels.
+
+    Levels are ``10 log10`` of an exponential channel power plus Gaussian
+    measurement noise, rounded to ``resolution_db``, so the distribution is
+    computed on its lattice. On a lattice a small change of the median or of
+    the guard band moves whole levels in or out, so with ``window_samples``
+    the result is averaged over the normal sampling distributions of the
+    window median and standard deviation.
+    """
+    if scenario.guard_band_sigma <= 0:
+        return 1.0
+    mean_power_db = 10 * math.log10(2 * scenario.sigma**2)
+    offset = scenario.reference_power_dbm + mean_power_db
+    noise_std = scenario.measurement_noise_std_db
+    spread = 10 / math.log(10) * math.pi / math.sqrt(6)
+    scale = math.hypot(spread, noise_std)
+    resolution = scenario.resolution_db
+
+    def cdf(values: FloatArray) -> FloatArray:
+        exponent = (values[:, None] - offset - noise_std * _NODES[None, :]) / 10
+        power_cdf = -np.expm1(-np.power(10.0, np.minimum(exponent, 300)))
+        return np.asarray(power_cdf @ _WEIGHTS, dtype=np.float64)
+
+    levels = resolution * np.arange(
+        math.floor((offset - 12 * scale) / resolution),
+        math.ceil((offset + 6 * scale) / resolution) + 1,
+    )
+    edges = np.append(levels - resolution / 2, levels[-1] + resolution / 2)
+    masses = np.diff(cdf(edges))
+    masses /= masses.sum()
+    mean = float(masses @ levels)
+    variance = float(masses @ (levels - mean) ** 2)
+    median = float(levels[np.searchsorted(np.cumsum(masses), 0.5)])
+    width = scenario.guard_band_sigma * math.sqrt(variance)
+
+    medians = np.array([median])
+    widths = np.array([width])
+    weights = np.ones((1, 1))
+    if window_samples is not None:
+        continuous = np.linspace(median - 1, median + 1, 3)
+        density = float(np.diff(cdf(continuous[[0, 2]]))[0] / 2)
+        kurtosis = float(masses @ (levels - mean) ** 4) / variance**2
+        median_error = 1 / (2 * density * math.sqrt(window_samples))
+        width_error = width * math.sqrt((kurtosis - 1) / (4 * window_samples))
+        medians = median + median_error * _NODES
+        widths = width + width_error * _NODES
+        weights = np.outer(_WEIGHTS, _WEIGHTS)
+    distances = np.abs(levels[None, :] - medians[:, None])
+    retained = distances[:, None, :] > widths[None, :, None]
+    return float(np.sum(weights * (retained @ masses)))
+
+
+def scenario_retention_rate(
+    scenario: CsiScenario | RssiScenario,
+    window_samples: int | None = None,
+) -> float:
+    if scenario.quantization_bits != 1:
+        raise ValueError("retention planning assumes one-bit quantization")
+    if isinstance(scenario, CsiScenario):
+        return rayleigh_retention_rate(scenario.guard_band_sigma)
+    return rssi_retention_rate(scenario, window_samples)
+
+
+def _samples_for(retained_bits: int, retention_rate: float, confidence: float) -> int:
+    """Smallest window whose binomial retained count reaches the target."""
+    if retention_rate >= 1.0:
+        return retained_bits
+    low = retained_bits
+    high = max(retained_bits, math.ceil(2 * retained_bits / retention_rate) + 64)
+    while stats.binom.sf(retained_bits - 1, high, retention_rate) < confidence:
+        high *= 2
+    while low < high:
+        middle = (low + high) // 2
+        if stats.binom.sf(retained_bits - 1, middle, retention_rate) >= confidence:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def plan_samples(
+    block_length: int,
+    retention_rate: float,
+    confidence: float = 0.99,
+    dispersion: float = 1.0,
+) -> SamplePlan:
+    """Size windows from a predicted retention rate.
+
+    The retained count is modelled as binomial, with its variance scaled by
+    ``dispersion``: a window of ``n`` samples retains like ``n / dispersion``
+    independent ones, each worth ``dispersion`` samples. A window that falls
+    short is usually a few bits short, so the top-up is sized to retain one
+    standard deviation of the retained count with the same confidence.
+    """
+    if block_length <= 0:
+        raise ValueError("block_length must be positive")
+    if not 0 < retention_rate <= 1:
+        raise ValueError("retention_rate must be in (0, 1]")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+    if dispersion <= 0:
+        raise ValueError("dispersion must be positive")
+
+    def samples_for(retained_bits: int) -> int:
+        independent = math.ceil(retained_bits / dispersion)
+        return math.ceil(
+            dispersion * _samples_for(independent, retention_rate, confidence)
+        )
+
+    window = samples_for(block_length)
+    deviation = math.sqrt(
+        dispersion * window * retention_rate * (1 - retention_rate)
+    )
+    return SamplePlan(
+        block_length=block_length,
+        retention_rate=retention_rate,
+        confidence=confidence,
+        window_samples=window,
+        top_up_samples=samples_for(math.ceil(deviation) + 1),
+        dispersion=dispersion,
+    )
+
+
+def retention_probability(plan: SamplePlan, window_samples: int) -> float:
+    """Probability that a window retains a block, under ``plan``'s model."""
+    if window_samples <= 0:
+        raise ValueError("window_samples must be positive")
+    if plan.retention_rate >= 1:
+        return float(window_samples >= plan.block_length)
+    independent = window_samples / plan.dispersion
+    needed = math.ceil(plan.block_length / plan.dispersion)
+    return float(stats.binom.sf(needed - 1, round(independent), plan.retention_rate))
+
+
+def _pilot_retained_counts(
+    scenario: CsiScenario | RssiScenario,
+    window_samples: int,
+    windows: int,
+    rng: np.random.Generator,
+) -> FloatArray:
+    """Samples Alice's quantizer retains in pilot windows of the scenario.
+
+    Features go through the scenario's own channel, estimation or
+    measurement noise and decimation, as the engines produce them.
+    """
+    channels = sample_scenario_channel(
+        scenario,
+        (windows, window_samples * scenario.decimation_stride),
+        rng,
+    )
+    if isinstance(scenario, CsiScenario):
+        features = np.abs(
+            add_complex_estimation_noise(
+                channels,
+                scenario.noise_variance,
+                scenario.relative_estimation_error,
+                rng,
+            )
+        )
+    else:
+        features = rssi_levels_dbm(
+            channels,
+            scenario.reference_power_dbm,
+            scenario.measurement_noise_std_db,
+            scenario.resolution_db,
+            rng,
+        )
+    decimated = CoherenceDecimator(scenario.decimation_stride).apply_batch(features)
+    quantized = MedianGuardBandQuantizer(scenario.guard_band_sigma).prepare_batch(
+        decimated,
+        1,
+    )
+    counts = np.zeros(windows)
+    counts[quantized.source_rows] = np.rint(quantized.retention_rates * window_samples)
+    return counts
+
+
+def plan_scenario_samples(
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    confidence: float = 0.99,
+    *,
+    pilot_windows: int = PILOT_WINDOWS,
+    seed: int = 0,
+) -> SamplePlan:
+    """``plan_samples`` calibrated on pilot windows of ``scenario``.
+
+    The predicted retention rate sizes a first window (RSSI predictions
+    depend on the window size, so that one is refined once). The closed
+    forms assume i.i.d. samples without estimation error, so ``pilot_windows``
+    windows of that size are then drawn from the scenario, seeded by
+    ``seed``, and the plan is resized with their mean retention rate and the
+    dispersion of their retained counts. Those carry what the closed forms
+    leave out: relative estimation error, the spread of each window's
+    median and standard deviation, and fading, which leaves fewer
+    independent samples per window. Each of ``PILOT_ROUNDS`` rounds measures
+    the window the previous one planned.
+    """
+    if pilot_windows < 2:
+        raise ValueError("pilot_windows must be at least 2")
+    plan = plan_samples(block_length, scenario_retention_rate(scenario), confidence)
+    if isinstance(scenario, RssiScenario):
+        retention_rate = scenario_retention_rate(scenario, plan.window_samples)
+        plan = plan_samples(block_length, retention_rate, confidence)
+    if scenario.guard_band_sigma <= 0:
+        return plan
+    rng = np.random.default_rng(seed)
+    for _ in range(PILOT_ROUNDS):
+        samples = plan.window_samples
+        counts = _pilot_retained_counts(scenario, samples, pilot_windows, rng)
+        retention_rate = float(np.mean(counts)) / samples
+        if retention_rate <= 0:
+            raise ValueError("the guard band retained no pilot samples")
+        if retention_rate >= 1:
+            return plan_samples(block_length, 1.0, confidence)
+        # Counts are integers, so a variance below one count is not resolved.
+        variance = max(float(np.var(counts, ddof=1)), 1.0)
+        dispersion = variance / (samples * retention_rate * (1 - retention_rate))
+        plan = plan_samples(block_length, retention_rate, confidence, dispersion)
+    return plan
+
+
+def default_window_samples(
+    block_length: int,
+    guard_band_sigma: float,
+    sample_plan: SamplePlan | None = None,
+    bits_per_sample: int = 1,
+) -> int:
+    """Samples drawn for a window before any retry.
+
+    Without a ``sample_plan`` a window holds enough samples for one block,
+    tripled when a guard band discards some of them.
+    """
+    if sample_plan is not None:
+        return sample_plan.window_samples
+    samples = -(-block_length // bits_per_sample)
+    return samples * (3 if guard_band_sigma > 0 else 1)
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+import numpy as np
+from scipy import stats
+
+from plkg.core.models import BitArray, ComplexArray, FloatArray, FrameErrorEstimate
+from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.protocol.reconciliation import create_bch_codec
+from plkg.radio.channels.rayleigh import (
+    add_complex_estimation_noise,
+    mix_correlated_channel,
+)
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.security.metrics import RunningMoments
+from plkg.simulation.runner import DEFAULT_BATCH_SIZE, MAX_SAMPLE_ATTEMPTS
+from plkg.simulation.scenario import (
+    CsiScenario,
+    RssiScenario,
+    sample_scenario_channel,
+)
+
+AliceFeatures = Callable[[ComplexArray, np.random.Generator], FloatArray]
+FlipProbabilities = Callable[
+    [ComplexArray, ComplexArray | None, FloatArray, BitArray],
+    FloatArray,
+]
+
+
+def frame_error_probabilities(
+    flip_probabilities: FloatArray,
+    correctable_errors: int,
+) -> FloatArray:
+    """Probability that each row has more than ``correctable_errors`` flips.
+
+    Bits of a row flip independently with the given probabilities, so the
+    flip count is Poisson-binomial. Its distribution is built bit by bit,
+    truncated at ``correctable_errors``; the overflow mass is accumulated
+    directly, which keeps tiny tail probabilities accurate.
+    """
+    probabilities = np.asarray(flip_probabilities, dtype=np.float64)
+    if probabilities.ndim != 2:
+        raise ValueError("flip_probabilities must be two-dimensional")
+    if correctable_errors < 0:
+        raise ValueError("correctable_errors cannot be negative")
+    counts = np.zeros((len(probabilities), correctable_errors + 1))
+    counts[:, 0] = 1.0
+    overflow = np.zeros(len(probabilities))
+    for column in probabilities.T:
+        flipped = column[:, None]
+        overflow += counts[:, -1] * column
+        counts[:, 1:] = counts[:, 1:] * (1 - flipped) + counts[:, :-1] * flipped
+        counts[:, 0] *= 1 - column
+    return overflow
+
+
+def _rician_flips(
+    centers: FloatArray,
+    component_variances: FloatArray,
+    thresholds: FloatArray,
+    alice_bits: BitArray,
+) -> FloatArray:
+    """Flip probabilities of amplitudes of complex Gaussians around ``centers``."""
+    variances = np.broadcast_to(component_variances, centers.shape)
+    noisy = variances > 0
+    safe = np.where(noisy, variances, 1.0)
+    limits = np.broadcast_to(thresholds, centers.shape) ** 2 / safe
+    noncentrality = centers**2 / safe
+    above = np.where(
+        noisy,
+        stats.ncx2.sf(limits, 2, noncentrality),
+        centers > thresholds,
+    )
+    below = np.where(
+        noisy,
+        stats.ncx2.cdf(limits, 2, noncentrality),
+        centers <= thresholds,
+    )
+    return np.asarray(np.where(alice_bits == 1, below, above), dtype=np.float64)
+
+
+def _estimate(
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    trials: int,
+    seed: int,
+    batch_size: int,
+    alice_features: AliceFeatures,
+    flip_probabilities: FlipProbabilities,
+    sample_bob_channel: bool,
+) -> FrameErrorEstimate:
+    """Average exact conditional frame error probabilities over trials.
+
+    Alice's channel and observations are drawn as in ``_run_batches`` (short
+    windows are redrawn with twice the samples), and her quantizer fixes the
+    threshold and accepted indices. Bob never influences those, so given the
+    sampled channels his bits flip independently with probabilities that
+    ``flip_probabilities`` computes in closed form, and the frame error
+    probability follows without drawing his measurement noise. With
+    ``sample_bob_channel`` Bob's whole channel is drawn, with the scenario's
+    fading, and passed at the accepted indices; otherwise it is ``None``.
+    """
+    if block_length <= 0:
+        raise ValueError("block_length must be positive")
+    if trials <= 0:
+        raise ValueError("trials must be positive")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if scenario.quantization_bits != 1:
+        raise ValueError("conditional estimates assume one-bit quantization")
+    if scenario.decimation_stride != 1:
+        raise ValueError("conditional estimates do not decimate features")
+    rng = np.random.default_rng(seed)
+    guard_band_sigma = scenario.guard_band_sigma
+    quantizer = MedianGuardBandQuantizer(guard_band_sigma)
+    correctable_errors = create_bch_codec(block_length).t
+    frame_errors = RunningMoments()
+    bit_errors = 0.0
+    retries = 0
+    remaining = trials
+    while remaining > 0:
+        pending = min(batch_size, remaining)
+        sample_count = block_length * (3 if guard_band_sigma > 0 else 1)
+        for _ in range(MAX_SAMPLE_ATTEMPTS):
+            channel = sample_scenario_channel(scenario, (pending, sample_count), rng)
+            result = quantizer.prepare_batch(alice_features(channel, rng), block_length)
+            metadata = result.metadata
+            if metadata.rows:
+                alice_channel = channel[result.source_rows]
+                bob_channel = None
+                if sample_bob_channel:
+                    bob_channel = np.take_along_axis(
+                        mix_correlated_channel(
+                            alice_channel,
+                            sample_scenario_channel(scenario, alice_channel.shape, rng),
+                            scenario.alice_bob_correlation,
+                        ),
+                        metadata.accepted_indices,
+                        axis=1,
+                    )
+                flips = flip_probabilities(
+                    np.take_along_axis(
+                        alice_channel,
+                        metadata.accepted_indices,
+                        axis=1,
+                    ),
+                    bob_channel,
+                    metadata.thresholds[:, None],
+                    result.bits,
+                )
+                frame_errors = frame_errors.merge(
+                    RunningMoments.from_values(
+                        frame_error_probabilities(flips, correctable_errors)
+                    )
+                )
+                bit_errors += float(np.sum(flips))
+            pending -= metadata.rows
+            remaining -= metadata.rows
+            if pending == 0:
+                break
+            retries += pending
+            sample_count *= 2
+        else:
+            raise RuntimeError(
+                "guard band retained too few samples after eight attempts"
+            )
+
+    frame_error_rate = frame_errors.mean
+    variance = frame_errors.std**2
+    bernoulli_variance = frame_error_rate * (1 - frame_error_rate)
+    if variance > 0:
+        variance_reduction = bernoulli_variance / variance
+    else:
+        variance_reduction = math.inf if bernoulli_variance > 0 else 1.0
+    return FrameErrorEstimate(
+        trials=trials,
+        bits_per_trial=block_length,
+        correctable_errors=correctable_errors,
+        frame_error_rate=frame_error_rate,
+        standard_error=frame_errors.std / math.sqrt(trials),
+        bit_error_rate=bit_errors / (trials * block_length),
+        variance_reduction=variance_reduction,
+        mean_sample_retries=retries / trials,
+        seed=seed,
+    )
+
+
+def estimate_csi_frame_error_rate(
+    scenario: CsiScenario,
+    *,
+    block_length: int = 127,
+    trials: int = 1_000,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> FrameErrorEstimate:
+    """Low-variance frame error rate of single-block CSI trials.
+
+    Bob's observation is Gaussian around his channel, so his amplitude is
+    Rician and each bit flips with a noncentral chi-square tail probability.
+    Without relative estimation error the decorrelation from Alice's channel
+    is Gaussian too and is integrated out with the noise; otherwise Bob's
+    channel is sampled and only his estimation noise is integrated out. The
+    same holds with time-correlated fading, where the decorrelation is no
+    longer independent from bit to bit.
+    """
+    rho = scenario.alice_bob_correlation
+    sigma = scenario.sigma
+
+    def alice_features(
+        channel: ComplexArray,
+        rng: np.random.Generator,
+    ) -> FloatArray:
+        return np.abs(
+            add_complex_estimation_noise(
+                channel,
+                scenario.noise_variance,
+                scenario.relative_estimation_error,
+                rng,
+            )
+        )
+
+    relative_error = scenario.relative_estimation_error
+    sample_bob_channel = relative_error > 0 or scenario.doppler_hz is not None
+
+    def flip_probabilities(
+        alice_channel: ComplexArray,
+        bob_channel: ComplexArray | None,
+        thresholds: FloatArray,
+        alice_bits: BitArray,
+    ) -> FloatArray:
+        if bob_channel is None:
+            centers = np.abs(rho * alice_channel)
+            variances = np.full(
+                centers.shape,
+                (1 - rho**2) * sigma**2 + scenario.noise_variance / 2,
+            )
+        else:
+            centers = np.abs(bob_channel)
+            variances = scenario.noise_variance / 2 + (relative_error * centers) ** 2
+        return _rician_flips(centers, variances, thresholds, alice_bits)
+
+    return _estimate(
+        scenario,
+        block_length,
+        trials,
+        seed,
+        batch_size,
+        alice_features,
+        flip_probabilities,
+        sample_bob_channel,
+    )
+
+
+def estimate_rssi_frame_error_rate(
+    scenario: RssiScenario,
+    *,
+    block_length: int = 127,
+    trials: int = 1_000,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> FrameErrorEstimate:
+    """Low-variance frame error rate of single-block RSSI trials.
+
+    Bob's channel is sampled; his reported level exceeds Alice's threshold
+    exactly when his noisy power in dBm reaches the rounding boundary above
+    it, a Gaussian tail probability.
+    """
+    resolution = scenario.resolution_db
+    noise_std = scenario.measurement_noise_std_db
+
+    def alice_features(
+        channel: ComplexArray,
+        rng: np.random.Generator,
+    ) -> FloatArray:
+        return rssi_levels_dbm(
+            channel,
+            scenario.reference_power_dbm,
+            noise_std,
+            resolution,
+            rng,
+        )
+
+    def flip_probabilities(
+        alice_channel: ComplexArray,
+        bob_channel: ComplexArray | None,
+        thresholds: FloatArray,
+        alice_bits: BitArray,
+    ) -> FloatArray:
+        if bob_channel is None:
+            raise ValueError("RSSI flip probabilities need Bob's channel")
+        power = np.maximum(np.abs(bob_channel) ** 2, np.finfo(float).tiny)
+        level = scenario.reference_power_dbm + 10.0 * np.log10(power)
+        boundary = resolution * (np.floor(thresholds / resolution + 1e-9) + 0.5)
+        if noise_std == 0:
+            above = (level >= boundary).astype(np.float64)
+            below = 1.0 - above
+        else:
+            above = stats.norm.sf(boundary, level, noise_std)
+            below = stats.norm.cdf(boundary, level, noise_std)
+        return np.asarray(np.where(alice_bits == 1, below, above), dtype=np.float64)
+
+    return _estimate(
+        scenario,
+        block_length,
+        trials,
+        seed,
+        batch_size,
+        alice_features,
+        flip_probabilities,
+        True,
+    )
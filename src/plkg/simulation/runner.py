@@ -1,73 +1,174 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import repeat
+from pathlib import Path
+from typing import Literal
 
 import numpy as np
 
 from plkg.core.models import (
     ComplexArray,
     FeatureSeries,
+    FloatArray,
     MonteCarloResult,
+    TrialBatch,
     TrialResult,
+    complex_dtype,
 )
-from plkg.protocol.pipeline import execute_protocol
-from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.core.protocols import BatchQuantizer
+from plkg.protocol.pipeline import (
+    amplify_reconciled_keys,
+    amplify_trial_batch,
+    execute_protocol,
+    execute_protocol_batch,
+)
+from plkg.protocol.quantization import MedianGuardBandQuantizer, MultiLevelQuantizer
 from plkg.protocol.reconciliation import (
     BchCodeOffsetReconciler,
     create_bch_codec,
 )
-from plkg.radio.channels.rayleigh import (
-    correlated_complex_channel,
-    sample_rayleigh_channel,
-)
+from plkg.radio.channels.rayleigh import add_complex_estimation_noise
 from plkg.radio.measurements.csi import CsiAmplitudeExtractor, observe_csi
-from plkg.radio.measurements.rssi import RssiLevelExtractor, observe_rssi
-from plkg.security.metrics import aggregate_trials
-from plkg.simulation.scenario import CsiScenario, RssiScenario
+from plkg.radio.measurements.decimation import CoherenceDecimator
+from plkg.radio.measurements.rssi import (
+    RssiLevelExtractor,
+    observe_rssi,
+    rssi_levels_dbm,
+)
+from plkg.security.intervals import PrecisionTarget
+from plkg.security.metrics import MonteCarloAccumulator
+from plkg.simulation.bank import ChannelBank
+from plkg.simulation.checkpoint import MonteCarloCheckpoint
+from plkg.simulation.key_rate import (
+    independent_samples_per_second,
+    secure_key_bits_per_second,
+)
+from plkg.simulation.planning import (
+    SamplePlan,
+    default_window_samples,
+    plan_scenario_samples,
+    retention_probability,
+)
+from plkg.simulation.scenario import (
+    CsiScenario,
+    RssiScenario,
+    sample_observer_channels,
+)
 
 FeatureFactory = Callable[
     [ComplexArray, ComplexArray, ComplexArray, np.random.Generator],
     tuple[FeatureSeries, FeatureSeries, FeatureSeries],
 ]
+BatchFeatureFactory = Callable[
+    [ComplexArray, ComplexArray, ComplexArray, np.random.Generator],
+    tuple[FloatArray, FloatArray, FloatArray],
+]
+Engine = Literal["batched", "per_trial"]
+ShardRunner = Callable[..., MonteCarloAccumulator]
+CheckpointCallback = Callable[[MonteCarloCheckpoint], None]
+DEFAULT_BATCH_SIZE = 1_024
+MAX_SAMPLE_ATTEMPTS = 8
+
+
+def _scenario_quantizer(scenario: CsiScenario | RssiScenario) -> BatchQuantizer:
+    """The median quantizer, or a multi-level one for several bits per sample."""
+    if scenario.quantization_bits == 1:
+        return MedianGuardBandQuantizer(scenario.guard_band_sigma)
+    return MultiLevelQuantizer(scenario.quantization_bits, scenario.guard_band_sigma)
+
+
+def _fading_horizon(
+    scenario: CsiScenario | RssiScenario,
+    sample_plan: SamplePlan | None,
+) -> int | None:
+    """Probes a planned window can reach with all its top-ups, when it fades.
+
+    Jakes sequences are generated whole, so a top-up drawn on its own would
+    start an unrelated sequence. Faded windows with a plan are instead
+    generated once at this length and revealed column by column, so every
+    top-up continues the window's sequences.
+    """
+    if sample_plan is None or scenario.doppler_hz is None:
+        return None
+    top_ups = (MAX_SAMPLE_ATTEMPTS - 1) * sample_plan.top_up_samples
+    return (sample_plan.window_samples + top_ups) * scenario.decimation_stride
 
 
 def _run_trial(
-    sigma: float,
-    alice_bob_correlation: float,
-    alice_eve_correlation: float,
-    guard_band_sigma: float,
+    scenario: CsiScenario | RssiScenario,
     block_length: int,
     rng: np.random.Generator,
     feature_factory: FeatureFactory,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
 ) -> TrialResult:
-    quantizer = MedianGuardBandQuantizer(guard_band_sigma)
+    """Draw windows until one retains a block.
+
+    Without ``sample_plan`` a short window is discarded and redrawn with
+    twice the samples; with a plan it is extended by the planned top-up,
+    which continues the window's fading sequences.
+    """
+    quantizer = _scenario_quantizer(scenario)
     reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
-    sample_count = block_length * (3 if guard_band_sigma > 0 else 1)
-
-    for _ in range(8):
-        alice_channel = sample_rayleigh_channel(sigma, sample_count, rng)
-        bob_channel = correlated_complex_channel(
-            alice_channel,
-            sigma,
-            alice_bob_correlation,
-            rng,
-        )
-        eve_channel = correlated_complex_channel(
-            alice_channel,
-            sigma,
-            alice_eve_correlation,
-            rng,
-        )
-        features = feature_factory(alice_channel, bob_channel, eve_channel, rng)
+    sample_count = default_window_samples(
+        block_length,
+        scenario.guard_band_sigma,
+        sample_plan,
+        scenario.quantization_bits,
+    )
+    decimator = CoherenceDecimator(scenario.decimation_stride)
+    horizon = _fading_horizon(scenario, sample_plan)
+    faded = (
+        None if horizon is None else sample_observer_channels(scenario, horizon, rng)
+    )
+    probed = 0
+    retries = 0
+    discarded = 0
+    features: tuple[FeatureSeries, FeatureSeries, FeatureSeries] | None = None
+
+    for _ in range(MAX_SAMPLE_ATTEMPTS):
+        probes = sample_count * decimator.stride
+        if faded is None:
+            channels = sample_observer_channels(scenario, probes, rng)
+        else:
+            revealed = slice(probed, probed + probes)
+            channels = (
+                faded[0][revealed],
+                faded[1][revealed],
+                faded[2][revealed],
+            )
+            probed += probes
+        alice, bob, eve = feature_factory(*channels, rng)
+        drawn = (decimator.apply(alice), decimator.apply(bob), decimator.apply(eve))
+        if features is not None:
+            alice, bob, eve = (
+                FeatureSeries(np.concatenate([kept.values, new.values]), kept.name)
+                for kept, new in zip(features, drawn, strict=True)
+            )
+            drawn = (alice, bob, eve)
+        features = drawn
         try:
-            return execute_protocol(
+            trial = execute_protocol(
                 *features,
                 quantizer=quantizer,
                 reconciler=reconciler,
                 rng=rng,
+                multi_block=multi_block,
             )
         except RuntimeError:
-            sample_count *= 2
+            retries += 1
+            if sample_plan is None:
+                discarded += sample_count
+                sample_count *= 2
+                features = None
+            else:
+                sample_count = sample_plan.top_up_samples
+            continue
+        return replace(trial, sample_retries=retries, discarded_samples=discarded)
 
     raise RuntimeError("guard band retained too few samples after eight attempts")
 
@@ -76,6 +177,9 @@ def run_csi_trial(
     scenario: CsiScenario,
     block_length: int,
     rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
+    sample_plan: SamplePlan | None = None,
 ) -> TrialResult:
     extractor = CsiAmplitudeExtractor()
 
@@ -98,13 +202,12 @@ def run_csi_trial(
         return tuple(extractor.extract(item) for item in observations)  # type: ignore[return-value]
 
     return _run_trial(
-        scenario.sigma,
-        scenario.alice_bob_correlation,
-        scenario.alice_eve_correlation,
-        scenario.guard_band_sigma,
+        scenario,
         block_length,
         rng,
         create_features,
+        multi_block,
+        sample_plan,
     )
 
 
@@ -112,6 +215,9 @@ def run_rssi_trial(
     scenario: RssiScenario,
     block_length: int,
     rng: np.random.Generator,
+    *,
+    multi_block: bool = False,
+    sample_plan: SamplePlan | None = None,
 ) -> TrialResult:
     extractor = RssiLevelExtractor()
 
@@ -135,28 +241,657 @@ def run_rssi_trial(
         return tuple(extractor.extract(item) for item in observations)  # type: ignore[return-value]
 
     return _run_trial(
-        scenario.sigma,
-        scenario.alice_bob_correlation,
-        scenario.alice_eve_correlation,
-        scenario.guard_band_sigma,
+        scenario,
+        block_length,
+        rng,
+        create_features,
+        multi_block,
+        sample_plan,
+    )
+
+
+def _run_batches(
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    trials: int,
+    batch_size: int,
+    rng: np.random.Generator,
+    feature_factory: BatchFeatureFactory,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
+    channel_bank: ChannelBank | None = None,
+    first_trial: int = 0,
+) -> Iterator[TrialBatch]:
+    """Yield ``trials`` independent trials as ``(batch, samples)`` matrices.
+
+    Every row follows the per-trial recipe of ``_run_trial``: a fresh channel
+    realization, redrawn with twice the samples (or, with ``sample_plan``,
+    extended by the planned top-up) while too few are retained. Rows
+    are therefore i.i.d. with the same law as per-trial results, and
+    ``MonteCarloAccumulator`` computes the same estimators over them. Only
+    the order in which random numbers are consumed differs, so both engines
+    agree within Monte Carlo error but not bit for bit. Retries are reported
+    on the first batch yielded after them.
+
+    With ``channel_bank`` trial ``first_trial + i`` reads the channels of
+    bank row ``first_trial + i`` instead of drawing them; each new window,
+    retry or top-up of a row reads the columns that follow the previous one.
+    Drawn fading channels are continued the same way on top-ups (see
+    ``_fading_horizon``).
+    """
+    quantizer = _scenario_quantizer(scenario)
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
+    decimator = CoherenceDecimator(scenario.decimation_stride)
+    horizon = _fading_horizon(scenario, sample_plan)
+    if channel_bank is not None:
+        channel_bank.header.check_scenario(scenario)
+    remaining = trials
+    retries = 0
+    discarded = 0
+    while remaining > 0:
+        pending = min(batch_size, remaining)
+        active = np.arange(pending, dtype=np.int64) + first_trial + trials - remaining
+        column = 0
+        sample_count = default_window_samples(
+            block_length,
+            scenario.guard_band_sigma,
+            sample_plan,
+            scenario.quantization_bits,
+        )
+        first_row = int(active[0])
+        faded = None
+        if horizon is not None and channel_bank is None:
+            faded = sample_observer_channels(scenario, (pending, horizon), rng)
+        features: tuple[FloatArray, FloatArray, FloatArray] | None = None
+        for _ in range(MAX_SAMPLE_ATTEMPTS):
+            probes = sample_count * decimator.stride
+            if channel_bank is not None:
+                dtype = complex_dtype(scenario.numeric_precision)
+                banked = channel_bank.read(active, column, probes)
+                channels = (
+                    banked[0].astype(dtype, copy=False),
+                    banked[1].astype(dtype, copy=False),
+                    banked[2].astype(dtype, copy=False),
+                )
+                column += probes
+            elif faded is not None:
+                local = active - first_row
+                revealed = slice(column, column + probes)
+                channels = (
+                    faded[0][local, revealed],
+                    faded[1][local, revealed],
+                    faded[2][local, revealed],
+                )
+                column += probes
+            else:
+                channels = sample_observer_channels(
+                    scenario,
+                    (pending, probes),
+                    rng,
+                )
+            alice, bob, eve = feature_factory(*channels, rng)
+            drawn = (
+                decimator.apply_batch(alice),
+                decimator.apply_batch(bob),
+                decimator.apply_batch(eve),
+            )
+            if features is not None:
+                alice, bob, eve = (
+                    np.concatenate([kept, new], axis=1)
+                    for kept, new in zip(features, drawn, strict=True)
+                )
+                drawn = (alice, bob, eve)
+            features = drawn
+            batch = execute_protocol_batch(
+                *features,
+                quantizer=quantizer,
+                reconciler=reconciler,
+                rng=rng,
+                multi_block=multi_block,
+            )
+            if batch.trials:
+                yield replace(
+                    batch,
+                    sample_retries=retries,
+                    discarded_samples=discarded,
+                )
+                retries = 0
+                discarded = 0
+            pending -= batch.trials
+            remaining -= batch.trials
+            if pending == 0:
+                break
+            active = np.delete(active, batch.source_rows)
+            retries += pending
+            if sample_plan is None:
+                discarded += pending * sample_count
+                sample_count *= 2
+                features = None
+            else:
+                short = np.setdiff1d(np.arange(len(features[0])), batch.source_rows)
+                alice, bob, eve = (values[short] for values in features)
+                features = (alice, bob, eve)
+                sample_count = sample_plan.top_up_samples
+        else:
+            raise RuntimeError(
+                "guard band retained too few samples after eight attempts"
+            )
+
+
+def run_csi_batches(
+    scenario: CsiScenario,
+    block_length: int,
+    trials: int,
+    rng: np.random.Generator,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    multi_block: bool = False,
+    sample_plan: SamplePlan | None = None,
+    channel_bank: ChannelBank | None = None,
+    first_trial: int = 0,
+) -> Iterator[TrialBatch]:
+    def create_features(
+        alice_channel: ComplexArray,
+        bob_channel: ComplexArray,
+        eve_channel: ComplexArray,
+        local_rng: np.random.Generator,
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        alice, bob, eve = (
+            np.abs(
+                add_complex_estimation_noise(
+                    channel,
+                    scenario.noise_variance,
+                    scenario.relative_estimation_error,
+                    local_rng,
+                )
+            )
+            for channel in (alice_channel, bob_channel, eve_channel)
+        )
+        return alice, bob, eve
+
+    return _run_batches(
+        scenario,
         block_length,
+        trials,
+        batch_size,
         rng,
         create_features,
+        multi_block,
+        sample_plan,
+        channel_bank,
+        first_trial,
     )
 
 
+def run_rssi_batches(
+    scenario: RssiScenario,
+    block_length: int,
+    trials: int,
+    rng: np.random.Generator,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    multi_block: bool = False,
+    sample_plan: SamplePlan | None = None,
+    channel_bank: ChannelBank | None = None,
+    first_trial: int = 0,
+) -> Iterator[TrialBatch]:
+    def create_features(
+        alice_channel: ComplexArray,
+        bob_channel: ComplexArray,
+        eve_channel: ComplexArray,
+        local_rng: np.random.Generator,
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        alice, bob, eve = (
+            rssi_levels_dbm(
+                channel,
+                scenario.reference_power_dbm,
+                scenario.measurement_noise_std_db,
+                scenario.resolution_db,
+                local_rng,
+            )
+            for channel in (alice_channel, bob_channel, eve_channel)
+        )
+        return alice, bob, eve
+
+    return _run_batches(
+        scenario,
+        block_length,
+        trials,
+        batch_size,
+        rng,
+        create_features,
+        multi_block,
+        sample_plan,
+        channel_bank,
+        first_trial,
+    )
+
+
+def _accumulate_batches(
+    batches: Iterator[TrialBatch],
+    block_length: int,
+    final_key_bits: int | None,
+    rng: np.random.Generator,
+) -> MonteCarloAccumulator:
+    accumulator = MonteCarloAccumulator(block_length=block_length)
+    for batch in batches:
+        accumulator = accumulator.add_batch(batch)
+        if final_key_bits is not None:
+            accumulator = accumulator.add_final_keys(
+                amplify_trial_batch(batch, final_key_bits, rng)
+            )
+    return accumulator
+
+
+def _accumulate_trials(
+    trial_runner: Callable[[], TrialResult],
+    block_length: int,
+    trials: int,
+    final_key_bits: int | None,
+    rng: np.random.Generator,
+    precision: PrecisionTarget | None = None,
+) -> MonteCarloAccumulator:
+    accumulator = MonteCarloAccumulator(block_length=block_length)
+    for _ in range(trials):
+        trial = trial_runner()
+        accumulator = accumulator.add_trial(trial)
+        if final_key_bits is not None:
+            accumulator = accumulator.add_final_key(
+                amplify_reconciled_keys(trial, final_key_bits, rng)
+            )
+        if _is_precise(accumulator, precision):
+            break
+    return accumulator
+
+
+def _is_precise(
+    accumulator: MonteCarloAccumulator,
+    precision: PrecisionTarget | None,
+) -> bool:
+    if precision is None or accumulator.trials < precision.min_trials:
+        return False
+    return precision.is_met(*accumulator.counts(precision.metric))
+
+
+def _default_sample_retries(
+    scenario: CsiScenario | RssiScenario,
+    sample_plan: SamplePlan,
+) -> float:
+    """Expected redraws per trial of windows drawn without ``sample_plan``.
+
+    Unplanned windows start at ``default_window_samples`` and double after
+    every short one; each is judged by the plan's retention model.
+    """
+    samples = default_window_samples(
+        sample_plan.block_length,
+        scenario.guard_band_sigma,
+        None,
+        scenario.quantization_bits,
+    )
+    expected = 0.0
+    short = 1.0
+    for _ in range(MAX_SAMPLE_ATTEMPTS - 1):
+        short *= 1 - retention_probability(sample_plan, samples)
+        expected += short
+        samples *= 2
+    return expected
+
+
+def _finalize(
+    accumulator: MonteCarloAccumulator,
+    seed: int,
+    precision: PrecisionTarget | None,
+    scenario: CsiScenario | RssiScenario,
+    sample_plan: SamplePlan | None = None,
+) -> MonteCarloResult:
+    if precision is None:
+        result = accumulator.finalize(seed)
+    else:
+        result = accumulator.finalize(seed, precision.confidence, precision.method)
+    retries_avoided = None
+    if sample_plan is not None:
+        retries_avoided = (
+            _default_sample_retries(scenario, sample_plan)
+            - result.mean_sample_retries
+        )
+    return replace(
+        result,
+        independent_samples_per_second=independent_samples_per_second(scenario),
+        secure_key_bits_per_second=secure_key_bits_per_second(accumulator, scenario),
+        mean_sample_retries_avoided=retries_avoided,
+    )
+
+
+def _run_csi_shard(
+    scenario: CsiScenario,
+    block_length: int,
+    trials: int,
+    seed_sequence: np.random.SeedSequence,
+    batch_size: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
+    channel_bank: ChannelBank | None = None,
+    first_trial: int = 0,
+) -> MonteCarloAccumulator:
+    rng = np.random.default_rng(seed_sequence)
+    batches = run_csi_batches(
+        scenario,
+        block_length,
+        trials,
+        rng,
+        batch_size=batch_size,
+        multi_block=multi_block,
+        sample_plan=sample_plan,
+        channel_bank=channel_bank,
+        first_trial=first_trial,
+    )
+    return _accumulate_batches(batches, block_length, final_key_bits, rng)
+
+
+def _run_rssi_shard(
+    scenario: RssiScenario,
+    block_length: int,
+    trials: int,
+    seed_sequence: np.random.SeedSequence,
+    batch_size: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
+    channel_bank: ChannelBank | None = None,
+    first_trial: int = 0,
+) -> MonteCarloAccumulator:
+    rng = np.random.default_rng(seed_sequence)
+    batches = run_rssi_batches(
+        scenario,
+        block_length,
+        trials,
+        rng,
+        batch_size=batch_size,
+        multi_block=multi_block,
+        sample_plan=sample_plan,
+        channel_bank=channel_bank,
+        first_trial=first_trial,
+    )
+    return _accumulate_batches(batches, block_length, final_key_bits, rng)
+
+
+def _run_shards(
+    shard_runner: ShardRunner,
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    checkpoint: MonteCarloCheckpoint,
+    workers: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
+    on_checkpoint: CheckpointCallback | None,
+    precision: PrecisionTarget | None,
+    channel_bank: ChannelBank | None = None,
+) -> MonteCarloCheckpoint:
+    """Run the pending shards of ``checkpoint`` with independent spawned streams.
+
+    Shard boundaries and seeds depend only on the trial segments, ``seed``
+    and ``batch_size``, never on ``workers``; accumulators are merged in
+    shard order, so the result is bit-identical for any worker count and
+    for any point at which the run was interrupted and resumed.
+    ``on_checkpoint`` receives the updated checkpoint after every shard.
+
+    With ``precision`` the run stops after the first shard, in shard order,
+    that meets the target. Pools then run one shard per worker at a time and
+    drop the shards of a wave that follow the stopping shard, so the result
+    still does not depend on ``workers``.
+    """
+    pending = checkpoint.pending_shards()
+    first_trials = checkpoint.pending_first_trials()
+    if not pending or _is_precise(checkpoint.accumulator, precision):
+        return checkpoint
+    if workers == 1:
+        arguments = _shard_arguments(
+            pending,
+            scenario,
+            block_length,
+            checkpoint.batch_size,
+            final_key_bits,
+            multi_block,
+            sample_plan,
+            channel_bank,
+            first_trials,
+        )
+        return _merge_shards(
+            checkpoint,
+            map(shard_runner, *arguments),
+            on_checkpoint,
+            precision,
+        )
+    wave = len(pending) if precision is None else workers
+    # Forking after galois has compiled its numba kernels leaves the parent
+    # unable to exit, so workers always start from a fresh interpreter.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        for start in range(0, len(pending), wave):
+            shards = pending[start : start + wave]
+            arguments = _shard_arguments(
+                shards,
+                scenario,
+                block_length,
+                checkpoint.batch_size,
+                final_key_bits,
+                multi_block,
+                sample_plan,
+                channel_bank,
+                first_trials[start : start + wave],
+            )
+            chunksize = max(1, len(shards) // (4 * workers))
+            checkpoint = _merge_shards(
+                checkpoint,
+                pool.map(shard_runner, *arguments, chunksize=chunksize),
+                on_checkpoint,
+                precision,
+            )
+            if _is_precise(checkpoint.accumulator, precision):
+                break
+    return checkpoint
+
+
+def _shard_arguments(
+    shards: list[tuple[int, np.random.SeedSequence]],
+    scenario: CsiScenario | RssiScenario,
+    block_length: int,
+    batch_size: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    sample_plan: SamplePlan | None,
+    channel_bank: ChannelBank | None,
+    first_trials: list[int],
+) -> tuple[Iterable[object], ...]:
+    """Positional argument columns of ``_run_*_shard`` for ``map``."""
+    return (
+        repeat(scenario),
+        repeat(block_length),
+        [trials for trials, _ in shards],
+        [seed_sequence for _, seed_sequence in shards],
+        repeat(batch_size),
+        repeat(final_key_bits),
+        repeat(multi_block),
+        repeat(sample_plan),
+        repeat(channel_bank),
+        first_trials,
+    )
+
+
+def _merge_shards(
+    checkpoint: MonteCarloCheckpoint,
+    accumulators: Iterator[MonteCarloAccumulator],
+    on_checkpoint: CheckpointCallback | None,
+    precision: PrecisionTarget | None,
+) -> MonteCarloCheckpoint:
+    for accumulator in accumulators:
+        checkpoint = checkpoint.add_shard(accumulator)
+        if on_checkpoint is not None:
+            on_checkpoint(checkpoint)
+        if _is_precise(checkpoint.accumulator, precision):
+            break
+    return checkpoint
+
+
+def _resume_checkpoint(
+    checkpoint: MonteCarloCheckpoint | None,
+    block_length: int,
+    trials: int,
+    seed: int,
+    batch_size: int,
+) -> MonteCarloCheckpoint:
+    """Start a run, or continue ``checkpoint`` up to ``trials`` trials."""
+    if checkpoint is None:
+        return MonteCarloCheckpoint.start(block_length, trials, seed, batch_size)
+    if checkpoint.seed != seed or checkpoint.batch_size != batch_size:
+        raise ValueError("checkpoint was created with another seed or batch_size")
+    if checkpoint.accumulator.block_length != block_length:
+        raise ValueError("checkpoint was created with another block_length")
+    if trials < checkpoint.trials:
+        raise ValueError("trials cannot be fewer than the checkpoint already holds")
+    if trials > checkpoint.trials:
+        return checkpoint.extend(trials - checkpoint.trials)
+    return checkpoint
+
+
+def _validate_run(
+    trials: int,
+    engine: Engine,
+    batch_size: int,
+    workers: int,
+    block_length: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    retention_confidence: float | None,
+    checkpoint: MonteCarloCheckpoint | None,
+    channel_bank: ChannelBank | str | Path | None = None,
+) -> None:
+    if trials <= 0:
+        raise ValueError("trials must be positive")
+    if engine not in {"batched", "per_trial"}:
+        raise ValueError("engine must be 'batched' or 'per_trial'")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if engine == "per_trial" and workers != 1:
+        raise ValueError("the per_trial engine runs in a single process")
+    if engine == "per_trial" and checkpoint is not None:
+        raise ValueError("checkpoints require the batched engine")
+    if engine == "per_trial" and channel_bank is not None:
+        raise ValueError("channel banks require the batched engine")
+    if final_key_bits is not None and not 0 < final_key_bits <= block_length:
+        raise ValueError("final_key_bits must be in [1, block_length]")
+    if final_key_bits is not None and multi_block:
+        raise ValueError("final_key_bits requires single-block trials")
+    if retention_confidence is not None and not 0 < retention_confidence < 1:
+        raise ValueError("retention_confidence must be in (0, 1)")
+
+
 def run_csi_monte_carlo(
     scenario: CsiScenario,
     *,
     block_length: int = 127,
     trials: int = 1_000,
     seed: int = 0,
+    engine: Engine = "batched",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    final_key_bits: int | None = None,
+    multi_block: bool = False,
+    retention_confidence: float | None = None,
+    checkpoint: MonteCarloCheckpoint | None = None,
+    on_checkpoint: CheckpointCallback | None = None,
+    precision: PrecisionTarget | None = None,
+    channel_bank: ChannelBank | str | Path | None = None,
 ) -> MonteCarloResult:
-    if trials <= 0:
-        raise ValueError("trials must be positive")
+    """Estimate CSI key-agreement metrics over independent trials.
+
+    ``engine="per_trial"`` is the reference implementation built on
+    ``run_csi_trial``; the default batched engine is statistically equivalent
+    (see ``_run_batches``). It runs shards of ``batch_size`` trials, each with
+    a generator spawned from ``SeedSequence(seed)``, on ``workers`` processes;
+    the result depends on ``seed`` and ``batch_size`` but not on ``workers``.
+
+    With ``final_key_bits`` every trial is also hashed to a final key with
+    its own public Toeplitz seed, and the result reports final-key agreement
+    and Eve's final-key mismatch rate. With ``multi_block`` every window is
+    split into as many reconciliation blocks as its retained bits fill,
+    instead of keeping only the first block. With ``retention_confidence``
+    windows are sized by ``plan_scenario_samples`` to retain a block with
+    that probability, and short windows are topped up instead of redrawn.
+
+    A batched run can be continued from a ``checkpoint``: its pending shards
+    are run and, if ``trials`` exceeds the trials it holds, a new segment is
+    appended without recomputing the finished shards. ``on_checkpoint`` is
+    called after every shard so callers can persist progress.
+
+    With ``precision`` the run is sequential: ``trials`` becomes a budget,
+    and the run stops at the first shard (or, per trial, the first trial)
+    after which the ``PrecisionTarget`` is met. Shards of ``batch_size``
+    trials are the stopping granularity, so pick a ``batch_size`` well below
+    ``trials``. Intervals are then reported at the target's confidence.
+
+    With ``channel_bank`` (a ``ChannelBank`` or the directory of one) the
+    channels are read from the bank, trial ``i`` from row ``i``, instead of
+    being drawn; estimation noise still comes from ``seed``. Runs on the
+    same bank see the same channels whatever their measurement, noise or
+    guard band, provided the scenario's channel parameters match the bank.
+    """
+    _validate_run(
+        trials,
+        engine,
+        batch_size,
+        workers,
+        block_length,
+        final_key_bits,
+        multi_block,
+        retention_confidence,
+        checkpoint,
+        channel_bank,
+    )
+    if isinstance(channel_bank, str | Path):
+        channel_bank = ChannelBank.open(channel_bank)
+    sample_plan = None
+    if retention_confidence is not None:
+        sample_plan = plan_scenario_samples(
+            scenario,
+            block_length,
+            retention_confidence,
+        )
+    if engine == "batched":
+        finished = _run_shards(
+            _run_csi_shard,
+            scenario,
+            block_length,
+            _resume_checkpoint(checkpoint, block_length, trials, seed, batch_size),
+            workers,
+            final_key_bits,
+            multi_block,
+            sample_plan,
+            on_checkpoint,
+            precision,
+            channel_bank,
+        )
+        return _finalize(finished.accumulator, seed, precision, scenario, sample_plan)
     rng = np.random.default_rng(seed)
-    results = [run_csi_trial(scenario, block_length, rng) for _ in range(trials)]
-    return aggregate_trials(results, seed)
+    accumulator = _accumulate_trials(
+        lambda: run_csi_trial(
+            scenario,
+            block_length,
+            rng,
+            multi_block=multi_block,
+            sample_plan=sample_plan,
+        ),
+        block_length,
+        trials,
+        final_key_bits,
+        rng,
+        precision,
+    )
+    return _finalize(accumulator, seed, precision, scenario, sample_plan)
 
 
 def run_rssi_monte_carlo(
@@ -165,9 +900,67 @@ def run_rssi_monte_carlo(
     block_length: int = 127,
     trials: int = 1_000,
     seed: int = 0,
+    engine: Engine = "batched",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+    final_key_bits: int | None = None,
+    multi_block: bool = False,
+    retention_confidence: float | None = None,
+    checkpoint: MonteCarloCheckpoint | None = None,
+    on_checkpoint: CheckpointCallback | None = None,
+    precision: PrecisionTarget | None = None,
+    channel_bank: ChannelBank | str | Path | None = None,
 ) -> MonteCarloResult:
-    if trials <= 0:
-        raise ValueError("trials must be positive")
+    """RSSI counterpart of ``run_csi_monte_carlo``."""
+    _validate_run(
+        trials,
+        engine,
+        batch_size,
+        workers,
+        block_length,
+        final_key_bits,
+        multi_block,
+        retention_confidence,
+        checkpoint,
+        channel_bank,
+    )
+    if isinstance(channel_bank, str | Path):
+        channel_bank = ChannelBank.open(channel_bank)
+    sample_plan = None
+    if retention_confidence is not None:
+        sample_plan = plan_scenario_samples(
+            scenario,
+            block_length,
+            retention_confidence,
+        )
+    if engine == "batched":
+        finished = _run_shards(
+            _run_rssi_shard,
+            scenario,
+            block_length,
+            _resume_checkpoint(checkpoint, block_length, trials, seed, batch_size),
+            workers,
+            final_key_bits,
+            multi_block,
+            sample_plan,
+            on_checkpoint,
+            precision,
+            channel_bank,
+        )
+        return _finalize(finished.accumulator, seed, precision, scenario, sample_plan)
     rng = np.random.default_rng(seed)
-    results = [run_rssi_trial(scenario, block_length, rng) for _ in range(trials)]
-    return aggregate_trials(results, seed)
+    accumulator = _accumulate_trials(
+        lambda: run_rssi_trial(
+            scenario,
+            block_length,
+            rng,
+            multi_block=multi_block,
+            sample_plan=sample_plan,
+        ),
+        block_length,
+        trials,
+        final_key_bits,
+        rng,
+        precision,
+    )
+    return _finalize(accumulator, seed, precision, scenario, sample_plan)
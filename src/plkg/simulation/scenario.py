@@ -2,12 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
+from plkg.core.models import PRECISIONS, ComplexArray, Precision
+from plkg.radio.channels.jakes import sample_jakes_channel
+from plkg.radio.channels.rayleigh import (
+    mix_correlated_channel,
+    sample_rayleigh_channel,
+)
+from plkg.radio.profiles import RadioProfile
+
 
 def _validate_common(
     sigma: float,
     alice_bob_correlation: float,
     alice_eve_correlation: float,
     guard_band_sigma: float,
+    doppler_hz: float | None,
+    numeric_precision: Precision,
+    quantization_bits: int,
+    decimation_stride: int,
 ) -> None:
     if sigma <= 0:
         raise ValueError("sigma must be positive")
@@ -17,6 +31,14 @@ def _validate_common(
         raise ValueError("alice_eve_correlation must be in [-1, 1]")
     if guard_band_sigma < 0:
         raise ValueError("guard_band_sigma cannot be negative")
+    if doppler_hz is not None and doppler_hz < 0:
+        raise ValueError("doppler_hz cannot be negative")
+    if numeric_precision not in PRECISIONS:
+        raise ValueError(f"numeric_precision must be one of {PRECISIONS}")
+    if quantization_bits <= 0:
+        raise ValueError("quantization_bits must be positive")
+    if decimation_stride <= 0:
+        raise ValueError("decimation_stride must be positive")
 
 
 @dataclass(frozen=True)
@@ -28,6 +50,10 @@ class CsiScenario:
     relative_estimation_error: float = 0.0
     guard_band_sigma: float = 0.0
     sample_interval_s: float = 1e-3
+    doppler_hz: float | None = None
+    numeric_precision: Precision = "double"
+    quantization_bits: int = 1
+    decimation_stride: int = 1
 
     def __post_init__(self) -> None:
         _validate_common(
@@ -35,6 +61,10 @@ class CsiScenario:
             self.alice_bob_correlation,
             self.alice_eve_correlation,
             self.guard_band_sigma,
+            self.doppler_hz,
+            self.numeric_precision,
+            self.quantization_bits,
+            self.decimation_stride,
         )
         if self.noise_variance < 0:
             raise ValueError("noise_variance cannot be negative")
@@ -52,6 +82,10 @@ class RssiScenario:
     alice_eve_correlation: float = 0.0
     guard_band_sigma: float = 0.0
     sample_interval_s: float = 0.1
+    doppler_hz: float | None = None
+    numeric_precision: Precision = "double"
+    quantization_bits: int = 1
+    decimation_stride: int = 1
 
     def __post_init__(self) -> None:
         _validate_common(
@@ -59,8 +93,99 @@ class RssiScenario:
             self.alice_bob_correlation,
             self.alice_eve_correlation,
             self.guard_band_sigma,
+            self.doppler_hz,
+            self.numeric_precision,
+            self.quantization_bits,
+            self.decimation_stride,
         )
         if self.measurement_noise_std_db < 0:
             raise ValueError("measurement_noise_std_db cannot be negative")
         if self.resolution_db <= 0:
             raise ValueError("resolution_db must be positive")
+
+
+def profile_scenario(
+    profile: RadioProfile,
+    *,
+    noise_variance: float = 0.0,
+    jakes_fading: bool = True,
+) -> CsiScenario | RssiScenario:
+    """The CSI or RSSI scenario of a radio profile.
+
+    With ``jakes_fading`` the channel fades at the profile's Doppler
+    frequency. A profile at rest keeps i.i.d. draws instead, since its
+    channel only changes with the environment. ``noise_variance`` applies
+    to CSI profiles; RSSI profiles use their own measurement noise.
+    """
+    doppler_hz = profile.doppler_hz if jakes_fading and profile.speed_kmh else None
+    if profile.measurement == "csi":
+        return CsiScenario(
+            noise_variance=noise_variance,
+            alice_bob_correlation=profile.alice_bob_correlation,
+            alice_eve_correlation=profile.alice_eve_correlation,
+            relative_estimation_error=profile.estimation_error,
+            sample_interval_s=profile.sample_interval_s,
+            doppler_hz=doppler_hz,
+        )
+    return RssiScenario(
+        reference_power_dbm=profile.rssi_reference_power_dbm,
+        measurement_noise_std_db=profile.rssi_noise_std_db,
+        resolution_db=profile.rssi_resolution_db,
+        alice_bob_correlation=profile.alice_bob_correlation,
+        alice_eve_correlation=profile.alice_eve_correlation,
+        sample_interval_s=profile.sample_interval_s,
+        doppler_hz=doppler_hz,
+    )
+
+
+def sample_scenario_channel(
+    scenario: CsiScenario | RssiScenario,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+) -> ComplexArray:
+    """Rayleigh taps of a scenario, with time along the last axis.
+
+    Scenarios without ``doppler_hz`` draw i.i.d. taps. With it, every
+    sequence is Jakes-faded at ``sample_interval_s``, so a profile's speed
+    and carrier set how fast the channel decorrelates. Taps are complex64
+    when ``numeric_precision`` is ``"single"``.
+    """
+    if scenario.doppler_hz is None:
+        return sample_rayleigh_channel(
+            scenario.sigma,
+            size,
+            rng,
+            precision=scenario.numeric_precision,
+        )
+    return sample_jakes_channel(
+        scenario.sigma,
+        scenario.doppler_hz,
+        scenario.sample_interval_s,
+        size,
+        rng,
+        precision=scenario.numeric_precision,
+    )
+
+
+def sample_observer_channels(
+    scenario: CsiScenario | RssiScenario,
+    size: int | tuple[int, ...],
+    rng: np.random.Generator,
+) -> tuple[ComplexArray, ComplexArray, ComplexArray]:
+    """Alice's channel and Bob's and Eve's correlated copies.
+
+    The independent components follow the scenario's fading, so with
+    ``doppler_hz`` Bob's and Eve's channels are time-correlated too.
+    """
+    alice_channel = sample_scenario_channel(scenario, size, rng)
+    bob_channel = mix_correlated_channel(
+        alice_channel,
+        sample_scenario_channel(scenario, size, rng),
+        scenario.alice_bob_correlation,
+    )
+    eve_channel = mix_correlated_channel(
+        alice_channel,
+        sample_scenario_channel(scenario, size, rng),
+        scenario.alice_eve_correlation,
+    )
+    return alice_channel, bob_channel, eve_channel
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import ComplexArray, FloatArray, MonteCarloResult
+from plkg.protocol.pipeline import amplify_trial_batch, execute_protocol_batch
+from plkg.protocol.reconciliation import (
+    BchCodeOffsetReconciler,
+    create_bch_codec,
+)
+from plkg.radio.channels.jakes import sample_jakes_channel
+from plkg.radio.measurements.decimation import CoherenceDecimator
+from plkg.security.metrics import MonteCarloAccumulator
+from plkg.simulation.planning import (
+    SamplePlan,
+    default_window_samples,
+    plan_scenario_samples,
+)
+from plkg.simulation.runner import (
+    DEFAULT_BATCH_SIZE,
+    MAX_SAMPLE_ATTEMPTS,
+    _finalize,
+    _scenario_quantizer,
+    _validate_run,
+)
+from plkg.simulation.scenario import CsiScenario, RssiScenario
+
+_TINY = np.finfo(float).tiny
+
+
+ChannelSampler = Callable[[tuple[int, ...], np.random.Generator], ComplexArray]
+
+
+def _standard_complex(
+    shape: tuple[int, ...],
+    rng: np.random.Generator,
+) -> ComplexArray:
+    return rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+
+@dataclass(frozen=True)
+class CommonDraws:
+    """Scenario-free randomness shared by every point of a sweep.
+
+    Each array has shape ``(3, trials, samples)``, one plane per observer
+    (Alice, Bob, Eve), of complex values with standard normal parts:
+    ``channels`` holds Alice's channel and the independent components of
+    Bob's and Eve's, ``noise`` the additive estimation or measurement noise
+    and ``errors`` the relative estimation errors. Scenario parameters only
+    scale and combine them. ``channel_sampler`` draws the channel planes, by
+    default i.i.d. and otherwise with unit-``sigma`` time-correlated fading.
+    """
+
+    channels: ComplexArray
+    noise: ComplexArray
+    errors: ComplexArray
+
+    @classmethod
+    def sample(
+        cls,
+        trials: int,
+        samples: int,
+        rng: np.random.Generator,
+        channel_sampler: ChannelSampler = _standard_complex,
+    ) -> CommonDraws:
+        shape = (3, trials, samples)
+        return cls(
+            channels=channel_sampler(shape, rng),
+            noise=_standard_complex(shape, rng),
+            errors=_standard_complex(shape, rng),
+        )
+
+    @property
+    def samples(self) -> int:
+        return int(self.channels.shape[2])
+
+    def extend(
+        self,
+        samples: int,
+        rng: np.random.Generator,
+        channel_sampler: ChannelSampler = _standard_complex,
+    ) -> CommonDraws:
+        """Append fresh samples until every row holds at least ``samples``."""
+        missing = samples - self.samples
+        if missing <= 0:
+            return self
+        extra = CommonDraws.sample(
+            self.channels.shape[1],
+            missing,
+            rng,
+            channel_sampler,
+        )
+        return CommonDraws(
+            *(
+                np.concatenate([kept, new], axis=2)
+                for kept, new in (
+                    (self.channels, extra.channels),
+                    (self.noise, extra.noise),
+                    (self.errors, extra.errors),
+                )
+            )
+        )
+
+    def select(self, rows: NDArray[np.int64], samples: int) -> CommonDraws:
+        return CommonDraws(
+            self.channels[:, rows, :samples],
+            self.noise[:, rows, :samples],
+            self.errors[:, rows, :samples],
+        )
+
+    def observer_channels(
+        self,
+        sigma: float,
+        alice_bob_correlation: float,
+        alice_eve_correlation: float,
+    ) -> tuple[ComplexArray, ComplexArray, ComplexArray]:
+        """Channels with the law of ``correlated_complex_channel``."""
+        alice = sigma * self.channels[0]
+        bob, eve = (
+            correlation * alice
+            + np.sqrt(max(0.0, 1.0 - correlation**2)) * sigma * independent
+            for correlation, independent in (
+                (alice_bob_correlation, self.channels[1]),
+                (alice_eve_correlation, self.channels[2]),
+            )
+        )
+        return alice, bob, eve
+
+
+def _continued_fading(
+    doppler_hz: float,
+    sample_interval_s: float,
+    horizon: int,
+) -> ChannelSampler:
+    """Unit-``sigma`` Jakes planes whose every draw continues the previous one.
+
+    The first call generates ``horizon``-long sequences; each call returns
+    the columns after those already drawn, so ``CommonDraws.extend``
+    lengthens the same fading sequences instead of appending new ones.
+    """
+    sequences: ComplexArray | None = None
+    drawn = 0
+
+    def sample(shape: tuple[int, ...], rng: np.random.Generator) -> ComplexArray:
+        nonlocal sequences, drawn
+        if sequences is None:
+            sequences = sample_jakes_channel(
+                1.0,
+                doppler_hz,
+                sample_interval_s,
+                (*shape[:-1], horizon),
+                rng,
+            )
+        start = drawn
+        drawn += shape[-1]
+        if drawn > horizon:
+            raise ValueError("fading draws cannot go past the horizon")
+        return sequences[..., start:drawn]
+
+    return sample
+
+
+SweepFeatures = Callable[
+    [Any, CommonDraws],
+    tuple[FloatArray, FloatArray, FloatArray],
+]
+
+
+def csi_sweep_features(
+    scenario: CsiScenario,
+    draws: CommonDraws,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """CSI amplitudes with the law of ``add_complex_estimation_noise``."""
+    channels = draws.observer_channels(
+        scenario.sigma,
+        scenario.alice_bob_correlation,
+        scenario.alice_eve_correlation,
+    )
+    noise_std = np.sqrt(scenario.noise_variance / 2.0)
+    alice, bob, eve = (
+        np.abs(
+            channel
+            + noise_std * noise
+            + scenario.relative_estimation_error * np.abs(channel) * error
+        )
+        for channel, noise, error in zip(
+            channels,
+            draws.noise,
+            draws.errors,
+            strict=True,
+        )
+    )
+    return alice, bob, eve
+
+
+def rssi_sweep_features(
+    scenario: RssiScenario,
+    draws: CommonDraws,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """RSSI levels with the law of ``rssi_levels_dbm``."""
+    channels = draws.observer_channels(
+        scenario.sigma,
+        scenario.alice_bob_correlation,
+        scenario.alice_eve_correlation,
+    )
+    resolution = scenario.resolution_db
+    alice, bob, eve = (
+        np.round(
+            (
+                scenario.reference_power_dbm
+                + 10.0 * np.log10(np.maximum(np.abs(channel) ** 2, _TINY))
+                + scenario.measurement_noise_std_db * noise.real
+            )
+            / resolution
+        )
+        * resolution
+        for channel, noise in zip(channels, draws.noise, strict=True)
+    )
+    return alice, bob, eve
+
+
+def _run_sweep(
+    scenarios: Sequence[CsiScenario | RssiScenario],
+    features: SweepFeatures,
+    block_length: int,
+    trials: int,
+    seed: int,
+    batch_size: int,
+    final_key_bits: int | None,
+    multi_block: bool,
+    retention_confidence: float | None,
+) -> list[MonteCarloResult]:
+    """Run every scenario on the same draws, batch by batch.
+
+    Each point starts from the first samples of the shared windows its own
+    sample size calls for. A short window is extended with shared top-up
+    samples rather than redrawn, which would desynchronize the points, so
+    the recipe is that of a run with a sample plan. Protocol randomness
+    (code-offset codewords and hash seeds) comes from one stream that every
+    point replays identically. Time-correlated points must share their
+    Doppler frequency and sample interval, which shape the channel draws;
+    their shared sequences are generated long enough for every point's
+    top-ups, so extending a window continues its fading.
+    """
+    if not scenarios:
+        raise ValueError("a sweep needs at least one scenario")
+    if any(scenario.numeric_precision != "double" for scenario in scenarios):
+        raise ValueError("common random numbers are drawn in double precision")
+    fadings = {
+        (scenario.doppler_hz, scenario.sample_interval_s)
+        if scenario.doppler_hz is not None
+        else None
+        for scenario in scenarios
+    }
+    if len(fadings) > 1:
+        raise ValueError("sweep points must share their fading")
+    fading = fadings.pop()
+    _validate_run(
+        trials,
+        "batched",
+        batch_size,
+        1,
+        block_length,
+        final_key_bits,
+        multi_block,
+        retention_confidence,
+        None,
+    )
+    windows = []
+    plans: list[SamplePlan | None] = []
+    for scenario in scenarios:
+        plan = None
+        if retention_confidence is None:
+            initial = default_window_samples(
+                block_length,
+                scenario.guard_band_sigma,
+                None,
+                scenario.quantization_bits,
+            )
+            windows.append((initial, initial))
+        else:
+            plan = plan_scenario_samples(scenario, block_length, retention_confidence)
+            windows.append((plan.window_samples, plan.top_up_samples))
+        plans.append(plan)
+    horizon = max(
+        (samples + (MAX_SAMPLE_ATTEMPTS - 1) * top_up) * scenario.decimation_stride
+        for (samples, top_up), scenario in zip(windows, scenarios, strict=True)
+    )
+    quantizers = [_scenario_quantizer(scenario) for scenario in scenarios]
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
+    channel_seed, protocol_seed = np.random.SeedSequence(seed).spawn(2)
+    channel_rng = np.random.default_rng(channel_seed)
+    protocol_rngs = [np.random.default_rng(protocol_seed) for _ in scenarios]
+    accumulators = [
+        MonteCarloAccumulator(block_length=block_length) for _ in scenarios
+    ]
+
+    for start in range(0, trials, batch_size):
+        rows = min(batch_size, trials - start)
+        channel_sampler: ChannelSampler = _standard_complex
+        if fading is not None:
+            channel_sampler = _continued_fading(*fading, horizon)
+        draws = CommonDraws.sample(
+            rows,
+            min(initial for initial, _ in windows),
+            channel_rng,
+            channel_sampler,
+        )
+        for index, scenario in enumerate(scenarios):
+            samples, top_up = windows[index]
+            active = np.arange(rows)
+            retries = 0
+            decimator = CoherenceDecimator(scenario.decimation_stride)
+            for _ in range(MAX_SAMPLE_ATTEMPTS):
+                probes = samples * decimator.stride
+                draws = draws.extend(probes, channel_rng, channel_sampler)
+                alice, bob, eve = features(scenario, draws.select(active, probes))
+                batch = execute_protocol_batch(
+                    decimator.apply_batch(alice),
+                    decimator.apply_batch(bob),
+                    decimator.apply_batch(eve),
+                    quantizer=quantizers[index],
+                    reconciler=reconciler,
+                    rng=protocol_rngs[index],
+                    multi_block=multi_block,
+                )
+                if batch.trials:
+                    accumulators[index] = accumulators[index].add_batch(batch)
+                    if final_key_bits is not None:
+                        accumulators[index] = accumulators[index].add_final_keys(
+                            amplify_trial_batch(
+                                batch,
+                                final_key_bits,
+                                protocol_rngs[index],
+                            )
+                        )
+                active = np.delete(active, batch.source_rows)
+                if len(active) == 0:
+                    break
+                retries += len(active)
+                samples += top_up
+            else:
+                raise RuntimeError(
+                    "guard band retained too few samples after eight attempts"
+                )
+            accumulators[index] = replace(
+                accumulators[index],
+                sample_retries=accumulators[index].sample_retries + retries,
+            )
+
+    return [
+        _finalize(accumulator, seed, None, scenario, plan)
+        for accumulator, scenario, plan in zip(
+            accumulators,
+            scenarios,
+            plans,
+            strict=True,
+        )
+    ]
+
+
+def run_csi_sweep(
+    scenarios: Sequence[CsiScenario],
+    *,
+    block_length: int = 127,
+    trials: int = 1_000,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    final_key_bits: int | None = None,
+    multi_block: bool = False,
+    retention_confidence: float | None = None,
+) -> list[MonteCarloResult]:
+    """``run_csi_monte_carlo`` for every scenario, with common random numbers.
+
+    All points share the channel, noise and estimation-error realizations,
+    which are drawn once per batch and rescaled per scenario, so differences
+    between neighbouring points have much less Monte Carlo noise than with
+    independent seeds. Each point on its own has the law of a batched run;
+    the sweep runs in one process and does not checkpoint.
+    """
+    return _run_sweep(
+        scenarios,
+        csi_sweep_features,
+        block_length,
+        trials,
+        seed,
+        batch_size,
+        final_key_bits,
+        multi_block,
+        retention_confidence,
+    )
+
+
+def run_rssi_sweep(
+    scenarios: Sequence[RssiScenario],
+    *,
+    block_length: int = 127,
+    trials: int = 1_000,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    final_key_bits: int | None = None,
+    multi_block: bool = False,
+    retention_confidence: float | None = None,
+) -> list[MonteCarloResult]:
+    """``run_rssi_monte_carlo`` for every scenario, with common random numbers."""
+    return _run_sweep(
+        scenarios,
+        rssi_sweep_features,
+        block_length,
+        trials,
+        seed,
+        batch_size,
+        final_key_bits,
+        multi_block,
+        retention_confidence,
+    )
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from plkg.core.models import (
+    FeatureSeries,
+    FloatArray,
+    MonteCarloResult,
+    RssiObservation,
+    TrialResult,
+)
+from plkg.protocol.pipeline import execute_protocol, execute_protocol_batch
+from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.protocol.reconciliation import (
+    BchCodeOffsetReconciler,
+    create_bch_codec,
+)
+from plkg.radio.measurements.csi import CsiAmplitudeExtractor
+from plkg.radio.measurements.rssi import RssiLevelExtractor
+from plkg.radio.measurements.traces import (
+    DEFAULT_CHUNK_SAMPLES,
+    CaptureTrace,
+    TraceObservation,
+)
+from plkg.security.metrics import MonteCarloAccumulator
+from plkg.simulation.planning import default_window_samples
+from plkg.simulation.runner import DEFAULT_BATCH_SIZE
+
+
+def _window_samples(
+    block_length: int,
+    guard_band_sigma: float,
+    window_samples: int | None,
+) -> int:
+    if window_samples is None:
+        return default_window_samples(block_length, guard_band_sigma)
+    if window_samples < block_length:
+        raise ValueError("window_samples cannot be shorter than block_length")
+    return window_samples
+
+
+def _features(observation: TraceObservation) -> FeatureSeries:
+    if isinstance(observation, RssiObservation):
+        return RssiLevelExtractor().extract(observation)
+    return CsiAmplitudeExtractor().extract(observation)
+
+
+def iter_trace_trials(
+    trace: CaptureTrace,
+    block_length: int,
+    rng: np.random.Generator,
+    *,
+    guard_band_sigma: float = 0.0,
+    window_samples: int | None = None,
+    multi_block: bool = False,
+    chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+) -> Iterator[TrialResult]:
+    """Run ``execute_protocol`` on consecutive windows of a recorded capture.
+
+    Each window of ``window_samples`` (by default the window a simulated
+    trial starts with) is one trial. A window that retains no full block is
+    skipped; its samples are counted as discarded by the next trial. Only
+    one chunk of the capture is mapped at a time.
+    """
+    window = _window_samples(block_length, guard_band_sigma, window_samples)
+    quantizer = MedianGuardBandQuantizer(guard_band_sigma)
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
+    retries = 0
+    discarded = 0
+    for observations in trace.iter_windows(window, chunk_samples=chunk_samples):
+        alice, bob, eve = (_features(observation) for observation in observations)
+        try:
+            trial = execute_protocol(
+                alice,
+                bob,
+                eve,
+                quantizer=quantizer,
+                reconciler=reconciler,
+                rng=rng,
+                multi_block=multi_block,
+            )
+        except RuntimeError:
+            retries += 1
+            discarded += window
+            continue
+        yield replace(trial, sample_retries=retries, discarded_samples=discarded)
+        retries = 0
+        discarded = 0
+
+
+def _chunk_features(
+    trace: CaptureTrace,
+    chunk: NDArray[Any],
+    window: int,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """``(windows, window)`` features of every observer in a chunk."""
+    rows = len(chunk) // window
+    values = chunk.reshape(rows, window, 3)
+    if trace.header.measurement == "csi":
+        values = np.abs(values)
+    return values[..., 0], values[..., 1], values[..., 2]
+
+
+def run_trace(
+    trace: CaptureTrace,
+    *,
+    block_length: int = 127,
+    guard_band_sigma: float = 0.0,
+    window_samples: int | None = None,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    multi_block: bool = False,
+) -> MonteCarloResult:
+    """Summarize ``iter_trace_trials`` over a whole capture.
+
+    Windows go through ``execute_protocol_batch`` ``batch_size`` at a time,
+    each batch read from one map of the file, so the result has the law of
+    the per-window driver at the throughput of the batched engine. Skipped
+    windows count as sample retries.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    window = _window_samples(block_length, guard_band_sigma, window_samples)
+    quantizer = MedianGuardBandQuantizer(guard_band_sigma)
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(block_length))
+    rng = np.random.default_rng(seed)
+    accumulator = MonteCarloAccumulator(block_length=block_length)
+    skipped = 0
+    usable = trace.samples - trace.samples % window
+    for start in range(0, usable, batch_size * window):
+        chunk = trace.read(start, min(batch_size * window, usable - start))
+        features = _chunk_features(trace, chunk, window)
+        batch = execute_protocol_batch(
+            *features,
+            quantizer=quantizer,
+            reconciler=reconciler,
+            rng=rng,
+            multi_block=multi_block,
+        )
+        skipped += len(features[0]) - batch.trials
+        if batch.trials:
+            accumulator = accumulator.add_batch(batch)
+    if accumulator.trials == 0:
+        raise RuntimeError("no window of the trace retained a full block")
+    accumulator = replace(
+        accumulator,
+        sample_retries=skipped,
+        discarded_samples=skipped * window,
+    )
+    return accumulator.finalize(seed)
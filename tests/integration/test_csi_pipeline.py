@@ -1,8 +1,25 @@
+from dataclasses import replace
+
 import numpy as np
+import pytest
 
 from plkg.protocol import amplify_reconciled_keys
+from plkg.protocol.pipeline import execute_protocol
+from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.protocol.reconciliation import BchCodeOffsetReconciler, create_bch_codec
+from plkg.radio.channels.ofdm import OfdmGrid, PowerDelayProfile, sample_ofdm_channel
+from plkg.radio.channels.rayleigh import correlated_complex_channel
+from plkg.radio.measurements.csi import CsiTensorExtractor, observe_csi_tensor
+from plkg.radio.profiles import get_profile
+from plkg.simulation.eavesdroppers import run_csi_eavesdropper_trial
+from plkg.simulation.latency import simulate_key_latency
 from plkg.simulation.runner import run_csi_monte_carlo, run_csi_trial
-from plkg.simulation.scenario import CsiScenario
+from plkg.simulation.scenario import (
+    CsiScenario,
+    profile_scenario,
+    sample_scenario_channel,
+)
+from plkg.simulation.sweep import run_csi_sweep
 
 
 def test_identical_csi_without_noise_produces_equal_keys() -> None:
@@ -32,6 +49,20 @@ def test_bob_and_eve_receive_the_same_public_transcript() -> None:
     assert trial.transcript.quantization is not None
 
 
+def test_multi_block_trials_reconcile_every_complete_block() -> None:
+    trial = run_csi_trial(
+        CsiScenario(noise_variance=0.02, guard_band_sigma=0.3),
+        block_length=7,
+        rng=np.random.default_rng(4),
+        multi_block=True,
+    )
+
+    assert trial.blocks > 1
+    assert len(trial.alice_bits) == 7 * trial.blocks
+    assert len(trial.transcript.reconciliation.helper_data) == 7 * trial.blocks
+    assert trial.transcript.reconciliation_leakage_bits == 3 * trial.blocks
+
+
 def test_privacy_amplification_uses_one_public_seed() -> None:
     rng = np.random.default_rng(11)
     trial = run_csi_trial(
@@ -46,3 +77,314 @@ def test_privacy_amplification_uses_one_public_seed() -> None:
 
     np.testing.assert_array_equal(final.alice_key, final.bob_key)
     assert len(final.transcript.privacy_seed) == 19
+
+
+def test_runner_reports_final_key_metrics_for_both_engines() -> None:
+    scenario = CsiScenario(
+        noise_variance=0.0,
+        alice_bob_correlation=1.0,
+        alice_eve_correlation=0.0,
+    )
+    for engine in ("batched", "per_trial"):
+        result = run_csi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=30,
+            seed=5,
+            engine=engine,
+            final_key_bits=7,
+        )
+
+        assert result.final_key_bits == 7
+        assert result.final_key_agreement_rate == 1.0
+        assert result.eve_final_key_mismatch_rate is not None
+        assert 0.3 < result.eve_final_key_mismatch_rate < 0.7
+
+
+def test_planned_windows_are_topped_up_instead_of_redrawn() -> None:
+    scenario = CsiScenario(noise_variance=0.02, guard_band_sigma=1.0)
+    legacy = run_csi_monte_carlo(scenario, block_length=15, trials=200, seed=8)
+    planned = run_csi_monte_carlo(
+        scenario,
+        block_length=15,
+        trials=200,
+        seed=8,
+        retention_confidence=0.99,
+    )
+
+    assert legacy.wasted_sample_fraction > 0
+    assert planned.wasted_sample_fraction == 0
+    assert planned.mean_sample_retries < legacy.mean_sample_retries
+    assert planned.mean_sample_retries_avoided is not None
+    assert legacy.mean_sample_retries_avoided is None
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        CsiScenario(guard_band_sigma=0.8, relative_estimation_error=0.3),
+        CsiScenario(guard_band_sigma=0.8, doppler_hz=5.0),
+    ],
+)
+def test_planned_windows_retry_no_more_than_default_windows(
+    scenario: CsiScenario,
+) -> None:
+    default = run_csi_monte_carlo(scenario, block_length=127, trials=1_000, seed=3)
+    planned = run_csi_monte_carlo(
+        scenario,
+        block_length=127,
+        trials=1_000,
+        seed=3,
+        retention_confidence=0.99,
+    )
+
+    assert planned.mean_sample_retries <= default.mean_sample_retries
+    assert planned.wasted_sample_fraction == 0
+    assert planned.mean_sample_retries_avoided is not None
+    assert planned.mean_sample_retries_avoided > 0
+
+
+def test_jakes_scenarios_fade_every_observer_in_time() -> None:
+    profile = get_profile("nr_fr1_n78")
+    scenario = CsiScenario(
+        noise_variance=0.01,
+        sample_interval_s=profile.sample_interval_s,
+        doppler_hz=profile.doppler_hz,
+    )
+    taps = sample_scenario_channel(scenario, (64, 512), np.random.default_rng(0))
+    power = 2 * scenario.sigma**2
+    lag_one = np.mean(taps[:, 1:] * np.conj(taps[:, :-1])).real / power
+
+    assert lag_one > 0.95
+    # A 15 ms window lies within the coherence time, so the fading hardly
+    # varies and the bits are dominated by estimation noise.
+    iid = run_csi_monte_carlo(
+        replace(scenario, doppler_hz=None),
+        block_length=15,
+        trials=60,
+        seed=2,
+    )
+    for engine in ("batched", "per_trial"):
+        result = run_csi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=60,
+            seed=2,
+            engine=engine,
+        )
+        assert result.bob_raw_mismatch_rate > iid.bob_raw_mismatch_rate + 0.05
+
+
+def test_planned_top_ups_continue_faded_windows() -> None:
+    scenario = CsiScenario(
+        noise_variance=0.02,
+        guard_band_sigma=1.5,
+        doppler_hz=get_profile("nr_fr1_n78").doppler_hz,
+    )
+    planned = {
+        engine: run_csi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=100,
+            seed=9,
+            engine=engine,
+            retention_confidence=0.5,
+        )
+        for engine in ("batched", "per_trial")
+    }
+    (swept,) = run_csi_sweep(
+        [scenario],
+        block_length=15,
+        trials=100,
+        seed=9,
+        retention_confidence=0.5,
+    )
+
+    for result in (*planned.values(), swept):
+        assert result.mean_sample_retries > 0
+        assert result.wasted_sample_fraction == 0
+        assert result.bob_raw_mismatch_rate < 0.1
+
+
+def test_ofdm_tensor_features_reconcile_keys() -> None:
+    rng = np.random.default_rng(4)
+    profile = PowerDelayProfile.exponential(100e-9, 8)
+    grid = OfdmGrid(273 * 12, antennas=2, fft_size=4096)
+    alice_channel = sample_ofdm_channel(1.0, profile, grid, 4, rng)
+    extractor = CsiTensorExtractor(dct_coefficients=32)
+    alice, bob, eve = (
+        extractor.extract(observe_csi_tensor(channel, 0.01, 0.0, rng))
+        for channel in (
+            alice_channel,
+            correlated_complex_channel(alice_channel, 1.0, 0.999, rng),
+            correlated_complex_channel(alice_channel, 1.0, 0.0, rng),
+        )
+    )
+    trial = execute_protocol(
+        alice,
+        bob,
+        eve,
+        MedianGuardBandQuantizer(0.0),
+        BchCodeOffsetReconciler(create_bch_codec(127)),
+        rng,
+    )
+
+    assert trial.bob_reconciled.success
+    assert np.mean(trial.alice_bits != trial.eve_bits) > 0.3
+
+
+def test_many_eavesdroppers_attack_one_transcript() -> None:
+    scenario = CsiScenario(
+        noise_variance=0.0,
+        alice_bob_correlation=0.95,
+        guard_band_sigma=0.3,
+    )
+    correlations = [0.0, *np.linspace(0.2, 0.9, 30), 1.0]
+    trial, report = run_csi_eavesdropper_trial(
+        scenario,
+        correlations,
+        block_length=15,
+        rng=np.random.default_rng(8),
+        multi_block=True,
+    )
+
+    assert report.eavesdroppers == len(correlations)
+    assert report.eve_bits.shape == (len(correlations), len(trial.alice_bits))
+    np.testing.assert_array_equal(report.eve_bits[0], trial.eve_bits)
+    np.testing.assert_array_equal(
+        report.eve_reconciled_bits[0],
+        trial.eve_reconciled.bits,
+    )
+    assert report.reconciled_mismatch_rates[-1] == 0.0
+    assert report.worst_case_reconciled_mismatch_rate == 0.0
+    assert report.eve_success[report.worst_case_index]
+    assert report.raw_mismatch_rates[0] > 0.3
+
+
+def test_multi_level_quantization_extracts_more_bits_per_sample() -> None:
+    scenario = CsiScenario(alice_bob_correlation=0.999, guard_band_sigma=0.1)
+    one_bit, two_bits = (
+        run_csi_monte_carlo(
+            replace(scenario, quantization_bits=bits),
+            block_length=15,
+            trials=200,
+            seed=9,
+            multi_block=True,
+        )
+        for bits in (1, 2)
+    )
+    trial, report = run_csi_eavesdropper_trial(
+        replace(scenario, quantization_bits=2),
+        [0.0, 1.0],
+        block_length=15,
+        rng=np.random.default_rng(10),
+    )
+
+    assert two_bits.key_bits_per_sample > 1.5 * one_bit.key_bits_per_sample
+    assert two_bits.mean_blocks_per_trial > one_bit.mean_blocks_per_trial
+    assert two_bits.bob_frame_error_rate < 0.1
+    assert trial.transcript.quantization.bits_per_sample == 2
+    assert len(trial.transcript.quantization.level_thresholds) == 3
+    np.testing.assert_array_equal(report.eve_bits[0], trial.eve_bits)
+    assert report.raw_mismatch_rates[-1] == 0.0
+
+
+def test_decimation_turns_oversampled_bits_into_secure_key_rate() -> None:
+    profile = get_profile("nr_fr1_n78")
+    scenario = replace(
+        profile_scenario(profile, noise_variance=0.01),
+        guard_band_sigma=1.0,
+    )
+    oversampled, decimated = (
+        run_csi_monte_carlo(
+            replace(scenario, decimation_stride=stride),
+            block_length=127,
+            trials=60,
+            seed=12,
+            multi_block=True,
+        )
+        for stride in (1, 4)
+    )
+    per_trial = run_csi_monte_carlo(
+        replace(scenario, decimation_stride=4),
+        block_length=127,
+        trials=60,
+        seed=12,
+        engine="per_trial",
+        multi_block=True,
+    )
+
+    assert oversampled.independent_samples_per_second == pytest.approx(
+        1 / profile.coherence_time_s
+    )
+    assert oversampled.secure_key_bits_per_second == 0.0
+    assert decimated.secure_key_bits_per_second > 5.0
+    assert per_trial.secure_key_bits_per_second == pytest.approx(
+        decimated.secure_key_bits_per_second,
+        rel=0.3,
+    )
+    assert decimated.bob_block_error_rate < oversampled.bob_block_error_rate
+
+
+def test_secure_key_rate_falls_as_eve_approaches_alice() -> None:
+    scenario = replace(
+        profile_scenario(get_profile("nr_fr1_n78"), noise_variance=0.01),
+        guard_band_sigma=1.0,
+        decimation_stride=4,
+    )
+    rates = [
+        run_csi_monte_carlo(
+            replace(scenario, alice_eve_correlation=correlation),
+            block_length=127,
+            trials=60,
+            seed=12,
+            multi_block=True,
+        ).secure_key_bits_per_second
+        for correlation in (0.0, 0.5, 0.9, -0.9)
+    ]
+
+    assert rates[0] > rates[1] > rates[2]
+    assert rates[0] > 5.0
+    assert rates[2] == rates[3] == 0.0
+
+
+def test_key_latency_counts_probing_round_trips_and_failed_sessions() -> None:
+    scenario = replace(
+        profile_scenario(get_profile("nr_fr1_n78"), noise_variance=0.01),
+        guard_band_sigma=1.0,
+        decimation_stride=3,
+    )
+    direct, remote = (
+        simulate_key_latency(
+            scenario,
+            sessions=12,
+            keys_per_session=2,
+            round_trip_s=round_trip_s,
+            seed=5,
+        )
+        for round_trip_s in (0.0, 0.05)
+    )
+    hopeless = simulate_key_latency(
+        replace(scenario, alice_bob_correlation=0.0),
+        sessions=3,
+        keys_per_session=1,
+        max_windows_per_key=2,
+    )
+
+    assert direct.first_key_rate == 1.0
+    window_s = 3 * 127 * scenario.decimation_stride * scenario.sample_interval_s
+    assert window_s <= direct.time_to_first_key_p50_s
+    assert direct.time_to_first_key_p50_s <= direct.time_to_first_key_p95_s
+    assert direct.time_to_first_key_p95_s <= direct.time_to_first_key_p99_s
+    assert direct.sustained_key_bits_per_second_p01 > 0.0
+    assert (
+        direct.sustained_key_bits_per_second_p01
+        <= direct.sustained_key_bits_per_second_p05
+        <= direct.sustained_key_bits_per_second_p50
+    )
+    # Same windows; a 128-bit key needs at least four agreed BCH(127, 64)
+    # blocks, each one round trip.
+    assert remote.time_to_first_key_p50_s >= direct.time_to_first_key_p50_s + 0.2
+    assert hopeless.first_key_rate == 0.0
+    assert hopeless.time_to_first_key_p50_s == float("inf")
+    assert hopeless.sustained_key_bits_per_second_p50 == 0.0
@@ -0,0 +1,150 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from plkg.security import PrecisionTarget
+from plkg.simulation import (
+    CsiScenario,
+    MonteCarloCheckpoint,
+    RssiScenario,
+    create_channel_bank,
+)
+from plkg.simulation.runner import run_csi_monte_carlo, run_rssi_monte_carlo
+
+
+def test_csi_result_does_not_depend_on_worker_count() -> None:
+    scenario = CsiScenario(noise_variance=0.05, guard_band_sigma=0.5)
+    serial = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=21,
+        batch_size=8,
+    )
+    parallel = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=21,
+        batch_size=8,
+        workers=2,
+    )
+
+    assert parallel == serial
+    assert serial.trials == 40
+
+
+def test_per_trial_engine_rejects_worker_pool() -> None:
+    with pytest.raises(ValueError):
+        run_csi_monte_carlo(CsiScenario(), trials=1, engine="per_trial", workers=2)
+
+
+def test_resumed_run_matches_an_uninterrupted_run() -> None:
+    scenario = CsiScenario(noise_variance=0.05, guard_band_sigma=0.5)
+    checkpoints: list[MonteCarloCheckpoint] = []
+    uninterrupted = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=5,
+        batch_size=8,
+        on_checkpoint=checkpoints.append,
+    )
+    saved = json.loads(json.dumps(checkpoints[1].as_dict()))
+    resumed = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=5,
+        batch_size=8,
+        checkpoint=MonteCarloCheckpoint.from_dict(saved),
+    )
+
+    assert len(checkpoints) == 5
+    assert resumed == uninterrupted
+
+
+def test_extended_run_reuses_finished_shards() -> None:
+    scenario = CsiScenario(noise_variance=0.05)
+    checkpoints: list[MonteCarloCheckpoint] = []
+    run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=16,
+        seed=6,
+        batch_size=8,
+        on_checkpoint=checkpoints.append,
+    )
+    extended = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=6,
+        batch_size=8,
+        checkpoint=checkpoints[-1],
+        on_checkpoint=checkpoints.append,
+    )
+    longer = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=40,
+        seed=6,
+        batch_size=8,
+    )
+
+    assert checkpoints[-1].segments == (16, 24)
+    assert len(checkpoints) == 5
+    assert extended == longer
+
+
+def test_sequential_run_stops_once_the_interval_is_tight() -> None:
+    scenario = CsiScenario(noise_variance=0.0, alice_bob_correlation=1.0)
+    precision = PrecisionTarget(absolute_half_width=0.05, min_trials=16)
+    result = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=400,
+        seed=9,
+        batch_size=16,
+        precision=precision,
+    )
+
+    assert result.trials < 400
+    assert result.trials % 16 == 0
+    assert result.bob_frame_error_rate == 0.0
+    upper = result.bob_frame_error_rate_upper
+    assert upper - result.bob_frame_error_rate_lower <= 0.1
+
+
+def test_channel_bank_feeds_every_worker_the_same_channels(tmp_path: Path) -> None:
+    scenario = CsiScenario(noise_variance=0.0, alice_bob_correlation=0.9)
+    bank = create_channel_bank(tmp_path / "bank", scenario, 40, 256, seed=1)
+    results = [
+        run_csi_monte_carlo(
+            scenario,
+            block_length=7,
+            trials=40,
+            seed=seed,
+            batch_size=8,
+            workers=workers,
+            channel_bank=tmp_path / "bank",
+        )
+        for seed, workers in ((1, 1), (1, 2), (2, 1))
+    ]
+
+    assert results[0] == results[1]
+    # Without noise the bits depend on the channels alone, not on the seed.
+    assert results[2].bob_raw_mismatch_rate == results[0].bob_raw_mismatch_rate
+    assert results[2].eve_raw_mismatch_rate == results[0].eve_raw_mismatch_rate
+    rssi = run_rssi_monte_carlo(
+        RssiScenario(measurement_noise_std_db=0.0, alice_bob_correlation=0.9),
+        block_length=7,
+        trials=40,
+        channel_bank=bank,
+    )
+    assert rssi.trials == 40
+    with pytest.raises(ValueError, match="does not match"):
+        run_csi_monte_carlo(CsiScenario(), block_length=7, trials=8, channel_bank=bank)
+    with pytest.raises(ValueError, match="holds 40 trials"):
+        run_csi_monte_carlo(scenario, block_length=7, trials=48, channel_bank=bank)
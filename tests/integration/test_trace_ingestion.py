@@ -0,0 +1,117 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from plkg.core.models import CsiObservation
+from plkg.radio.channels.rayleigh import add_complex_estimation_noise
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.radio.measurements.traces import CaptureTrace, write_trace
+from plkg.security.metrics import aggregate_trials
+from plkg.simulation import CsiScenario, iter_trace_trials, run_trace
+from plkg.simulation.scenario import sample_observer_channels
+
+
+def _capture(samples: int, seed: int) -> np.ndarray:
+    scenario = CsiScenario(noise_variance=0.05, numeric_precision="single")
+    rng = np.random.default_rng(seed)
+    channels = sample_observer_channels(scenario, samples, rng)
+    observed = [
+        add_complex_estimation_noise(channel, scenario.noise_variance, 0.0, rng)
+        for channel in channels
+    ]
+    return np.stack(observed, axis=1)
+
+
+def test_trace_windows_are_views_of_the_capture(tmp_path: Path) -> None:
+    values = _capture(1_000, seed=1)
+    chunks = np.array_split(values, 3)
+    trace = write_trace(
+        tmp_path / "capture.trace",
+        "csi",
+        chunks,
+        sample_interval_s=1e-3,
+    )
+    np.save(tmp_path / "capture.npy", values)
+
+    for reopened in (
+        CaptureTrace.open(tmp_path / "capture.trace"),
+        CaptureTrace.open(tmp_path / "capture.npy", sample_interval_s=1e-3),
+    ):
+        assert reopened.header == trace.header
+        alice, bob, eve = reopened.window(100, 50)
+        assert isinstance(alice, CsiObservation)
+        assert not alice.values.flags.owndata
+        np.testing.assert_array_equal(eve.values, values[100:150, 2])
+        windows = list(reopened.iter_windows(127, chunk_samples=300))
+        assert len(windows) == 7
+        np.testing.assert_array_equal(windows[-1][1].values, values[762:889, 1])
+
+    with pytest.raises(ValueError, match="trace holds 1000 samples"):
+        trace.read(990, 20)
+
+
+def test_trace_writer_rejects_a_wrong_dtype_before_writing(tmp_path: Path) -> None:
+    consumed = []
+
+    def chunks() -> Iterator[np.ndarray]:
+        for index in range(3):
+            consumed.append(index)
+            yield np.zeros((1_000, 3), dtype=np.float32)
+
+    path = tmp_path / "capture.trace"
+    with pytest.raises(ValueError, match="csi traces hold"):
+        write_trace(path, "csi", chunks())
+
+    assert consumed == [0]
+    assert not path.exists()
+
+
+def test_trace_protocol_drivers_agree(tmp_path: Path) -> None:
+    trace = write_trace(tmp_path / "capture.trace", "csi", [_capture(20_000, seed=2)])
+
+    trials = list(
+        iter_trace_trials(
+            trace,
+            15,
+            np.random.default_rng(3),
+            guard_band_sigma=0.5,
+            chunk_samples=1_000,
+        )
+    )
+    per_window = aggregate_trials(trials, seed=3)
+    batched = run_trace(trace, block_length=15, guard_band_sigma=0.5, batch_size=64)
+
+    # Bit errors do not depend on the protocol randomness.
+    assert batched.trials == per_window.trials
+    assert batched.bob_raw_mismatch_rate == per_window.bob_raw_mismatch_rate
+    assert batched.bob_reconciled_mismatch_rate == pytest.approx(
+        per_window.bob_reconciled_mismatch_rate
+    )
+    assert batched.mean_sample_retries == pytest.approx(per_window.mean_sample_retries)
+    assert batched.bob_raw_mismatch_rate < 0.2
+    assert 0.4 < batched.eve_raw_mismatch_rate < 0.6
+
+
+def test_rssi_trace_feeds_levels(tmp_path: Path) -> None:
+    rng = np.random.default_rng(4)
+    levels = np.stack(
+        [
+            rssi_levels_dbm(channel, -60.0, 1.0, 1.0, rng)
+            for channel in sample_observer_channels(CsiScenario(), 2_000, rng)
+        ],
+        axis=1,
+    )
+    trace = write_trace(
+        tmp_path / "rssi.trace",
+        "rssi",
+        [levels],
+        sample_interval_s=0.1,
+    )
+
+    result = run_trace(CaptureTrace.open(trace.path), block_length=7)
+
+    assert trace.header.dtype == "float64"
+    assert result.trials == 2_000 // 7
+    assert result.bob_raw_mismatch_rate < 0.25
@@ -0,0 +1,164 @@
+import math
+from collections.abc import Callable
+
+import pytest
+
+from plkg.core.models import MonteCarloResult
+from plkg.simulation import CsiScenario, RssiScenario
+from plkg.simulation.runner import run_csi_monte_carlo, run_rssi_monte_carlo
+
+
+def _assert_within_monte_carlo_error(
+    reference: float,
+    estimate: float,
+    observations: int,
+) -> None:
+    spread = math.sqrt(max(reference * (1 - reference), 1e-4) / observations)
+    assert abs(reference - estimate) < 5 * spread
+
+
+@pytest.mark.statistical
+def test_batched_csi_engine_matches_per_trial_reference() -> None:
+    scenario = CsiScenario(noise_variance=0.05, guard_band_sigma=0.5)
+    reference = run_csi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=80,
+        seed=5,
+        engine="per_trial",
+    )
+    batched = run_csi_monte_carlo(scenario, block_length=7, trials=2_000, seed=6)
+
+    for metric in (
+        "bob_raw_mismatch_rate",
+        "bob_reconciled_mismatch_rate",
+        "eve_raw_mismatch_rate",
+    ):
+        _assert_within_monte_carlo_error(
+            getattr(batched, metric),
+            getattr(reference, metric),
+            reference.trials * reference.bits_per_trial,
+        )
+    _assert_within_monte_carlo_error(
+        batched.bob_frame_error_rate,
+        reference.bob_frame_error_rate,
+        reference.trials,
+    )
+    assert batched.mean_retention_rate == pytest.approx(
+        reference.mean_retention_rate,
+        abs=0.05,
+    )
+
+
+@pytest.mark.statistical
+def test_batched_rssi_engine_matches_per_trial_reference() -> None:
+    scenario = RssiScenario(measurement_noise_std_db=2.0)
+    reference = run_rssi_monte_carlo(
+        scenario,
+        block_length=7,
+        trials=80,
+        seed=7,
+        engine="per_trial",
+    )
+    batched = run_rssi_monte_carlo(scenario, block_length=7, trials=2_000, seed=8)
+
+    _assert_within_monte_carlo_error(
+        batched.bob_raw_mismatch_rate,
+        reference.bob_raw_mismatch_rate,
+        reference.trials * reference.bits_per_trial,
+    )
+    assert batched.mean_alice_bob_correlation == pytest.approx(
+        reference.mean_alice_bob_correlation,
+        abs=0.05,
+    )
+
+
+@pytest.mark.statistical
+def test_multi_block_engines_agree_on_blocks_and_block_errors() -> None:
+    scenario = CsiScenario(noise_variance=0.05, guard_band_sigma=0.3)
+    reference = run_csi_monte_carlo(
+        scenario,
+        block_length=15,
+        trials=150,
+        seed=9,
+        engine="per_trial",
+        multi_block=True,
+    )
+    batched = run_csi_monte_carlo(
+        scenario,
+        block_length=15,
+        trials=2_000,
+        seed=10,
+        multi_block=True,
+    )
+
+    assert reference.mean_blocks_per_trial > 1.5
+    assert batched.mean_blocks_per_trial == pytest.approx(
+        reference.mean_blocks_per_trial,
+        abs=0.1,
+    )
+    _assert_within_monte_carlo_error(
+        batched.bob_block_error_rate,
+        reference.bob_block_error_rate,
+        round(reference.trials * reference.mean_blocks_per_trial),
+    )
+    _assert_within_monte_carlo_error(
+        batched.bob_raw_mismatch_rate,
+        reference.bob_raw_mismatch_rate,
+        round(reference.trials * reference.mean_blocks_per_trial) * 15,
+    )
+
+
+@pytest.mark.statistical
+@pytest.mark.parametrize(
+    ("scenario", "runner"),
+    [
+        (CsiScenario(noise_variance=0.05, guard_band_sigma=1.5), run_csi_monte_carlo),
+        (
+            RssiScenario(measurement_noise_std_db=2.0, guard_band_sigma=1.5),
+            run_rssi_monte_carlo,
+        ),
+    ],
+)
+def test_short_planned_windows_are_topped_up_in_both_engines(
+    scenario: CsiScenario | RssiScenario,
+    runner: Callable[..., MonteCarloResult],
+) -> None:
+    # Planning for an even chance leaves about half the windows short.
+    planned = runner(
+        scenario,
+        block_length=15,
+        trials=2_000,
+        seed=3,
+        retention_confidence=0.5,
+    )
+    per_trial = runner(
+        scenario,
+        block_length=15,
+        trials=200,
+        seed=4,
+        retention_confidence=0.5,
+        engine="per_trial",
+    )
+    redrawn = runner(scenario, block_length=15, trials=2_000, seed=5)
+
+    for result in (planned, per_trial):
+        assert result.mean_sample_retries > 0
+        assert result.wasted_sample_fraction == 0
+    assert redrawn.wasted_sample_fraction > 0
+    for reference in (per_trial, redrawn):
+        for metric in ("bob_raw_mismatch_rate", "eve_raw_mismatch_rate"):
+            _assert_within_monte_carlo_error(
+                getattr(planned, metric),
+                getattr(reference, metric),
+                reference.trials * reference.bits_per_trial,
+            )
+        _assert_within_monte_carlo_error(
+            planned.bob_frame_error_rate,
+            reference.bob_frame_error_rate,
+            reference.trials,
+        )
+        assert planned.mean_retention_rate == pytest.approx(
+            reference.mean_retention_rate,
+            abs=0.02,
+        )
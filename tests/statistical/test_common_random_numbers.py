@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from plkg.simulation import (
+    CsiScenario,
+    RssiScenario,
+    run_csi_monte_carlo,
+    run_csi_sweep,
+    run_rssi_sweep,
+)
+
+
+def test_identical_sweep_points_share_every_realization() -> None:
+    scenario = RssiScenario(guard_band_sigma=1.0)
+
+    first, second = run_rssi_sweep(
+        [scenario, scenario],
+        block_length=15,
+        trials=300,
+        seed=2,
+        batch_size=128,
+    )
+
+    assert first == second
+    assert first.mean_sample_retries > 0
+
+
+@pytest.mark.statistical
+def test_sweep_points_match_independent_runs() -> None:
+    scenarios = [
+        CsiScenario(noise_variance=noise_variance, guard_band_sigma=0.3)
+        for noise_variance in (0.1, 0.05)
+    ]
+
+    swept = run_csi_sweep(scenarios, block_length=15, trials=4_000, seed=3)
+
+    assert swept[0].bob_raw_mismatch_rate > swept[1].bob_raw_mismatch_rate
+    for scenario, result in zip(scenarios, swept, strict=True):
+        reference = run_csi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=4_000,
+            seed=4,
+        )
+        rate = reference.bob_frame_error_rate
+        spread = math.sqrt(2 * max(rate * (1 - rate), 1e-4) / reference.trials)
+        assert abs(result.bob_frame_error_rate - rate) < 5 * spread
+        assert result.mean_retention_rate == pytest.approx(
+            reference.mean_retention_rate,
+            abs=0.01,
+        )
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from plkg.simulation import (
+    CsiScenario,
+    RssiScenario,
+    estimate_csi_frame_error_rate,
+    estimate_rssi_frame_error_rate,
+)
+from plkg.simulation.rare_events import frame_error_probabilities
+from plkg.simulation.runner import run_csi_monte_carlo, run_rssi_monte_carlo
+
+
+def test_frame_error_probabilities_match_binomial_tail() -> None:
+    probabilities = np.array([[0.1] * 15, [0.01] * 15, [0.0] * 15])
+
+    tails = frame_error_probabilities(probabilities, 2)
+
+    assert tails[0] == pytest.approx(stats.binom.sf(2, 15, 0.1))
+    assert tails[1] == pytest.approx(stats.binom.sf(2, 15, 0.01), rel=1e-9)
+    assert tails[2] == 0.0
+
+
+@pytest.mark.statistical
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        CsiScenario(noise_variance=0.05, alice_bob_correlation=0.99),
+        CsiScenario(
+            noise_variance=0.01,
+            alice_bob_correlation=0.99,
+            relative_estimation_error=0.05,
+            guard_band_sigma=0.5,
+        ),
+        RssiScenario(
+            measurement_noise_std_db=1.0,
+            alice_bob_correlation=0.99,
+            guard_band_sigma=0.5,
+        ),
+    ],
+)
+def test_conditional_estimate_matches_plain_monte_carlo(
+    scenario: CsiScenario | RssiScenario,
+) -> None:
+    if isinstance(scenario, CsiScenario):
+        estimate = estimate_csi_frame_error_rate(
+            scenario,
+            block_length=15,
+            trials=2_000,
+            seed=3,
+        )
+        reference = run_csi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=10_000,
+            seed=4,
+        )
+    else:
+        estimate = estimate_rssi_frame_error_rate(
+            scenario,
+            block_length=15,
+            trials=2_000,
+            seed=3,
+        )
+        reference = run_rssi_monte_carlo(
+            scenario,
+            block_length=15,
+            trials=10_000,
+            seed=4,
+        )
+    rate = reference.bob_frame_error_rate
+    spread = math.hypot(
+        estimate.standard_error,
+        math.sqrt(max(rate * (1 - rate), 1e-4) / reference.trials),
+    )
+
+    assert abs(estimate.frame_error_rate - rate) < 5 * spread
+    assert estimate.bit_error_rate == pytest.approx(
+        reference.bob_raw_mismatch_rate,
+        abs=0.005,
+    )
+    assert estimate.variance_reduction > 1
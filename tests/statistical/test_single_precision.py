@@ -0,0 +1,69 @@
+import math
+from dataclasses import replace
+
+import pytest
+
+from plkg.simulation import CsiScenario, RssiScenario
+from plkg.simulation.runner import run_csi_monte_carlo, run_rssi_monte_carlo
+
+
+def _assert_within_monte_carlo_error(
+    double: float,
+    single: float,
+    observations: int,
+) -> None:
+    # Both rates are estimates from independent runs of equal size.
+    spread = math.sqrt(2 * max(double * (1 - double), 1e-4) / observations)
+    assert abs(double - single) < 5 * spread
+
+
+@pytest.mark.statistical
+@pytest.mark.parametrize("doppler_hz", [None, 40.0])
+def test_single_precision_csi_matches_double_precision(
+    doppler_hz: float | None,
+) -> None:
+    double = CsiScenario(
+        noise_variance=0.05,
+        relative_estimation_error=0.02,
+        guard_band_sigma=0.3,
+        doppler_hz=doppler_hz,
+    )
+    single = replace(double, numeric_precision="single")
+    reference = run_csi_monte_carlo(double, block_length=15, trials=1_500, seed=3)
+    estimate = run_csi_monte_carlo(single, block_length=15, trials=1_500, seed=4)
+
+    for metric in (
+        "bob_raw_mismatch_rate",
+        "bob_reconciled_mismatch_rate",
+        "eve_raw_mismatch_rate",
+    ):
+        _assert_within_monte_carlo_error(
+            getattr(reference, metric),
+            getattr(estimate, metric),
+            reference.trials * reference.bits_per_trial,
+        )
+    _assert_within_monte_carlo_error(
+        reference.bob_frame_error_rate,
+        estimate.bob_frame_error_rate,
+        reference.trials,
+    )
+
+
+@pytest.mark.statistical
+def test_single_precision_rssi_matches_double_precision() -> None:
+    double = RssiScenario(measurement_noise_std_db=2.0)
+    single = replace(double, numeric_precision="single")
+    reference = run_rssi_monte_carlo(double, block_length=15, trials=1_500, seed=5)
+    estimate = run_rssi_monte_carlo(single, block_length=15, trials=1_500, seed=6)
+
+    for metric in ("bob_raw_mismatch_rate", "bob_reconciled_mismatch_rate"):
+        _assert_within_monte_carlo_error(
+            getattr(reference, metric),
+            getattr(estimate, metric),
+            reference.trials * reference.bits_per_trial,
+        )
+    _assert_within_monte_carlo_error(
+        reference.bob_frame_error_rate,
+        estimate.bob_frame_error_rate,
+        reference.trials,
+    )
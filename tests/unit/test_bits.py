@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from plkg.core.bits import hamming_distance, mismatch_rate, xor_bits
+from plkg.core.bits import PackedBits, hamming_distance, mismatch_rate, xor_bits
 
 
 def test_binary_operations() -> None:
@@ -16,3 +16,36 @@ def test_binary_operations() -> None:
 def test_binary_operations_reject_different_lengths() -> None:
     with pytest.raises(ValueError):
         xor_bits(np.array([0], dtype=np.uint8), np.array([0, 1], dtype=np.uint8))
+
+
+def test_packed_hamming_distance_rejects_bit_matrices() -> None:
+    vector = PackedBits.from_bits(np.zeros(70, dtype=np.uint8))
+    matrix = PackedBits.from_bits(np.zeros((2, 70), dtype=np.uint8))
+    row = PackedBits.from_bits(np.zeros((1, 70), dtype=np.uint8))
+
+    for left, right in ((vector, matrix), (matrix, vector), (row, row)):
+        with pytest.raises(ValueError, match="one-dimensional"):
+            hamming_distance(left, right)
+    with pytest.raises(ValueError, match="equal length"):
+        hamming_distance(vector, PackedBits.from_bits(np.zeros(71, dtype=np.uint8)))
+
+
+def test_packed_bits_round_trip_and_popcount() -> None:
+    rng = np.random.default_rng(5)
+    left = rng.integers(0, 2, (3, 255), dtype=np.uint8)
+    right = rng.integers(0, 2, (3, 255), dtype=np.uint8)
+    packed_left = PackedBits.from_bits(left)
+    packed_right = PackedBits.from_bits(right)
+
+    assert packed_left.words.shape == (3, 4)
+    np.testing.assert_array_equal(packed_left.unpack(), left)
+    np.testing.assert_array_equal(
+        (packed_left ^ packed_right).popcount(),
+        np.count_nonzero(left != right, axis=1),
+    )
+    assert hamming_distance(
+        PackedBits.from_bits(left[0]),
+        PackedBits.from_bits(right[0]),
+    ) == hamming_distance(left[0], right[0])
+    for index in (slice(64, 200), slice(3, 130), slice(0, 255, 2)):
+        np.testing.assert_array_equal(packed_left[index].unpack(), left[:, index])
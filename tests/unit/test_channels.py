@@ -1,16 +1,31 @@
 import numpy as np
 import pytest
 
+from plkg.radio.channels.jakes import jakes_spectrum_weights, sample_jakes_channel
 from plkg.radio.channels.mobility import (
     coherence_time_s,
     doppler_frequency_hz,
     jakes_correlation,
 )
+from plkg.radio.channels.ofdm import (
+    OfdmGrid,
+    PowerDelayProfile,
+    iter_ofdm_channel,
+    ofdm_frequency_response,
+    sample_ofdm_channel,
+    sample_ofdm_taps,
+)
 from plkg.radio.channels.rayleigh import (
     add_complex_estimation_noise,
     correlated_complex_channel,
+    mix_joint_channels,
+    observer_correlation_matrix,
+    sample_joint_channels,
     sample_rayleigh_channel,
 )
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.simulation import CsiScenario
+from plkg.simulation.scenario import sample_observer_channels
 
 
 def test_correlated_channel_matches_requested_correlation() -> None:
@@ -33,3 +48,102 @@ def test_mobility_model() -> None:
     assert doppler_frequency_hz(0.0, 2.4e9) == 0.0
     assert coherence_time_s(0.0, 2.4e9) == float("inf")
     assert jakes_correlation(0.0, 100.0) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("doppler_hz", [20.0, 900.0])
+def test_jakes_channel_follows_bessel_autocorrelation(doppler_hz: float) -> None:
+    rng = np.random.default_rng(3)
+    taps = sample_jakes_channel(1.0, doppler_hz, 1e-3, (200, 4_096), rng)
+
+    assert np.mean(np.abs(taps) ** 2) == pytest.approx(2.0, rel=0.02)
+    for lag in (1, 5, 10, 40):
+        empirical = np.mean(taps[:, lag:] * np.conj(taps[:, :-lag])).real / 2
+        assert empirical == pytest.approx(
+            jakes_correlation(lag * 1e-3, doppler_hz),
+            abs=0.02,
+        )
+
+
+def test_jakes_spectrum_weights_are_a_distribution() -> None:
+    weights = jakes_spectrum_weights(1_000, 16.2, 1e-3)
+
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.all(weights >= 0)
+    assert jakes_spectrum_weights(8, 0.0, 1e-3).tolist() == [1.0] + [0.0] * 7
+    static = sample_jakes_channel(1.0, 0.0, 1e-3, (3, 16), np.random.default_rng(0))
+    np.testing.assert_allclose(static, static[:, :1] * np.ones(16))
+
+
+def test_ofdm_channel_follows_power_delay_profile() -> None:
+    profile = PowerDelayProfile.exponential(100e-9, 8)
+    grid = OfdmGrid(256, subcarrier_spacing_hz=30e3, antennas=2, fft_size=4096)
+    channel = sample_ofdm_channel(1.0, profile, grid, 4_000, np.random.default_rng(5))
+
+    assert channel.shape == (4_000, 256, 2)
+    assert np.mean(np.abs(channel) ** 2) == pytest.approx(2.0, rel=0.05)
+    for offset in (1, 8, 32):
+        empirical = np.mean(channel[:, offset:] * np.conj(channel[:, :-offset])) / 2
+        expected = profile.frequency_correlation(np.array(offset * 30e3))
+        assert abs(empirical - expected) < 0.03
+    assert abs(np.mean(channel[..., 0] * np.conj(channel[..., 1]))) < 0.05
+
+
+def test_ofdm_channel_streams_in_time_chunks() -> None:
+    profile = PowerDelayProfile((0.0, 50e-9, 200e-9), (0.0, -3.0, -9.0))
+    grid = OfdmGrid(subcarriers=64, antennas=2)
+    taps = sample_ofdm_taps(
+        1.0,
+        profile,
+        2,
+        300,
+        np.random.default_rng(9),
+        doppler_hz=30.0,
+        sample_interval_s=1e-3,
+    )
+    chunks = list(iter_ofdm_channel(taps, profile, grid, chunk_samples=128))
+
+    assert [len(chunk) for chunk in chunks] == [128, 128, 44]
+    np.testing.assert_allclose(
+        np.concatenate(chunks),
+        ofdm_frequency_response(taps, profile, grid),
+    )
+
+
+def test_joint_channels_follow_observer_correlations() -> None:
+    correlation = observer_correlation_matrix(0.9, [0.5, 1.0, 0.0])
+    rng = np.random.default_rng(3)
+    channels = sample_joint_channels(1.0, correlation, 100_000, rng)
+    empirical = (channels @ channels.conj().T).real / (2 * channels.shape[1])
+
+    assert channels.shape == (5, 100_000)
+    np.testing.assert_allclose(empirical, correlation, atol=0.02)
+    np.testing.assert_allclose(channels[3], channels[0])
+
+    independent = sample_rayleigh_channel(1.0, (2, 64), np.random.default_rng(4))
+    bob = mix_joint_channels(observer_correlation_matrix(0.8, []), independent)[1]
+    np.testing.assert_allclose(
+        bob,
+        0.8 * independent[0] + np.sqrt(1 - 0.8**2) * independent[1],
+    )
+
+
+def test_single_precision_scenarios_stay_single_precision() -> None:
+    rng = np.random.default_rng(5)
+    for doppler_hz in (None, 50.0):
+        scenario = CsiScenario(
+            noise_variance=0.1,
+            relative_estimation_error=0.05,
+            doppler_hz=doppler_hz,
+            numeric_precision="single",
+        )
+        channels = sample_observer_channels(scenario, (4, 256), rng)
+
+        assert {channel.dtype for channel in channels} == {np.dtype(np.complex64)}
+        observed = add_complex_estimation_noise(channels[1], 0.1, 0.05, rng)
+        assert observed.dtype == np.complex64
+        levels = rssi_levels_dbm(channels[2], -60.0, 1.5, 1.0, rng)
+        assert levels.dtype == np.float32
+    assert np.mean(np.abs(channels[0]) ** 2) == pytest.approx(1.0, abs=0.1)
+
+    with pytest.raises(ValueError, match="numeric_precision"):
+        CsiScenario(numeric_precision="half")  # type: ignore[arg-type]
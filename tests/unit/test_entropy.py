@@ -1,6 +1,15 @@
-from plkg.security.entropy import extractable_key_length
+import pytest
+
+from plkg.security.entropy import extractable_key_length, guessing_min_entropy
 
 
 def test_leftover_hash_bound_accounts_for_leakage_and_security_margin() -> None:
     assert extractable_key_length(200, 20, 40) == 100
     assert extractable_key_length(50, 20, 40) == 0
+
+
+def test_guessing_min_entropy_vanishes_for_correlated_guessers() -> None:
+    assert guessing_min_entropy(0.5) == 1.0
+    assert guessing_min_entropy(0.0) == 0.0
+    assert guessing_min_entropy(1.0) == 0.0
+    assert guessing_min_entropy(0.1) == pytest.approx(guessing_min_entropy(0.9))
@@ -0,0 +1,40 @@
+import pytest
+from scipy import stats
+
+from plkg.security import (
+    PrecisionTarget,
+    clopper_pearson_interval,
+    wilson_interval,
+)
+
+
+def test_wilson_interval_matches_reference_values() -> None:
+    lower, upper = wilson_interval(10, 100)
+
+    assert lower == pytest.approx(0.05523, abs=1e-5)
+    assert upper == pytest.approx(0.17437, abs=1e-5)
+
+
+def test_clopper_pearson_matches_scipy_binomtest() -> None:
+    expected = stats.binomtest(3, 40).proportion_ci(0.9, method="exact")
+
+    assert clopper_pearson_interval(3, 40, 0.9) == pytest.approx(
+        (expected.low, expected.high)
+    )
+    assert clopper_pearson_interval(0, 40)[0] == 0.0
+    assert clopper_pearson_interval(40, 40)[1] == 1.0
+
+
+def test_absolute_half_width_lets_zero_rates_stop() -> None:
+    relative = PrecisionTarget(relative_half_width=0.1)
+    floored = PrecisionTarget(relative_half_width=0.1, absolute_half_width=0.01)
+
+    assert not relative.is_met(0, 1_000)
+    assert floored.is_met(0, 1_000)
+    assert relative.is_met(500, 1_000)
+    assert not relative.is_met(50, 1_000)
+
+
+def test_precision_target_rejects_an_empty_tolerance() -> None:
+    with pytest.raises(ValueError, match="half-width"):
+        PrecisionTarget(relative_half_width=0.0)
@@ -1,7 +1,20 @@
 import numpy as np
+import pytest
 
-from plkg.radio.measurements.csi import CsiAmplitudeExtractor, observe_csi
+from plkg.radio.channels.jakes import sample_jakes_channel
+from plkg.radio.channels.ofdm import OfdmGrid, PowerDelayProfile, sample_ofdm_channel
+from plkg.radio.measurements.csi import (
+    CsiAmplitudeExtractor,
+    CsiTensorExtractor,
+    observe_csi,
+    observe_csi_tensor,
+)
+from plkg.radio.measurements.decimation import (
+    CoherenceDecimator,
+    autocorrelation,
+)
 from plkg.radio.measurements.rssi import RssiLevelExtractor, observe_rssi
+from plkg.radio.profiles import get_profile
 
 
 def test_csi_and_rssi_are_distinct_observation_types() -> None:
@@ -17,3 +30,63 @@ def test_csi_and_rssi_are_distinct_observation_types() -> None:
     )
     assert RssiLevelExtractor().extract(rssi).name == "rssi_level"
     assert np.all(np.mod(rssi.values_dbm, 1.0) == 0)
+
+
+def test_csi_tensor_features_decorrelate_subcarriers() -> None:
+    rng = np.random.default_rng(11)
+    profile = PowerDelayProfile.exponential(50e-9, 6)
+    grid = OfdmGrid(128, antennas=2, fft_size=2048)
+    channel = sample_ofdm_channel(1.0, profile, grid, 2_000, rng)
+    observation = observe_csi_tensor(channel, 0.0, 0.0, rng)
+
+    amplitudes = CsiTensorExtractor().features(observation.values)
+    coefficients = CsiTensorExtractor(dct_coefficients=8).features(observation.values)
+
+    assert amplitudes.shape == (2_000, 256)
+    assert coefficients.shape == (2_000, 16)
+    assert np.corrcoef(amplitudes[:, 0], amplitudes[:, 2])[0, 1] > 0.9
+    assert abs(np.corrcoef(coefficients[:, 0], coefficients[:, 2])[0, 1]) < 0.2
+    features = CsiTensorExtractor(dct_coefficients=8).extract(observation)
+    streamed = CsiTensorExtractor(dct_coefficients=8).extract_stream(
+        np.array_split(observation.values, 3)
+    )
+    np.testing.assert_allclose(np.concatenate(list(streamed)), features.values)
+    assert features.name == "csi_tensor_dct"
+    with pytest.raises(TypeError):
+        CsiTensorExtractor().extract(observe_csi(channel[:, 0, 0], 0.0, 0.0, rng))
+
+
+def test_coherence_decimation_keeps_nearly_independent_samples() -> None:
+    rng = np.random.default_rng(12)
+    profile = get_profile("nr_fr1_n78")
+    amplitudes = np.abs(
+        sample_jakes_channel(
+            1.0,
+            profile.doppler_hz,
+            profile.sample_interval_s,
+            (32, 3_000),
+            rng,
+        )
+    )
+    direct = np.correlate(
+        amplitudes[0] - amplitudes[0].mean(),
+        amplitudes[0] - amplitudes[0].mean(),
+        "full",
+    )[2_999:]
+
+    decimator = CoherenceDecimator.from_profile(profile)
+    measured = CoherenceDecimator.from_autocorrelation(
+        amplitudes,
+        profile.sample_interval_s,
+    )
+    decimated = decimator.apply_batch(amplitudes)
+
+    np.testing.assert_allclose(autocorrelation(amplitudes[0]), direct / direct[0])
+    assert decimator.stride == 12
+    assert abs(measured.stride - decimator.stride) <= 2
+    assert decimator.independent_samples_per_second == pytest.approx(1 / 0.012)
+    assert decimated.shape == (32, 250)
+    assert autocorrelation(decimated, max_lag=1)[1] < 0.5
+    assert autocorrelation(amplitudes, max_lag=1)[1] > 0.95
+    with pytest.raises(ValueError, match="static"):
+        CoherenceDecimator.from_profile(get_profile("iot_static_sensor"))
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from plkg.core.models import TrialBatch
+from plkg.security.metrics import MonteCarloAccumulator, RunningMoments
+
+
+def _batch(rng: np.random.Generator, trials: int) -> TrialBatch:
+    alice = rng.integers(0, 2, (trials, 7), dtype=np.uint8)
+    flips = rng.random((trials, 7)) < 0.1
+    return TrialBatch(
+        alice_bits=alice,
+        bob_bits=alice ^ flips,
+        eve_bits=rng.integers(0, 2, (trials, 7), dtype=np.uint8),
+        bob_reconciled_bits=alice,
+        eve_reconciled_bits=alice ^ 1,
+        bob_success=np.ones(trials, dtype=bool),
+        eve_success=np.zeros(trials, dtype=bool),
+        retention_rates=rng.random(trials),
+        alice_bob_observation_correlations=rng.random(trials),
+        alice_eve_observation_correlations=rng.random(trials),
+    )
+
+
+def test_running_moments_merge_matches_direct_computation() -> None:
+    values = np.random.default_rng(1).normal(3.0, 2.0, 1_000)
+    merged = RunningMoments()
+    for chunk in np.array_split(values, 7):
+        merged = merged.merge(RunningMoments.from_values(chunk))
+
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(np.mean(values))
+    assert merged.std == pytest.approx(np.std(values, ddof=1))
+
+
+def test_merged_shards_equal_one_accumulator_over_all_trials() -> None:
+    rng = np.random.default_rng(2)
+    batches = [_batch(rng, trials) for trials in (5, 11, 3)]
+    shards = [MonteCarloAccumulator.from_batch(batch) for batch in batches]
+    merged = shards[0].merge(shards[1]).merge(shards[2])
+    retention = np.concatenate([batch.retention_rates for batch in batches])
+
+    result = merged.finalize(seed=0)
+
+    assert result.trials == 19
+    assert result.bob_reconciled_mismatch_rate == 0.0
+    assert result.eve_reconciled_mismatch_rate == 1.0
+    assert result.mean_retention_rate == pytest.approx(np.mean(retention))
+    assert result.std_retention_rate == pytest.approx(np.std(retention, ddof=1))
+
+
+def test_accumulator_rejects_mixed_block_lengths() -> None:
+    rng = np.random.default_rng(3)
+    accumulator = MonteCarloAccumulator.from_batch(_batch(rng, 2))
+
+    with pytest.raises(ValueError):
+        accumulator.merge(MonteCarloAccumulator(block_length=15, trials=1))
+
+
+def test_empty_accumulator_rejects_another_block_length() -> None:
+    rng = np.random.default_rng(4)
+    filled = MonteCarloAccumulator.from_batch(_batch(rng, 2))
+    empty = MonteCarloAccumulator(block_length=filled.block_length + 1)
+
+    with pytest.raises(ValueError):
+        empty.merge(filled)
+    with pytest.raises(ValueError):
+        filled.merge(empty)
+
+
+def test_multi_block_batches_count_frames_per_trial_and_blocks_per_block() -> None:
+    alice = np.zeros((5, 7), dtype=np.uint8)
+    bob = alice.copy()
+    bob[[1, 2, 4], 0] = 1
+    batch = TrialBatch(
+        alice_bits=alice,
+        bob_bits=bob,
+        eve_bits=alice,
+        bob_reconciled_bits=bob,
+        eve_reconciled_bits=alice,
+        bob_success=np.ones(5, dtype=bool),
+        eve_success=np.ones(5, dtype=bool),
+        retention_rates=np.full(2, 0.8),
+        alice_bob_observation_correlations=np.zeros(2),
+        alice_eve_observation_correlations=np.zeros(2),
+        source_length=14,
+        block_trials=np.array([0, 0, 0, 1, 1]),
+    )
+
+    result = MonteCarloAccumulator.from_batch(batch).finalize(seed=0)
+
+    assert result.trials == 2
+    assert result.mean_blocks_per_trial == 2.5
+    assert result.bob_frame_error_rate == 1.0
+    assert result.bob_block_error_rate == 0.6
+    assert result.bob_reconciled_mismatch_rate == pytest.approx(3 / 35)
+    assert result.key_bits_per_sample == pytest.approx(35 / 28)
@@ -0,0 +1,85 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.radio.channels.rayleigh import sample_rayleigh_channel
+from plkg.simulation.planning import (
+    default_window_samples,
+    plan_samples,
+    plan_scenario_samples,
+    rayleigh_retention_rate,
+    retention_probability,
+)
+from plkg.simulation.scenario import CsiScenario, RssiScenario
+
+
+def test_rayleigh_retention_matches_the_quantizer() -> None:
+    amplitudes = np.abs(
+        sample_rayleigh_channel(1.0, (200, 500), np.random.default_rng(1))
+    )
+    quantized = MedianGuardBandQuantizer(0.5).prepare_batch(amplitudes, 1)
+
+    assert np.mean(quantized.retention_rates) == pytest.approx(
+        rayleigh_retention_rate(0.5),
+        abs=0.01,
+    )
+
+
+def test_planned_windows_usually_retain_a_block() -> None:
+    plan = plan_samples(127, rayleigh_retention_rate(0.7), confidence=0.99)
+    amplitudes = np.abs(
+        sample_rayleigh_channel(
+            1.0, (2_000, plan.window_samples), np.random.default_rng(2)
+        )
+    )
+    quantized = MedianGuardBandQuantizer(0.7).prepare_batch(amplitudes, 127)
+
+    assert plan.window_samples < 3 * 127
+    assert plan.top_up_samples < plan.window_samples
+    assert len(quantized.source_rows) / 2_000 > 0.97
+
+
+def test_rssi_plan_accounts_for_the_level_lattice() -> None:
+    plan = plan_scenario_samples(RssiScenario(guard_band_sigma=0.5), 127)
+
+    assert 0 < plan.retention_rate < 1
+    assert plan.window_samples * plan.retention_rate > 127
+
+
+def test_plan_rejects_invalid_confidence() -> None:
+    with pytest.raises(ValueError, match="confidence"):
+        plan_samples(127, 0.5, confidence=1.0)
+
+
+def test_default_windows_follow_the_plan_or_the_guard_band() -> None:
+    plan = plan_samples(127, 0.5)
+
+    assert default_window_samples(127, 0.0) == 127
+    assert default_window_samples(127, 0.5) == 3 * 127
+    assert default_window_samples(127, 0.5, bits_per_sample=2) == 3 * 64
+    assert default_window_samples(127, 0.5, plan) == plan.window_samples
+
+
+def test_scenario_plans_are_calibrated_on_pilot_windows() -> None:
+    iid = CsiScenario(guard_band_sigma=0.8)
+    noisy, faded = (
+        plan_scenario_samples(replace(iid, **change), 127)
+        for change in ({"relative_estimation_error": 0.3}, {"doppler_hz": 5.0})
+    )
+
+    assert noisy.retention_rate < rayleigh_retention_rate(0.8) - 0.02
+    assert faded.dispersion > 2
+    assert faded.window_samples > plan_scenario_samples(iid, 127).window_samples
+
+
+def test_dispersed_plans_need_more_samples() -> None:
+    binomial = plan_samples(127, 0.4)
+    dispersed = plan_samples(127, 0.4, dispersion=4.0)
+
+    assert plan_samples(127, 0.4, dispersion=1.0) == binomial
+    assert dispersed.window_samples > binomial.window_samples
+    assert dispersed.top_up_samples > binomial.top_up_samples
+    assert retention_probability(binomial, binomial.window_samples) >= 0.99
+    assert retention_probability(dispersed, binomial.window_samples) < 0.99
@@ -17,6 +17,46 @@ def test_toeplitz_hash_is_reproducible_and_has_requested_length() -> None:
     assert len(first) == 32
 
 
+def test_toeplitz_hash_matches_the_dense_matrix_product() -> None:
+    amplifier = ToeplitzHashAmplifier()
+    rng = np.random.default_rng(43)
+    source = rng.integers(0, 2, 139, dtype=np.uint8)
+    seed = amplifier.generate_seed(139, 70, rng)
+    indices = np.arange(139)[None, :] - np.arange(70)[:, None] + 69
+
+    expected = (seed[indices].astype(np.int64) @ source) % 2
+
+    np.testing.assert_array_equal(amplifier.extract(source, 70, seed), expected)
+    np.testing.assert_array_equal(
+        ToeplitzHashAmplifier(dense_max_entries=0).extract(source, 70, seed),
+        expected,
+    )
+
+
+def test_batched_extraction_matches_key_by_key_extraction() -> None:
+    rng = np.random.default_rng(44)
+    keys = rng.integers(0, 2, (4, 127), dtype=np.uint8)
+    for amplifier in (
+        ToeplitzHashAmplifier(),
+        ToeplitzHashAmplifier(dense_max_entries=0),
+    ):
+        shared_seed = amplifier.generate_seed(127, 60, rng)
+        seeds = amplifier.generate_seeds(4, 127, 60, rng)
+
+        shared = amplifier.extract_many(keys, 60, shared_seed)
+        separate = amplifier.extract_with_seeds(keys, 60, seeds)
+
+        for row, key in enumerate(keys):
+            np.testing.assert_array_equal(
+                shared[row],
+                amplifier.extract(key, 60, shared_seed),
+            )
+            np.testing.assert_array_equal(
+                separate[row],
+                amplifier.extract(key, 60, seeds[row]),
+            )
+
+
 def test_toeplitz_hash_does_not_expand_the_source() -> None:
     with pytest.raises(ValueError):
         ToeplitzHashAmplifier().seed_length(16, 17)
@@ -1,7 +1,17 @@
 import numpy as np
+import pytest
 
 from plkg.core.models import FeatureSeries
-from plkg.protocol.quantization import MedianGuardBandQuantizer
+from plkg.protocol.quantization import (
+    MedianGuardBandQuantizer,
+    MultiLevelQuantizer,
+    SlidingMedianQuantizer,
+    SlidingWindowStatistics,
+)
+from plkg.radio.measurements.rssi import rssi_levels_dbm
+from plkg.radio.profiles import get_profile
+from plkg.simulation import RssiScenario
+from plkg.simulation.scenario import sample_observer_channels
 
 
 def test_observers_use_reference_threshold_and_indices() -> None:
@@ -22,3 +32,136 @@ def test_guard_band_reduces_retention() -> None:
     with_guard = MedianGuardBandQuantizer(0.5).prepare(features)
 
     assert with_guard.retention_rate < without_guard.retention_rate
+
+
+def test_batch_quantization_matches_row_by_row_quantization() -> None:
+    rng = np.random.default_rng(4)
+    values = rng.rayleigh(1.0, (6, 40))
+    quantizer = MedianGuardBandQuantizer(0.8)
+
+    batch = quantizer.prepare_batch(values, 17)
+
+    for result_row, source_row in enumerate(batch.source_rows):
+        prepared = quantizer.prepare(FeatureSeries(values[source_row], "test"))
+        np.testing.assert_array_equal(batch.bits[result_row], prepared.bits[:17])
+        np.testing.assert_array_equal(
+            batch.metadata.accepted_indices[result_row],
+            prepared.metadata.accepted_indices[:17],
+        )
+        assert batch.retention_rates[result_row] == prepared.retention_rate
+    assert 0 < len(batch.source_rows) < len(values)
+
+
+def test_multi_level_quantizer_emits_equiprobable_gray_codes() -> None:
+    rng = np.random.default_rng(7)
+    values = rng.rayleigh(1.0, (5, 96))
+    noisy = values + 0.02 * rng.normal(size=values.shape)
+    quantizer = MultiLevelQuantizer(3, guard_band_sigma=0.1)
+
+    batch = quantizer.prepare_batch(values, 31)
+    bob_bits = quantizer.apply_batch(noisy[batch.source_rows], batch.metadata)
+
+    assert batch.metadata.level_thresholds.shape == (len(batch.source_rows), 7)
+    for result_row, source_row in enumerate(batch.source_rows):
+        prepared = quantizer.prepare(FeatureSeries(values[source_row], "test"))
+        np.testing.assert_array_equal(batch.bits[result_row], prepared.bits[:31])
+        assert batch.retention_rates[result_row] == prepared.retention_rate
+        np.testing.assert_array_equal(
+            quantizer.apply(
+                FeatureSeries(noisy[source_row], "test"),
+                batch.metadata.row(result_row),
+            ),
+            bob_bits[result_row],
+        )
+    # Without a guard band all eight levels hold 96 / 8 samples each, and
+    # codes of adjacent levels differ in exactly one bit.
+    prepared = MultiLevelQuantizer(3).prepare(FeatureSeries(values[0], "test"))
+    codes = prepared.bits.reshape(-1, 3) @ np.array([4, 2, 1])
+    np.testing.assert_array_equal(np.bincount(codes, minlength=8), np.full(8, 12))
+    order = codes[np.argsort(values[0])]
+    changes = np.unique(order, return_index=True)[1]
+    gray = order[np.sort(changes)]
+    assert all(bin(a ^ b).count("1") == 1 for a, b in zip(gray, gray[1:], strict=False))
+    assert np.mean(bob_bits != batch.bits) < 0.1
+
+
+def test_one_bit_multi_level_quantizer_is_the_median_quantizer() -> None:
+    values = np.random.default_rng(8).rayleigh(1.0, (6, 40))
+
+    multi_level = MultiLevelQuantizer(1, 0.8).prepare_batch(values, 17)
+    median = MedianGuardBandQuantizer(0.8).prepare_batch(values, 17)
+
+    np.testing.assert_array_equal(multi_level.bits, median.bits)
+    np.testing.assert_array_equal(multi_level.source_rows, median.source_rows)
+    np.testing.assert_allclose(
+        multi_level.metadata.guard_band_widths,
+        median.metadata.guard_band_widths,
+    )
+
+
+def test_sliding_window_statistics_match_numpy() -> None:
+    rng = np.random.default_rng(5)
+    # Rounded values with a trend exercise ties and lazy deletions.
+    values = np.round(3 * rng.normal(size=600)) + np.linspace(0.0, 40.0, 600)
+    for window in (1, 4, 25):
+        statistics = SlidingWindowStatistics(window)
+        for index, value in enumerate(values):
+            statistics.push(value)
+            recent = values[max(0, index - window + 1) : index + 1]
+            assert statistics.median == np.median(recent)
+            assert statistics.std == pytest.approx(np.std(recent), abs=1e-9)
+
+
+def test_streaming_blocks_share_the_batch_metadata_contract() -> None:
+    rng = np.random.default_rng(6)
+    profile = get_profile("iot_wearable")
+    channels = sample_observer_channels(
+        RssiScenario(alice_bob_correlation=profile.alice_bob_correlation),
+        4_000,
+        rng,
+    )
+    alice, bob, _ = (
+        rssi_levels_dbm(
+            channel,
+            profile.rssi_reference_power_dbm,
+            profile.rssi_noise_std_db,
+            profile.rssi_resolution_db,
+            rng,
+        )
+        for channel in channels
+    )
+    quantizer = SlidingMedianQuantizer(64, 31, guard_band_sigma=0.3)
+
+    blocks = [
+        block
+        for chunk in np.array_split(alice, 7)
+        for block in quantizer.extend(chunk)
+    ]
+
+    assert blocks[0].start == 64
+    assert all(
+        previous.stop == block.start
+        for previous, block in zip(blocks, blocks[1:], strict=False)
+    )
+    for block in blocks:
+        window = alice[block.start - 64 : block.start]
+        assert block.metadata.threshold == np.median(window)
+        assert block.metadata.guard_band_width == pytest.approx(0.3 * np.std(window))
+        segment = FeatureSeries(alice[block.start : block.stop], "rssi_level")
+        np.testing.assert_array_equal(
+            quantizer.apply(segment, block.metadata),
+            block.bits,
+        )
+    assert len(quantizer.pending_bits) < 31
+    assert len(quantizer.pending_bits) == len(quantizer.pending_indices)
+    bob_bits = np.concatenate(
+        [
+            quantizer.apply(
+                FeatureSeries(bob[block.start : block.stop], "rssi_level"),
+                block.metadata,
+            )
+            for block in blocks
+        ]
+    )
+    alice_bits = np.concatenate([block.bits for block in blocks])
+    assert np.mean(alice_bits != bob_bits) < 0.25
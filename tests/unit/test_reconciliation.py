@@ -1,8 +1,11 @@
+from pathlib import Path
+
 import numpy as np
 
 from plkg.protocol.reconciliation import (
     BchCodeOffsetReconciler,
     create_bch_codec,
+    load_bch_codec,
 )
 
 
@@ -35,3 +38,63 @@ def test_code_offset_transcript_is_reusable_by_any_observer() -> None:
     np.testing.assert_array_equal(bob_result.bits, alice)
     np.testing.assert_array_equal(eve_result.bits, alice)
     assert transcript.leakage_bits == 3
+
+
+def test_batched_reconciliation_matches_block_by_block_decoding() -> None:
+    rng = np.random.default_rng(11)
+    reconciler = BchCodeOffsetReconciler(create_bch_codec(15))
+    alice = rng.integers(0, 2, (6, 15), dtype=np.uint8)
+    bob = alice.copy()
+    for row, errors in enumerate([0, 1, 2, 3, 4, 5]):
+        bob[row, rng.choice(15, errors, replace=False)] ^= 1
+
+    transcript = reconciler.create_transcripts(alice, rng)
+    result = reconciler.reconcile_many(bob, transcript)
+
+    np.testing.assert_array_equal(result.success[:3], [True, True, True])
+    np.testing.assert_array_equal(result.corrected_errors[:3], [0, 1, 2])
+    np.testing.assert_array_equal(result.bits[:3], alice[:3])
+    for row in range(len(alice)):
+        single = reconciler.reconcile(bob[row], transcript.row(row))
+        expected = result.row(row)
+        np.testing.assert_array_equal(single.bits, expected.bits)
+        assert single.success == expected.success
+        assert single.corrected_errors == expected.corrected_errors
+
+
+def test_syndrome_table_decoder_agrees_with_galois() -> None:
+    rng = np.random.default_rng(12)
+    table = create_bch_codec(15)
+    algebraic = load_bch_codec(15, syndrome_table_budget=0)
+    codewords = table.encode_many(rng.integers(0, 2, (500, 7), dtype=np.uint8))
+    received = codewords ^ (rng.random(codewords.shape) < 0.15).astype(np.uint8)
+
+    assert table.decoder == "syndrome_table"
+    assert algebraic.decoder == "galois"
+    assert create_bch_codec(127).decoder == "galois"
+    for expected, actual in zip(
+        algebraic.decode_many(received),
+        table.decode_many(received),
+        strict=True,
+    ):
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_bch_codecs_are_memoized_per_process() -> None:
+    assert create_bch_codec(15) is create_bch_codec(15, 7)
+    assert create_bch_codec(15) is not create_bch_codec(7)
+
+
+def test_cached_bch_tables_rebuild_an_equivalent_codec(tmp_path: Path) -> None:
+    built = load_bch_codec(15, cache_dir=tmp_path)
+    loaded = load_bch_codec(15, cache_dir=tmp_path)
+    message = np.array([0, 1, 1, 0, 1, 0, 0], dtype=np.uint8)
+
+    np.testing.assert_array_equal(
+        loaded.tables.parity_check_matrix,
+        built.tables.parity_check_matrix,
+    )
+    np.testing.assert_array_equal(loaded.encode(message), built.code.encode(message))
+    corrupted = loaded.encode(message)
+    corrupted[3] ^= 1
+    assert loaded.decode_codeword(corrupted)[1] == 1